@@ -0,0 +1,41 @@
+"""
+Streamlit app rendered by bench_browser.py. The table size and options are
+read from the query string, e.g. ?rows=10000&multi=1&styled=1&virtualize=0&budget=8.
+"""
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+ROOT_DIRECTORY = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(ROOT_DIRECTORY))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from clickable_table import clickable_table  # noqa: E402
+
+from bench_data import chart_config, make_frame, style_dataframe  # noqa: E402
+
+
+@st.cache_data
+def _frame(rows, multi_index):
+    return make_frame(rows, multi_index=multi_index)
+
+
+st.set_page_config(layout="wide")
+
+params = st.query_params
+rows = int(params.get("rows", 1000))
+multi_index = params.get("multi", "0") == "1"
+styled = params.get("styled", "1") == "1"
+virtualize = params.get("virtualize", "0") == "1"
+budget = float(params.get("budget", 0)) or None
+
+clickable_table(
+    df=_frame(rows, multi_index),
+    styling_function=style_dataframe if styled else None,
+    virtualize_rows=virtualize,
+    decoration_budget_ms=budget,
+    max_height="800px",
+    key="bench",
+    **chart_config(),
+)
@@ -0,0 +1,159 @@
+"""
+Headless-browser benchmark of the clickable_table frontend.
+
+Starts bench_app.py with the e2e StreamlitRunner and loads it in headless
+Chromium for each table size. For every run it records:
+
+- time_to_table_ms: wall-clock time from navigation until the table rows are
+  painted in the component iframe (includes the Python side of the rerun)
+- decorate_ms: duration of applyStylesToPercentageCells, read from the
+  'clickable_table:decorate' performance measure of the frontend (with
+  --budget, until the last decoration chunk has run)
+- dom_nodes: element count of the component document
+- js_heap_bytes: used JS heap of the page after decoration
+
+Requires the devel extras (pip install -e .[devel]; playwright install chromium)
+and a built frontend (npm run build in clickable_table/frontend).
+
+Usage:
+    python benchmarks/bench_browser.py
+    python benchmarks/bench_browser.py --rows 1000 10000 --multi --output results/browser.json
+"""
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+ROOT_DIRECTORY = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(ROOT_DIRECTORY / "e2e"))
+
+from e2e_utils import StreamlitRunner  # noqa: E402
+
+BENCH_APP_FILE = Path(__file__).parent / "bench_app.py"
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "browser.json"
+COMPONENT_IFRAME = 'iframe[title="clickable_table\\.clickable_table"]'
+
+# Resolves after the next frame has been painted
+_NEXT_PAINT_JS = "() => new Promise(resolve => requestAnimationFrame(() => setTimeout(resolve, 0)))"
+_DECORATED_JS = "() => performance.getEntriesByName('clickable_table:decorate').length > 0"
+_DECORATE_MS_JS = """() => {
+    const entries = performance.getEntriesByName('clickable_table:decorate');
+    return entries.length ? entries[entries.length - 1].duration : null;
+}"""
+_DOM_NODES_JS = "() => document.getElementsByTagName('*').length"
+
+
+def _js_heap_bytes(cdp):
+    metrics = cdp.send("Performance.getMetrics")["metrics"]
+    return next((m["value"] for m in metrics if m["name"] == "JSHeapUsedSize"), None)
+
+
+def measure(browser, server_url, rows, multi_index, styled, virtualize, budget, timeout_ms):
+    """Load the app once in a fresh page and return the measurements."""
+    page = browser.new_page(viewport={"width": 1600, "height": 1000})
+    page.set_default_timeout(timeout_ms)
+    cdp = page.context.new_cdp_session(page)
+    cdp.send("Performance.enable")
+    try:
+        query = (f"?rows={rows}&multi={int(multi_index)}&styled={int(styled)}"
+                 f"&virtualize={int(virtualize)}&budget={budget or 0}")
+        start = time.perf_counter()
+        page.goto(server_url + query)
+        frame = page.wait_for_selector(COMPONENT_IFRAME).content_frame()
+        frame.wait_for_selector("table tbody tr")
+        frame.evaluate(_NEXT_PAINT_JS)
+        time_to_table_ms = (time.perf_counter() - start) * 1000
+
+        frame.wait_for_function(_DECORATED_JS)
+        frame.evaluate(_NEXT_PAINT_JS)
+        return {
+            'time_to_table_ms': time_to_table_ms,
+            'decorate_ms': frame.evaluate(_DECORATE_MS_JS),
+            'dom_nodes': frame.evaluate(_DOM_NODES_JS),
+            'js_heap_bytes': _js_heap_bytes(cdp),
+        }
+    finally:
+        page.close()
+
+
+def _summarize(runs):
+    summary = {}
+    for name in runs[0]:
+        values = [run[name] for run in runs if run[name] is not None]
+        summary[name] = statistics.median(values) if values else None
+    return summary
+
+
+def run(server_url, rows_list, multi_options, styled, virtualize, budget, repeat, timeout_ms):
+    results = []
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        try:
+            for rows in rows_list:
+                for multi_index in multi_options:
+                    runs = [
+                        measure(browser, server_url, rows, multi_index, styled, virtualize, budget, timeout_ms)
+                        for _ in range(repeat)
+                    ]
+                    result = {
+                        'rows': rows,
+                        'multi_index': multi_index,
+                        'styled': styled,
+                        'virtualize_rows': virtualize,
+                        'decoration_budget_ms': budget,
+                        **_summarize(runs),
+                        'runs': runs,
+                    }
+                    results.append(result)
+                    heap = result['js_heap_bytes']
+                    decorate = result['decorate_ms']
+                    print(
+                        f"{rows:>7} rows  {'multi ' if multi_index else 'single'}  "
+                        f"table {result['time_to_table_ms']:9.1f} ms  "
+                        f"decorate {decorate if decorate is not None else float('nan'):9.1f} ms  "
+                        f"{result['dom_nodes']:>9} nodes  "
+                        f"{heap / 1e6 if heap is not None else float('nan'):8.1f} MB heap"
+                    )
+        finally:
+            browser.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--multi', action='store_true', help="Also measure MultiIndex columns")
+    parser.add_argument('--unstyled', action='store_true', help="Skip the example styling function")
+    parser.add_argument('--virtualize', action='store_true', help="Render with virtualize_rows=True")
+    parser.add_argument('--budget', type=float, default=None,
+                        help="Render with decoration_budget_ms set to this many milliseconds")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=600, help="Per-page timeout in seconds")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    multi_options = (False, True) if args.multi else (False,)
+    with StreamlitRunner(BENCH_APP_FILE) as runner:
+        results = run(
+            runner.server_url, args.rows, multi_options, not args.unstyled,
+            args.virtualize, args.budget, args.repeat, int(args.timeout * 1000),
+        )
+
+    environment = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps({'environment': environment, 'results': results}, indent=2))
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark tables shaped like the example app: numeric columns for data bars,
+range and fixed-scale charts, hidden source columns and two text columns.
+"""
+import numpy as np
+import pandas as pd
+
+
+def make_frame(rows, multi_index=False, seed=0):
+    """Return a rows x 16 DataFrame, optionally with two-level MultiIndex columns."""
+    rng = np.random.default_rng(seed)
+    data = {
+        'C 1': rng.integers(-2_000_000, 2_000_000, rows),
+        'C 2': rng.normal(0, 50, rows).round(1),
+        'C 3': rng.normal(0, 1.5, rows).round(3),
+        'C 3 Recommended': rng.normal(0, 1.5, rows).round(1),
+        'C 4': rng.uniform(0, 100, rows).round(1).astype(str),
+        'C 5': rng.choice(['Good', 'Excellent', '45.0', '62.5'], rows),
+        'Long Term High': rng.uniform(1.0, 1.4, rows).round(3),
+        'Long Term Low': rng.uniform(0.2, 0.4, rows).round(3),
+        'Short Term High': rng.uniform(0.9, 1.3, rows).round(3),
+        'Short Term Low': rng.uniform(0.5, 0.9, rows).round(3),
+        'Current': rng.uniform(0.2, 1.4, rows).round(3),
+        'Range Chart': [''] * rows,
+        'Dot1': rng.uniform(-1, 1, rows).round(2),
+        'Dot2': rng.uniform(-1, 1, rows).round(2),
+        'Dot3': rng.uniform(-1, 1, rows).round(2),
+        'Fixed Scale Chart': [''] * rows,
+    }
+    df = pd.DataFrame(data, index=pd.Index([f"R {i}" for i in range(rows)], name='Epoch'))
+    if multi_index:
+        groups = ['Values'] * 6 + ['Range'] * 6 + ['Fixed Scale'] * 4
+        df.columns = pd.MultiIndex.from_arrays([groups, df.columns])
+    return df
+
+
+def style_dataframe(df):
+    """The conditional formatting of the example app (Styler.map per cell)."""
+    def apply_conditional_formatting(val):
+        try:
+            val = float(val)
+            if val > 500:
+                color = "#FFC0CB"
+            elif val < -500:
+                color = "#90EE90"
+            else:
+                color = ''
+            return f'background-color: {color}'
+        except (ValueError, TypeError):
+            return None
+
+    styler = df.style
+    numeric_columns = df.select_dtypes(include=['number']).columns
+    if len(numeric_columns) > 0:
+        styler = styler.map(apply_conditional_formatting, subset=numeric_columns)
+    return styler
+
+
+def chart_config():
+    """
+    Chart keyword arguments for clickable_table() matching make_frame's columns,
+    as in the example app. Indices count the index column as cell 0.
+    """
+    return dict(
+        data_bar_columns=[
+            {'col_idx': 1, 'min': -2_000_000, 'max': 2_000_000},
+            {'col_idx': 3, 'min': -5, 'max': 5, 'recommended_idx': 4},
+        ],
+        david_hum_columns=[
+            {'col_idx': 5, 'min': 0, 'max': 100, 'exception_col_color': 'yellow'},
+            {'col_idx': 6, 'min': 0, 'max': 100, 'exception_col_color': 'lightblue'},
+        ],
+        range_chart=[{
+            'col_idx': 12,
+            'long_term_high_idx': 7,
+            'long_term_low_idx': 8,
+            'short_term_high_idx': 9,
+            'short_term_low_idx': 10,
+            'current_idx': 11,
+        }],
+        # Fixed-scale indices are shifted by the index column in the frontend
+        fixed_scale_range_chart=[{
+            'col_idx': 15, 'min': -1, 'max': 1,
+            'dot1_idx': 12, 'dot2_idx': 13, 'dot3_idx': 14,
+        }],
+        hidden_columns=[4, 7, 8, 9, 10, 13, 14, 15],
+    )
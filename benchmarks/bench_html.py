@@ -0,0 +1,107 @@
+"""
+Microbenchmarks for the HTML generation of clickable_table().
+
+Times the HTML that clickable_table() would send for tables of different
+sizes, with and without the example styling function, with single and
+MultiIndex columns, and for each html_writer. The cache is bypassed, so
+every run measures a cold render.
+
+Usage:
+    python benchmarks/bench_html.py
+    python benchmarks/bench_html.py --rows 1000 10000 --repeat 5 --output results/html.json
+"""
+import argparse
+import datetime
+import importlib.metadata
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIRECTORY = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(ROOT_DIRECTORY))
+
+from clickable_table import _generate_html  # noqa: E402
+
+from bench_data import make_frame, style_dataframe  # noqa: E402
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "html.json"
+
+
+def time_case(df, styling_function, html_writer, repeat):
+    """Return the run times in seconds and the HTML size of one case."""
+    times = []
+    html = ''
+    for _ in range(repeat):
+        start = time.perf_counter()
+        html, _ = _generate_html(df, styling_function, html_writer=html_writer)
+        times.append(time.perf_counter() - start)
+    return times, len(html.encode('utf-8'))
+
+
+def run(rows_list, repeat, writers):
+    results = []
+    for rows in rows_list:
+        for multi_index in (False, True):
+            df = make_frame(rows, multi_index=multi_index)
+            for styled in (False, True):
+                for html_writer in writers:
+                    times, html_bytes = time_case(df, style_dataframe if styled else None, html_writer, repeat)
+                    result = {
+                        'rows': rows,
+                        'columns': df.shape[1],
+                        'multi_index': multi_index,
+                        'styled': styled,
+                        'html_writer': html_writer,
+                        'min_s': min(times),
+                        'median_s': statistics.median(times),
+                        'html_bytes': html_bytes,
+                    }
+                    results.append(result)
+                    print(
+                        f"{rows:>7} rows  {'multi ' if multi_index else 'single'}  "
+                        f"{'styled  ' if styled else 'unstyled'}  {html_writer:<6}  "
+                        f"{result['min_s'] * 1000:9.1f} ms  {html_bytes / 1e6:7.2f} MB"
+                    )
+    return results
+
+
+def _package_version():
+    try:
+        return importlib.metadata.version('clickable_table')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def environment():
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'clickable_table': _package_version(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--writers', nargs='+', default=['pandas', 'fast'], choices=['pandas', 'fast'])
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.repeat, args.writers)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps({'environment': environment(), 'results': results}, indent=2))
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,43 @@
+import contextlib
+import inspect
+import json
 import os
 import streamlit.components.v1 as components
 import streamlit as st
 import pandas as pd
 
+from ._cache import HtmlCache, config_fingerprint, dataframe_fingerprint, function_fingerprint
+from ._compression import (COMPRESSION_FORMATS, compress_html, compression_disabled, disable_compression,
+                           is_decompress_failure, payload_metrics, record_payload)
+from ._diff import consume_resync, current_update, discard_update, is_resync_event, prepare_update, styler_uuid
+from ._geometry import compute_geometry
+from ._html import render_styler_html, render_table_html, styler_cells, table_cells
+from ._rules import evaluate_style_rules, style_sheet, validate_style_rules
+from ._reduction import kept_columns, reduce_hidden_columns
+from ._sorting import (PermutationCache, apply_view_event, current_view, empty_view, is_view_event, view_columns,
+                       view_positions)
+from ._pagination import current_page, is_page_event, page_bounds, rerun, set_page
+from ._timing import NULL_TIMER, TimingHooks, payload_size
+
 # Create a _RELEASE constant. We'll set this to False while we're developing
 # the component, and True when we're ready to package and distribute it.
 _RELEASE = True
 
+# Version of the component protocol implemented by the frontend sources. The
+# build copies frontend/public/protocol.json into frontend/build, so options
+# that need the current frontend are only enabled once the bundle is rebuilt.
+_FRONTEND_PROTOCOL = 2
+
+
+def _read_bundle_protocol(build_dir):
+    """Protocol version of a built bundle; 1 for bundles built before protocol.json existed."""
+    try:
+        with open(os.path.join(build_dir, "protocol.json"), encoding="utf-8") as f:
+            return int(json.load(f)["version"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return 1
+
+
 # Declare a Streamlit component. `declare_component` returns a function
 # that is used to create instances of the component.
 if not _RELEASE:
@@ -14,14 +45,537 @@ if not _RELEASE:
         "clickable_table",
         url="http://localhost:3001",
     )
+    # The development server serves the current sources
+    _bundle_protocol = _FRONTEND_PROTOCOL
 else:
     parent_dir = os.path.dirname(os.path.abspath(__file__))
     build_dir = os.path.join(parent_dir, "frontend/build")
     _component_func = components.declare_component("clickable_table", path=build_dir)
+    _bundle_protocol = _read_bundle_protocol(build_dir)
+
+_REBUILD_HINT = "Rebuild it with npm run build in clickable_table/frontend."
+
+# Last click value seen per table when clickable_tables() falls back to one
+# component per table for bundles older than protocol version 2
+_SEPARATE_CLICKS_STATE_PREFIX = "_clickable_table_separate_clicks::"
+
+# Process-wide cache of generated table HTML, shared by all sessions.
+# Inspect html_cache.hits / html_cache.misses, or tune html_cache.max_bytes.
+html_cache = HtmlCache()
+
+# Process-wide cache of sort permutations used by sortable tables.
+sort_cache = PermutationCache()
+
+# Process-wide server-side timing. Set timing_hooks.callback (and optionally
+# timing_hooks.sample_rate), or enable DEBUG on the "clickable_table" logger.
+timing_hooks = TimingHooks()
+
+
+def _apply_rule_classes(styler, df, rule_classes, rule_css):
+    """Attach style rule classes to a Styler for the pandas writer."""
+    styler.set_td_classes(pd.DataFrame(rule_classes, index=df.index, columns=df.columns))
+    styler.set_table_styles(
+        [{'selector': selector, 'props': declarations} for selector, declarations in rule_css],
+        overwrite=False,
+    )
+    return styler
+
+
+def _frontend_options(payload, virtualize_rows, virtualize_columns, page_size, precompute_geometry, geometry_worker,
+                      diff_updates, compression, drop_hidden_columns, debug_metrics, sortable, filterable,
+                      decoration_budget_ms, charts):
+    """Names of the requested options that the frontend only supports from protocol version 2."""
+    requested = [
+        ('payload="arrow"', payload == "arrow"),
+        ('virtualize_rows', virtualize_rows),
+        ('virtualize_columns', virtualize_columns),
+        ('page_size', page_size is not None),
+        ('precompute_geometry', precompute_geometry),
+        ('geometry_worker', geometry_worker),
+        ('diff_updates', diff_updates),
+        ('compression', compression is not None),
+        ('drop_hidden_columns', drop_hidden_columns),
+        ('debug_metrics', debug_metrics),
+        ('sortable', sortable),
+        ('filterable', filterable),
+        ('decoration_budget_ms', decoration_budget_ms is not None),
+        ("renderer='canvas'", any(chart.get('renderer') == "canvas" for chart in charts)),
+        ("tick_axis='header'", any(chart.get('tick_axis') == "header" for chart in charts)),
+    ]
+    return [name for name, used in requested if used]
+
+
+def _protocol_1_charts(chart_configs):
+    """Chart configs without the options that bundles older than protocol version 2 do not read."""
+    if not chart_configs:
+        return chart_configs
+    return [{option: value for option, value in chart.items() if option not in ('renderer', 'tick_axis')}
+            for chart in chart_configs]
+
+
+def _generate_html(df, styling_function, uuid=None, html_writer="pandas", style_rules=None, timer=NULL_TIMER):
+    """
+    Render the dataframe (optionally styled) to an HTML table string.
+
+    Returns a (html, cacheable) tuple. The fallback HTML produced when the
+    styling function or the style rules fail is not cacheable, so the warning
+    shows on every rerun.
+    A uuid, when given, replaces the random Styler uuid used in cell ids.
+    With html_writer="fast" the table is written by render_table_html, falling
+    back to Styler.to_html() for Styler features it does not support.
+    style_rules are evaluated into CSS classes and added to either writer.
+    The styling function call is timed as the 'styling_function' stage of timer.
+    """
+    rule_classes, rule_css = None, []
+    if style_rules:
+        try:
+            rule_classes, rule_css = evaluate_style_rules(df, style_rules)
+        except Exception as e:
+            st.warning(f"style_rules failed: {e}. Rendering the table without them.")
+            return _generate_html(df, styling_function, uuid, html_writer, None, timer)[0], False
+
+    if styling_function is not None:
+        try:
+            with timer.stage('styling_function'):
+                styled_df = styling_function(df)
+            if style_rules and not hasattr(styled_df, 'ctx'):
+                styled_df = styled_df.style
+            if uuid is not None and hasattr(styled_df, 'set_uuid'):
+                styled_df.set_uuid(uuid)
+            if html_writer == "fast" and hasattr(styled_df, 'ctx'):
+                table_id = f"T_{uuid if uuid is not None else styled_df.uuid}"
+                html = render_styler_html(styled_df, uuid, rule_classes, style_sheet(rule_css, table_id))
+                if html is not None:
+                    return html, True
+            if style_rules:
+                styled_df = _apply_rule_classes(styled_df, df, rule_classes, rule_css)
+            # Generate HTML from styled dataframe
+            return styled_df.to_html(), True
+        except Exception as e:
+            st.warning(f"Styling function failed: {e}. Using unstyled table.")
+            return df.to_html(), False
+    # Generate HTML from unstyled dataframe
+    if html_writer == "fast":
+        table_id = f"T_{uuid}" if uuid is not None else None
+        return render_table_html(df, classes=rule_classes, css=style_sheet(rule_css, table_id), table_id=table_id), True
+    if style_rules:
+        styler = df.style
+        if uuid is not None:
+            styler.set_uuid(uuid)
+        return _apply_rule_classes(styler, df, rule_classes, rule_css).to_html(), True
+    return df.to_html(), True
+
+
+def _generate_cells(df, styling_function, uuid, style_rules=None, timer=NULL_TIMER):
+    """
+    Describe the dataframe (optionally styled) as table cells for diff mode.
+
+    Returns a (cells, html, cacheable) tuple, with cells as from table_cells
+    or styler_cells. When the Styler uses features the cell writer does not
+    cover, cells is None and html is the Styler.to_html() render instead.
+    A failing styling function or failing style rules are handled as in
+    _generate_html.
+    """
+    rule_classes, rule_css = None, []
+    if style_rules:
+        try:
+            rule_classes, rule_css = evaluate_style_rules(df, style_rules)
+        except Exception as e:
+            st.warning(f"style_rules failed: {e}. Rendering the table without them.")
+            cells, html, _ = _generate_cells(df, styling_function, uuid, None, timer)
+            return cells, html, False
+
+    table_id = f"T_{uuid}"
+    css = style_sheet(rule_css, table_id)
+    if styling_function is not None:
+        try:
+            with timer.stage('styling_function'):
+                styled_df = styling_function(df)
+            if not hasattr(styled_df, 'ctx'):
+                styled_df = styled_df.style
+            styled_df.set_uuid(uuid)
+            cells = styler_cells(styled_df, uuid, rule_classes, css)
+            if cells is not None:
+                return cells, None, True
+            if style_rules:
+                styled_df = _apply_rule_classes(styled_df, df, rule_classes, rule_css)
+            return None, styled_df.to_html(), True
+        except Exception as e:
+            st.warning(f"Styling function failed: {e}. Using unstyled table.")
+            return table_cells(df, table_id=table_id), None, False
+    return table_cells(df, rule_classes, css, table_id), None, True
+
 
-def clickable_table(df=None, styling_function=None, data_bar_columns=None, david_hum_columns=None, 
-                   range_chart=None, fixed_scale_range_chart=None, idx_col_name=None, column_width=None, max_height="800px", 
-                   hidden_column_class="hide-column", hidden_columns=None, bar_rounded=True, key=None):
+def _prepare_table(
+    df,
+    styling_function,
+    data_bar_columns,
+    david_hum_columns,
+    range_chart,
+    fixed_scale_range_chart,
+    idx_col_name,
+    column_width,
+    max_height,
+    hidden_column_class,
+    hidden_columns,
+    bar_rounded,
+    cache,
+    payload,
+    virtualize_rows,
+    virtualize_columns,
+    pinned_columns,
+    page_size,
+    precompute_geometry,
+    geometry_worker,
+    diff_updates,
+    html_writer,
+    style_rules,
+    compression,
+    drop_hidden_columns,
+    debug_metrics,
+    sortable,
+    filterable,
+    sort_mode,
+    decoration_budget_ms,
+    key,
+    shared=False,
+):
+    """
+    Validate the options of one table and build its component arguments.
+
+    Takes the parameters of clickable_table(). With shared=True the table is
+    rendered next to others in one component, so its style rules are scoped
+    to its own table id. Returns None after reporting an invalid option,
+    otherwise a dict with the component 'args', the call's 'timer' and the
+    state needed to handle the component value.
+    """
+    if df is None:
+        st.error("DataFrame is required for clickable_table")
+        return None
+
+    if payload not in ("html", "arrow"):
+        st.error(f"Unknown payload '{payload}'. Expected 'html' or 'arrow'.")
+        return None
+
+    if compression is not None and compression not in COMPRESSION_FORMATS:
+        st.error(f"Unknown compression '{compression}'. Expected 'gzip' or 'deflate'.")
+        return None
+
+    if html_writer not in ("pandas", "fast"):
+        st.error(f"Unknown html_writer '{html_writer}'. Expected 'pandas' or 'fast'.")
+        return None
+
+    if style_rules is not None:
+        # Rules name columns of the rendered table, which lacks dropped hidden columns
+        render_columns = df.columns[kept_columns(df, hidden_columns or [])] if drop_hidden_columns else df.columns
+        rules_error = validate_style_rules(style_rules, render_columns)
+        if rules_error is not None:
+            st.error(rules_error)
+            return None
+
+    if sort_mode not in ("server", "client"):
+        st.error(f"Unknown sort_mode '{sort_mode}'. Expected 'server' or 'client'.")
+        return None
+
+    if page_size is not None and (not isinstance(page_size, int) or isinstance(page_size, bool) or page_size <= 0):
+        st.error("page_size must be a positive integer")
+        return None
+
+    if decoration_budget_ms is not None and not decoration_budget_ms > 0:
+        st.error("decoration_budget_ms must be a positive number of milliseconds")
+        return None
+
+    if not isinstance(pinned_columns, int) or pinned_columns < 0:
+        st.error("pinned_columns must be a non-negative integer")
+        return None
+
+    charts = [chart for chart_configs in (data_bar_columns, david_hum_columns, range_chart, fixed_scale_range_chart)
+              for chart in chart_configs or []]
+    for chart in charts:
+        renderer = chart.get('renderer', 'dom')
+        if renderer not in ("dom", "canvas"):
+            st.error(f"Unknown renderer '{renderer}'. Expected 'dom' or 'canvas'.")
+            return None
+
+    if _bundle_protocol < _FRONTEND_PROTOCOL:
+        unsupported = _frontend_options(payload, virtualize_rows, virtualize_columns, page_size, precompute_geometry,
+                                        geometry_worker, diff_updates, compression, drop_hidden_columns,
+                                        debug_metrics, sortable, filterable, decoration_budget_ms, charts)
+        if unsupported:
+            st.warning(f"The installed frontend bundle predates {', '.join(unsupported)}; "
+                       f"rendering the table without them. {_REBUILD_HINT}")
+            payload, page_size, compression, decoration_budget_ms = "html", None, None, None
+            virtualize_rows = virtualize_columns = precompute_geometry = geometry_worker = False
+            diff_updates = drop_hidden_columns = debug_metrics = sortable = filterable = False
+            data_bar_columns, david_hum_columns, range_chart, fixed_scale_range_chart = (
+                _protocol_1_charts(chart_configs)
+                for chart_configs in (data_bar_columns, david_hum_columns, range_chart, fixed_scale_range_chart)
+            )
+
+    # Started after validation, so every started timer is finished and reported
+    timer = timing_hooks.start(key)
+
+    # Sorting and filtering: the view is computed on the full dataframe
+    view = None
+    positions = None
+    if sortable or filterable:
+        with timer.stage('sort_filter'):
+            # In client mode the browser sorts and filters the rendered rows
+            view_state, view_changed = current_view(key) if sort_mode == "server" else (empty_view(), False)
+            if view_changed and page_size is not None:
+                set_page(key, 0)
+            positions = view_positions(df, view_state, dataframe_fingerprint(df) if view_state['sort'] else None,
+                                       sort_cache)
+            view = {
+                **view_state,
+                'columns': view_columns(df, kept_columns(df, hidden_columns or []) if drop_hidden_columns
+                                        else list(range(df.shape[1]))),
+                'total_rows': len(df),
+                'rows': len(df) if positions is None else len(positions),
+            }
+            if positions is not None:
+                df = df.take(positions)
+
+    # Server-side pagination: only the current page slice is serialized
+    page = None
+    table_df = df
+    if page_size is not None:
+        page = page_bounds(current_page(key), page_size, len(df))
+        table_df = df.iloc[page['start']:page['end']]
+
+    # Clicked rows are reported as positions in the dataframe passed in
+    row_positions = None
+    if positions is not None:
+        row_positions = (positions[page['start']:page['end']] if page is not None else positions).tolist()
+
+    with timer.stage('config'):
+        # Resolve idx_col_name: handle MultiIndex row index where name could be a tuple
+        resolved_idx_col_name = idx_col_name
+        if resolved_idx_col_name is None:
+            index_name = df.index.name
+            if index_name is not None:
+                resolved_idx_col_name = str(index_name)
+            else:
+                resolved_idx_col_name = ""
+
+        # Build the configuration object
+        config = {
+            'data_bar_chart_columns': data_bar_columns or [],
+            'david_hum_columns': david_hum_columns or [],
+            'idx_col_name': resolved_idx_col_name,
+            'column_width': column_width or [],
+            'range_chart': range_chart or [],
+            'fixed_scale_range_chart': fixed_scale_range_chart or [],
+            'hidden_column_class': hidden_column_class,
+            'hidden_columns': hidden_columns or [],
+            'bar_rounded': bar_rounded,
+            'virtualize_rows': virtualize_rows,
+            'virtualize_columns': virtualize_columns,
+            'pinned_columns': pinned_columns,
+            'sortable': sortable,
+            'filterable': filterable,
+            'sort_mode': sort_mode
+        }
+
+        # Dropped hidden columns: render the narrower table, charts read the side channel
+        render_df, render_config, side_columns = table_df, config, None
+        if drop_hidden_columns:
+            render_df, render_config, side_columns = reduce_hidden_columns(table_df, config)
+
+    # Diff mode: send a patch against the previous render of this key
+    diff_key = None
+    if diff_updates:
+        if payload != "html":
+            st.warning("diff_updates is ignored when payload='arrow'.")
+        elif key is None:
+            st.warning("diff_updates requires a key; sending the full table.")
+        else:
+            diff_key = key
+
+    cache_key = None
+    cache_hit = False
+    diff = None
+    if payload == "arrow":
+        # The DataFrame is Arrow-serialized by Streamlit; no HTML is generated
+        if styling_function is not None:
+            st.warning("styling_function is not applied when payload='arrow'.")
+        html = ""
+        data = render_df
+    else:
+        data = None
+        # Diff mode needs a table id that stays the same across reruns
+        # Tables sharing one document need scoped style rules as well
+        uuid = styler_uuid(key) if (diff_updates or shared) and key is not None else None
+        # Identify the table content, so unchanged data reuses the last result
+        content_key = None
+        if cache:
+            df_fingerprint = dataframe_fingerprint(render_df)
+            styling_fingerprint = function_fingerprint(styling_function)
+            # A styling function that cannot be fingerprinted is rendered every time
+            if df_fingerprint is not None and (styling_function is None or styling_fingerprint is not None):
+                content_key = (df_fingerprint, styling_fingerprint, config_fingerprint(render_config), uuid,
+                               html_writer, config_fingerprint(style_rules))
+
+        if diff_key is not None:
+            consume_resync(key)
+            # Side channel values are not part of the table, so a change forces a full render
+            diff_config = config_fingerprint([render_config, side_columns])
+            html = None
+            diff = current_update(key, content_key, diff_config)
+            cache_hit = diff is not None
+            if diff is None:
+                with timer.stage('html'):
+                    cells, html, cacheable = _generate_cells(render_df, styling_function, uuid, style_rules, timer)
+                with timer.stage('diff'):
+                    if cells is None:
+                        # Styler features the cell writer does not cover: always send the full table
+                        discard_update(key)
+                    else:
+                        html, diff = prepare_update(key, cells, diff_config, content_key if cacheable else None)
+        else:
+            # Generate the table HTML, reusing the cached copy when nothing changed
+            cache_key = content_key
+            html = html_cache.get(cache_key) if cache_key is not None else None
+            cache_hit = html is not None
+            if html is None:
+                with timer.stage('html'):
+                    html, cacheable = _generate_html(render_df, styling_function, uuid, html_writer, style_rules,
+                                                     timer)
+                if cache_key is not None and cacheable:
+                    html_cache.put(cache_key, html)
+
+    # Payload sizes are only recorded when they are asked for
+    record_metrics = payload == "html" and (compression is not None or debug_metrics)
+    if compression is not None and compression_disabled(key):
+        # The browser could not inflate an earlier payload
+        compression = None
+
+    # Compressed html replaces the plain string; patches are sent as they are
+    html_compressed = None
+    if compression is not None and html:
+        compressed_key = cache_key + (compression,) if cache_key is not None else None
+        html_compressed = html_cache.get(compressed_key) if compressed_key is not None else None
+        if html_compressed is None:
+            with timer.stage('compression'):
+                html_compressed = compress_html(html, compression)
+            if compressed_key is not None:
+                html_cache.put(compressed_key, html_compressed)
+    if record_metrics and html is not None:
+        record_payload(key, html, html_compressed, compression if html_compressed is not None else None)
+    if html_compressed is not None:
+        html = None
+
+    # Chart geometry is computed once per table instead of per cell in the browser
+    geometry = None
+    if precompute_geometry:
+        with timer.stage('geometry'):
+            geometry = compute_geometry(table_df, config)
+
+    if timer.enabled:
+        timer.info.update(
+            rows=render_df.shape[0],
+            columns=render_df.shape[1],
+            payload=payload,
+            payload_bytes=None if payload == "arrow" else payload_size(html, html_compressed, diff),
+            cache_hit=cache_hit,
+        )
+
+    return {
+        'key': key,
+        'timer': timer,
+        'page': page,
+        'page_size': page_size,
+        'rows': len(df),
+        'args': {
+            'html': html,
+            'html_compressed': html_compressed,
+            'compression': compression,
+            'data': data,
+            'payload': payload,
+            'page': page,
+            'geometry': geometry,
+            'geometry_worker': geometry_worker,
+            'diff': diff,
+            'side_columns': side_columns,
+            'debug_metrics': debug_metrics,
+            'decoration_budget_ms': decoration_budget_ms,
+            'view': view,
+            'row_positions': row_positions,
+            'config': render_config,
+            'max_height': max_height,
+        },
+    }
+
+
+def _table_value(table, component_value):
+    """
+    Handle the component value of a prepared table: page, sort and filter
+    requests are stored (with a rerun for keyless tables), and a cell click
+    is returned. Returns None for every other value.
+    """
+    key = table['key']
+    page = table['page']
+    page_size = table['page_size']
+    if is_page_event(component_value):
+        # Without a key the page request is only visible after rendering,
+        # so store it and rerun to serve the requested page
+        if page is not None:
+            requested = page_bounds(component_value.get('page', 0), page_size, table['rows'])['page']
+            if requested != page['page']:
+                set_page(key, requested)
+                rerun()
+        return None
+
+    if is_view_event(component_value):
+        # Keyless tables see the request only now: store it and rerun
+        if apply_view_event(key, component_value):
+            if page_size is not None:
+                set_page(key, 0)
+            rerun()
+        return None
+
+    if is_resync_event(component_value):
+        # Keyless tables see a failed inflate only now: send the HTML uncompressed
+        if is_decompress_failure(component_value) and disable_compression(key):
+            rerun()
+        return None
+
+    return component_value
+
+
+def clickable_table(
+    df=None,
+    styling_function=None,
+    data_bar_columns=None,
+    david_hum_columns=None,
+    range_chart=None,
+    fixed_scale_range_chart=None,
+    idx_col_name=None,
+    column_width=None,
+    max_height="800px",
+    hidden_column_class="hide-column",
+    hidden_columns=None,
+    bar_rounded=True,
+    cache=True,
+    payload="html",
+    virtualize_rows=False,
+    virtualize_columns=False,
+    pinned_columns=0,
+    page_size=None,
+    precompute_geometry=False,
+    geometry_worker=False,
+    diff_updates=False,
+    html_writer="pandas",
+    style_rules=None,
+    compression=None,
+    drop_hidden_columns=False,
+    debug_metrics=False,
+    sortable=False,
+    filterable=False,
+    sort_mode="server",
+    decoration_budget_ms=None,
+    key=None,
+):
     """
     Create a clickable table component with advanced visualization options.
     
@@ -57,8 +611,12 @@ def clickable_table(df=None, styling_function=None, data_bar_columns=None, david
             'dot3_color': '#0000FF',     # Color for third dot (optional, default: '#9CA3AF')
             'line_color': '#D1D5DB',     # Color for the grey line (optional, default: '#D1D5DB')
             'line_height': 2,            # Height of line in pixels (optional, default: 2)
-            'tick_marks': True           # Show tick marks (optional, default: True)
+            'tick_marks': True,          # Show tick marks (optional, default: True)
+            'tick_axis': 'row'           # 'row' draws ticks in every row, 'header' once in the column header (optional, default: 'row')
         }]
+        Every chart configuration above also accepts 'renderer': 'dom' (default) or
+        'canvas'. Canvas charts are painted on one overlay canvas for the visible
+        rows instead of being built from nested elements in each cell.
     idx_col_name : str, optional
         Name to display for the index column
     column_width : list of str, optional
@@ -74,63 +632,311 @@ def clickable_table(df=None, styling_function=None, data_bar_columns=None, david
     bar_rounded : bool, optional
         Whether to use rounded edges for all bars (data bars, David Hum charts, and range charts)
         Default is True (rounded edges). Set to False for square edges.
+    cache : bool, optional
+        Whether to reuse previously generated HTML when the dataframe content, the
+        styling function and the configuration are unchanged. Default is True.
+        The cache is bounded by html_cache.max_bytes and reports html_cache.hits
+        and html_cache.misses. Styling functions are identified by their code and
+        by the content of their defaults, closure values and the module-level
+        globals they read. Functions reading values that cannot be hashed by
+        content (e.g. class instances) are not cached. State read through other
+        objects, such as st.session_state, is not tracked: disable caching then.
+    payload : str, optional
+        How the table data is sent to the browser. "html" (default) sends the HTML
+        generated by pandas. "arrow" sends the DataFrame as Arrow-serialized typed
+        columns; the frontend builds the table itself and reads chart values from
+        the typed arrays instead of parsing cell text. styling_function is not
+        applied in "arrow" mode.
+    virtualize_rows : bool, optional
+        Only attach and decorate the body rows near the visible part of the
+        scroll container (see max_height). Rows are kept detached and reused
+        while scrolling. Recommended for tables with many thousands of rows.
+        Default is False.
+    virtualize_columns : bool, optional
+        Only lay out and paint the columns near the visible part of the scroll
+        container; the other cells stay in the rows but are not displayed. The
+        index and the pinned columns stay in view while scrolling horizontally.
+        This is a limited form of column virtualization: off-screen cells are
+        hidden with CSS rather than removed, so it saves layout and paint time but
+        does not reduce the DOM size or memory, and setting up column widths and
+        hidden columns still touches every column. Recommended for tables with
+        hundreds of columns. Default is False.
+    pinned_columns : int, optional
+        Number of leading data columns kept in view next to the index with
+        virtualize_columns. Default is 0.
+    page_size : int, optional
+        Enable server-side pagination with this many rows per page. Only the current
+        page is rendered and sent to the browser, together with the total row count;
+        the page navigation below the table requests other pages. The current page is
+        kept in st.session_state per key. styling_function is applied to the page
+        slice, while chart configs keep their table-wide min/max scales.
+        Clicked rowIndex values are positions in the full dataframe.
+    precompute_geometry : bool, optional
+        Compute bar widths, range chart positions and fixed-scale dot positions
+        with vectorized NumPy before sending the table, so the browser only lays
+        out precomputed numbers instead of parsing every cell. Applies to the
+        page slice when page_size is set. Default is False.
+    geometry_worker : bool, optional
+        Compute the chart geometry in the browser, but in a Web Worker instead of on
+        the main thread. The raw column values are sent to the worker in transferable
+        buffers and it returns typed arrays of bar widths, band offsets and dot
+        positions, so the main thread only reads cells and applies the results.
+        Ignored when precompute_geometry is set. Default is False.
+    diff_updates : bool, optional
+        Send only the rows and cells that changed since the previous rerun instead of
+        the whole table. Rows are matched by index label, so added and removed rows
+        are patched too. The cell values, the Styler's cell styles and the style rule
+        classes are compared as 64-bit digests before any HTML is written, and only
+        the changed cells and added rows are rendered. The frontend applies the patch
+        to the rendered rows and only re-decorates the rows it touched. Falls back to
+        a full render when the columns, header, formatting or config change, rows are
+        reordered, or more than half of the cells changed. With cache=True an
+        unchanged dataframe is not styled or compared again. The table is written by
+        the html_writer="fast" writer; Styler features it does not cover are sent as
+        full Styler.to_html() renders. Requires key and payload="html". Default is False.
+        The previous render is kept in st.session_state as 8 bytes per cell and per
+        row label instead of its HTML.
+    html_writer : str, optional
+        How the table HTML is generated. "pandas" (default) uses DataFrame.to_html() or
+        Styler.to_html(). "fast" writes the table with a vectorized writer: the Styler's
+        cell styles are computed once and written inline, and floats are formatted like
+        Styler's default (styler.format.precision decimals). On a 5000x16 table it is
+        about 10x faster than DataFrame.to_html() without a styling function, but only
+        about 4-5x faster than Styler.to_html() with a Styler.map styling function,
+        because the styling callbacks still run once per cell; use style_rules to avoid
+        them. Styler features the fast writer does not cover (hidden rows/columns,
+        header styles, tooltips) fall back to Styler.to_html().
+    style_rules : list of dict, optional
+        Declarative cell styling evaluated with NumPy masks over whole columns, as a
+        faster alternative to element-wise Styler.map callbacks. Each rule becomes a
+        CSS class, so cells carry class names instead of inline CSS. Rules apply to
+        the labels in 'columns' (a top-level label of MultiIndex columns selects all
+        columns below it); without 'columns', threshold and color_scale rules apply to
+        every numeric column and in_set rules to every column. Later rules win when
+        several match the same cell. Best combined with html_writer="fast".
+        Example: [
+            {'type': 'threshold', 'op': '>', 'value': 500, 'style': 'background-color: #FFC0CB'},
+            {'type': 'color_scale', 'columns': ['C 3'], 'min': -2, 'max': 2,  # min/max default to the finite data range
+             'colors': ['#F8696B', '#FFFFFF', '#63BE7B'], 'steps': 10, 'property': 'background-color'},
+            {'type': 'in_set', 'columns': ['C 5'], 'values': ['Good', 'Excellent'], 'style': 'color: green'}
+        ]
+        Threshold ops are '>', '>=', '<', '<=', '==' and '!='; threshold values are numbers.
+        Color scale colors are hex colors ('#F8696B' or '#F66') and steps an integer of at least 2.
+    compression : str, optional
+        Compress the table HTML before sending it over the websocket: "gzip" or
+        "deflate". The browser inflates it with DecompressionStream. Compressed payloads
+        are cached together with the HTML. The raw and compressed sizes of each render
+        are available from payload_metrics(key) and logged at DEBUG level on the
+        "clickable_table" logger; with compression=None they are only recorded when
+        debug_metrics is set. When the browser has no DecompressionStream or fails to
+        inflate a payload, the table is sent uncompressed for the rest of the session.
+        Default is None (uncompressed).
+    drop_hidden_columns : bool, optional
+        Leave the data columns listed in hidden_columns out of the table instead of
+        hiding them with CSS. Values that chart configs read from dropped columns are
+        sent as a compact numeric side channel, and chart, column_width and
+        hidden_columns indices are remapped to the narrower table, so configs keep
+        using the indices of the full table. styling_function and style_rules see the
+        table without the dropped columns. Hidden index columns are still hidden with
+        CSS. Default is False.
+    debug_metrics : bool, optional
+        Add frontend timings of the latest render to the click payload under 'metrics':
+        render_ms (React commit and HTML parsing), decorate_ms (chart decoration),
+        chart_ms (decoration time per chart type: data_bar, david_hum, range_chart,
+        fixed_scale), column_width_ms, hidden_columns_ms, cells_decorated and
+        nodes_created. The same timings are recorded as clickable_table:* entries
+        of the browser's performance timeline. Default is False.
+    sortable : bool, optional
+        Sort the table by clicking a bottom-level column header (ascending, descending,
+        then unsorted). Sorting runs in Python on the full dataframe before pagination;
+        sort permutations are cached per dataframe content, column and direction in
+        sort_cache, so sorting by a column again is a single take. Chart configs keep
+        referring to the same columns, since only rows are reordered. Header clicks
+        are not returned as cell clicks. Default is False.
+    filterable : bool, optional
+        Show a filter bar above the table to filter rows by column. A filter like
+        '> 5', '<= -1.5' or '!= 0' compares numeric values; any other text matches
+        cells containing it (case-insensitive). Filters apply to the full dataframe
+        before sorting and pagination. Default is False.
+        With sortable or filterable, clicked rowIndex values are still positions in
+        the dataframe passed in, and the sort/filter state is kept per key.
+    sort_mode : str, optional
+        Where sortable and filterable tables are sorted and filtered. "server" (default)
+        sorts in Python and reruns the script. "client" sorts and filters the rendered
+        rows in the browser without a rerun: column values are parsed once into typed
+        arrays and the existing row nodes, charts included, are reordered through an
+        index permutation. Numbers sort before text. Recommended for tables of up to
+        tens of thousands of rows; with page_size, only the current page is sorted.
+    decoration_budget_ms : float, optional
+        Build the charts in chunks of at most this many milliseconds per animation
+        frame instead of in one pass, so scrolling and clicks stay responsive while a
+        large table is decorated. Rows in and near the visible part of the table are
+        decorated first, and pending chunks are dropped when new data or config
+        arrives. Has no effect with virtualize_rows. Default is None (one pass).
     key : str, optional
         Key for the component instance
         
     Returns:
     --------
     dict
-        Component return value containing clicked cell information
+        Component return value containing clicked cell information: key, cellValue,
+        header (bottom-level header label), headerPath (header labels from the top
+        header row down) and rowIndex
     """
-    if df is None:
-        st.error("DataFrame is required for clickable_table")
-        return None
-        
-    # Configure the table styling
-    if styling_function is not None:
-        try:
-            styled_df = styling_function(df)
-            # Generate HTML from styled dataframe
-            html = styled_df.to_html()
-        except Exception as e:
-            st.warning(f"Styling function failed: {e}. Using unstyled table.")
-            html = df.to_html()
-    else:
-        # Generate HTML from unstyled dataframe
-        html = df.to_html()
-    
-    # Resolve idx_col_name: handle MultiIndex row index where name could be a tuple
-    resolved_idx_col_name = idx_col_name
-    if resolved_idx_col_name is None:
-        index_name = df.index.name
-        if index_name is not None:
-            resolved_idx_col_name = str(index_name)
-        else:
-            resolved_idx_col_name = ""
-
-    # Build the configuration object
-    config = {
-        'data_bar_chart_columns': data_bar_columns or [],
-        'david_hum_columns': david_hum_columns or [],
-        'idx_col_name': resolved_idx_col_name,
-        'column_width': column_width or [],
-        'range_chart': range_chart or [],
-        'fixed_scale_range_chart': fixed_scale_range_chart or [],
-        'hidden_column_class': hidden_column_class,
-        'hidden_columns': hidden_columns or [],
-        'bar_rounded': bar_rounded
-    }
-    
-    # Call the component function
-    component_value = _component_func(
-        html=html, 
-        key=key, 
-        config=config, 
-        max_height=max_height, 
-        default=None
+    table = _prepare_table(
+        df=df,
+        styling_function=styling_function,
+        data_bar_columns=data_bar_columns,
+        david_hum_columns=david_hum_columns,
+        range_chart=range_chart,
+        fixed_scale_range_chart=fixed_scale_range_chart,
+        idx_col_name=idx_col_name,
+        column_width=column_width,
+        max_height=max_height,
+        hidden_column_class=hidden_column_class,
+        hidden_columns=hidden_columns,
+        bar_rounded=bar_rounded,
+        cache=cache,
+        payload=payload,
+        virtualize_rows=virtualize_rows,
+        virtualize_columns=virtualize_columns,
+        pinned_columns=pinned_columns,
+        page_size=page_size,
+        precompute_geometry=precompute_geometry,
+        geometry_worker=geometry_worker,
+        diff_updates=diff_updates,
+        html_writer=html_writer,
+        style_rules=style_rules,
+        compression=compression,
+        drop_hidden_columns=drop_hidden_columns,
+        debug_metrics=debug_metrics,
+        sortable=sortable,
+        filterable=filterable,
+        sort_mode=sort_mode,
+        decoration_budget_ms=decoration_budget_ms,
+        key=key,
     )
-    
-    return component_value
+    if table is None:
+        return None
+
+    with table['timer'].stage('component'):
+        component_value = _component_func(**table['args'], key=key, default=None)
+    table['timer'].finish()
+    return _table_value(table, component_value)
+
+
+def _table_key(key, name):
+    """State key of one table of a clickable_tables() call."""
+    return f"{key if key is not None else ''}::{name}"
+
+
+def _separate_tables(names, specs, key):
+    """
+    Render each table with its own clickable_table() call, for bundles that
+    predate clickable_tables(). Each component keeps its last click, so the
+    table whose click changed since the previous run is the clicked one.
+    """
+    seen = st.session_state.setdefault(f"{_SEPARATE_CLICKS_STATE_PREFIX}{key}", {})
+    clicked = None
+    for name, options in zip(names, specs):
+        value = clickable_table(**options, key=_table_key(key, name))
+        if value is not None and value != seen.get(name):
+            clicked = {**value, 'table': name}
+        seen[name] = value
+    return clicked
+
+
+def clickable_tables(tables, key=None):
+    """
+    Render several tables in a single component instance.
+
+    Every clickable_table() call creates its own component iframe, which loads
+    and starts the frontend bundle again. clickable_tables() renders all tables
+    in one iframe, so a page with many small tables loads the bundle once.
+
+    Parameters:
+    -----------
+    tables : list of dict
+        One dict per table with 'df' and any other clickable_table() parameter
+        except key, plus an optional 'name' that identifies the table in click
+        events (default: its position as a string).
+        Example: [{'name': 'rates', 'df': rates, 'data_bar_columns': [...]},
+                  {'name': 'fx', 'df': fx, 'max_height': '300px'}]
+        payload="arrow" and compression are not supported here; such tables are
+        sent as uncompressed HTML.
+    key : str, optional
+        Key for the component instance. Pagination, sorting, filtering and diff
+        state are kept per table under this key.
+
+    Returns:
+    --------
+    dict
+        Component return value of the clicked table, as for clickable_table(),
+        with the table's name in 'table'
+    """
+    defaults = {name: parameter.default for name, parameter in inspect.signature(clickable_table).parameters.items()}
+    names = []
+    specs = []
+    for position, spec in enumerate(tables):
+        options = dict(spec)
+        name = str(options.pop('name', position))
+        unknown = sorted(option for option in options if option not in defaults or option == 'key')
+        if unknown:
+            st.error(f"Unknown option(s) for table '{name}': {', '.join(unknown)}")
+            return None
+        if name in names:
+            st.error(f"Duplicate table name '{name}'")
+            return None
+        if options.get('payload') == "arrow":
+            st.warning(f"payload='arrow' is not supported by clickable_tables; sending table '{name}' as HTML.")
+            options['payload'] = "html"
+        if options.get('compression') is not None:
+            st.warning(f"compression is not supported by clickable_tables; sending table '{name}' uncompressed.")
+            options['compression'] = None
+        if options.get('diff_updates') and key is None:
+            st.warning("diff_updates requires a key; sending the full table.")
+            options['diff_updates'] = False
+        names.append(name)
+        specs.append(options)
+
+    if _bundle_protocol < _FRONTEND_PROTOCOL:
+        st.warning(f"The installed frontend bundle predates clickable_tables; rendering one component per table. "
+                   f"{_REBUILD_HINT}")
+        return _separate_tables(names, specs, key)
+
+    # Events name their table: hand the latest one to that table's key, where
+    # pagination, sorting and diff resyncs are picked up before rendering
+    value = st.session_state.get(key) if key is not None else None
+    if isinstance(value, dict) and str(value.get('table')) in names:
+        st.session_state[_table_key(key, value['table'])] = value
+
+    prepared = []
+    for name, options in zip(names, specs):
+        table = _prepare_table(**{**defaults, **options, 'key': _table_key(key, name), 'shared': True})
+        if table is None:
+            # Report the tables prepared so far, as their timers were started
+            for _, prepared_table in prepared:
+                prepared_table['timer'].finish()
+            return None
+        prepared.append((name, table))
+
+    with contextlib.ExitStack() as stack:
+        for _, table in prepared:
+            stack.enter_context(table['timer'].stage('component'))
+        component_value = _component_func(
+            tables=[{**table['args'], 'table': name} for name, table in prepared],
+            key=key,
+            default=None
+        )
+    for _, table in prepared:
+        table['timer'].finish()
+
+    if not isinstance(component_value, dict):
+        return None
+    for name, table in prepared:
+        if name == str(component_value.get('table')):
+            return _table_value(table, component_value)
+    return None
 
 # Example/test code - will only run in development mode
 if not _RELEASE:
@@ -0,0 +1,254 @@
+import hashlib
+import json
+import threading
+import types
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def dataframe_fingerprint(df):
+    """
+    Return a fast content fingerprint for a DataFrame.
+
+    The fingerprint covers the values, the index, the column labels and the
+    dtypes. Values are hashed with pandas' vectorized ``hash_pandas_object``
+    so the cost is a single pass over the data.
+
+    Returns None when the frame holds unhashable values (e.g. lists), in which
+    case callers should skip caching.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True)
+    except TypeError:
+        return None
+    digest.update(row_hashes.values.tobytes())
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    digest.update(repr(list(df.columns.names)).encode('utf-8'))
+    digest.update(repr(list(df.index.names)).encode('utf-8'))
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode('utf-8'))
+    digest.update(repr(df.shape).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class _Unhashable(Exception):
+    """Raised for a value that cannot be fingerprinted by content."""
+
+
+def _update_with_code(digest, code):
+    """Feed a code object into digest, recursing into nested functions/lambdas."""
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _update_with_code(digest, const)
+        else:
+            # repr() of a nested code object embeds its memory address,
+            # so only plain constants are hashed by value
+            digest.update(repr(const).encode('utf-8'))
+    digest.update(repr(code.co_names).encode('utf-8'))
+
+
+def _global_names(code):
+    """Names that code and its nested functions/lambdas may load as globals."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            names |= _global_names(const)
+    return names
+
+
+def _update_with_value(digest, value, seen):
+    """
+    Feed a value into digest by content. Arrays and pandas objects are hashed
+    over all their data, since their repr() is truncated. Raises _Unhashable
+    for values of other types, whose content cannot be read reliably.
+    """
+    digest.update(type(value).__qualname__.encode('utf-8'))
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(repr(value).encode('utf-8'))
+    elif isinstance(value, (list, tuple)):
+        digest.update(str(len(value)).encode('utf-8'))
+        for item in value:
+            _update_with_value(digest, item, seen)
+    elif isinstance(value, (set, frozenset)):
+        # Sets have no stable order, so their items are hashed in sorted digest order
+        for item_digest in sorted(_value_digest(item, seen) for item in value):
+            digest.update(item_digest)
+    elif isinstance(value, dict):
+        digest.update(str(len(value)).encode('utf-8'))
+        for item_key, item in value.items():
+            _update_with_value(digest, item_key, seen)
+            _update_with_value(digest, item, seen)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype.str}{value.shape}".encode('utf-8'))
+        if value.dtype.hasobject:
+            try:
+                digest.update(pd.util.hash_array(value.ravel()).tobytes())
+            except TypeError:
+                raise _Unhashable from None
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.generic):
+        digest.update(value.dtype.str.encode('utf-8'))
+        digest.update(repr(value.item()).encode('utf-8'))
+    elif isinstance(value, pd.DataFrame):
+        fingerprint = dataframe_fingerprint(value)
+        if fingerprint is None:
+            raise _Unhashable
+        digest.update(fingerprint.encode('utf-8'))
+    elif isinstance(value, (pd.Series, pd.Index)):
+        try:
+            digest.update(pd.util.hash_pandas_object(value, index=isinstance(value, pd.Series)).values.tobytes())
+        except TypeError:
+            raise _Unhashable from None
+        digest.update(repr((str(value.dtype), value.name)).encode('utf-8'))
+        if isinstance(value, pd.Series):
+            digest.update(repr(value.index.names).encode('utf-8'))
+    elif isinstance(value, types.ModuleType):
+        digest.update(value.__name__.encode('utf-8'))
+    elif isinstance(value, type):
+        digest.update(f"{value.__module__}.{value.__qualname__}".encode('utf-8'))
+    elif isinstance(value, types.BuiltinFunctionType):
+        digest.update(f"{getattr(value, '__module__', None)}.{value.__qualname__}".encode('utf-8'))
+    elif isinstance(value, types.FunctionType):
+        _update_with_function(digest, value, seen)
+    else:
+        raise _Unhashable
+
+
+def _value_digest(value, seen):
+    digest = hashlib.blake2b(digest_size=16)
+    _update_with_value(digest, value, seen)
+    return digest.digest()
+
+
+def _update_with_function(digest, func, seen):
+    """Feed a Python function into digest: its code, defaults, closure values and the globals it reads."""
+    digest.update(f"{func.__module__}.{func.__qualname__}".encode('utf-8'))
+    if func in seen:
+        # Recursive functions reference themselves through their globals
+        return
+    seen.add(func)
+    code = func.__code__
+    _update_with_code(digest, code)
+    _update_with_value(digest, func.__defaults__, seen)
+    _update_with_value(digest, func.__kwdefaults__, seen)
+    for cell in func.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # Empty cell (variable not yet bound)
+            digest.update(b'<empty>')
+            continue
+        _update_with_value(digest, contents, seen)
+    # co_names also lists attribute names; only names bound in the module are globals
+    module_globals = func.__globals__
+    for name in sorted(_global_names(code)):
+        if name in module_globals:
+            digest.update(name.encode('utf-8'))
+            _update_with_value(digest, module_globals[name], seen)
+
+
+def function_fingerprint(func):
+    """
+    Return a fingerprint for a styling function.
+
+    Streamlit re-executes the script on every rerun, so functions defined in
+    the script are new objects each time. Identity is therefore taken from the
+    qualified name, the compiled code, default arguments, closure values and
+    the module-level globals the function reads (e.g. widget values assigned
+    in the script) rather than from ``id(func)``. Values are hashed by content;
+    arrays and pandas objects over all their data.
+
+    Returns None when the function cannot be fingerprinted: callables without
+    Python code (e.g. functools.partial) and functions reading values of other
+    types, such as class instances. Callers should skip caching then.
+    """
+    if func is None:
+        return None
+    if not isinstance(func, types.FunctionType):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        _update_with_function(digest, func, set())
+    except _Unhashable:
+        return None
+    return digest.hexdigest()
+
+
+def config_fingerprint(config):
+    """Return a fingerprint for a JSON-like configuration object."""
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class HtmlCache:
+    """
+    Bounded LRU cache for generated table HTML.
+
+    Entries are evicted least-recently-used first once the total size of the
+    cached strings exceeds ``max_bytes``. The cache is shared across Streamlit
+    sessions, so access is guarded by a lock.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self):
+        return self._size_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached HTML for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, html):
+        """Store html (str, or compressed bytes) under key, evicting old entries to respect max_bytes."""
+        size = len(html) if isinstance(html, bytes) else len(html.encode('utf-8'))
+        with self._lock:
+            if key in self._entries:
+                self._size_bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                # Never cache a single entry larger than the whole budget
+                return
+            self._entries[key] = (html, size)
+            self._size_bytes += size
+            while self._size_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+
+    def clear(self):
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_bytes': self.max_bytes,
+            }
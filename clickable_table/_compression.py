@@ -0,0 +1,93 @@
+import gzip
+import logging
+import zlib
+
+import streamlit as st
+
+logger = logging.getLogger("clickable_table")
+
+COMPRESSION_FORMATS = ("gzip", "deflate")
+
+# zlib level 6: most of the size reduction of level 9 at a third of the time
+_COMPRESSION_LEVEL = 6
+
+_METRICS_STATE_PREFIX = "_clickable_table_payload::"
+_UNCOMPRESSED_STATE_PREFIX = "_clickable_table_uncompressed::"
+
+
+def _uncompressed_key(key):
+    return f"{_UNCOMPRESSED_STATE_PREFIX}{key if key is not None else ''}"
+
+
+def is_decompress_failure(value):
+    """Return True if a component value reports that the browser could not inflate the HTML."""
+    return isinstance(value, dict) and value.get('event') == 'resync' and value.get('reason') == 'decompress'
+
+
+def disable_compression(key):
+    """
+    Send the table with this key uncompressed for the rest of the session.
+    Returns True if it was sent compressed until now.
+    """
+    if st.session_state.get(_uncompressed_key(key), False):
+        return False
+    st.session_state[_uncompressed_key(key)] = True
+    logger.debug("clickable_table %r: the browser could not inflate the HTML, sending it uncompressed", key)
+    return True
+
+
+def compression_disabled(key):
+    """
+    Return True once the browser failed to inflate a payload of the table with
+    this key. As with pagination, a failure reported by a keyed table is picked
+    up from st.session_state[key] before rendering.
+    """
+    if key is not None and is_decompress_failure(st.session_state.get(key)):
+        disable_compression(key)
+    return st.session_state.get(_uncompressed_key(key), False)
+
+
+def compress_html(html, compression):
+    """
+    Compress the table HTML for the browser's DecompressionStream.
+
+    "gzip" produces a gzip member and "deflate" a zlib stream, matching the
+    formats of the same name in DecompressionStream.
+    """
+    data = html.encode('utf-8')
+    if compression == "gzip":
+        # mtime=0 keeps the output stable, so identical tables compress identically
+        return gzip.compress(data, compresslevel=_COMPRESSION_LEVEL, mtime=0)
+    return zlib.compress(data, _COMPRESSION_LEVEL)
+
+
+def record_payload(key, html, compressed, compression):
+    """
+    Store the raw and compressed HTML sizes of the current render and log them
+    at DEBUG level on the "clickable_table" logger.
+    """
+    raw_bytes = len(html.encode('utf-8')) if html is not None else 0
+    sent_bytes = len(compressed) if compressed is not None else raw_bytes
+    metrics = {
+        'compression': compression,
+        'raw_bytes': raw_bytes,
+        'compressed_bytes': sent_bytes,
+        'ratio': sent_bytes / raw_bytes if raw_bytes else 1.0,
+    }
+    st.session_state[f"{_METRICS_STATE_PREFIX}{key if key is not None else ''}"] = metrics
+    logger.debug(
+        "clickable_table %r payload: %d raw bytes, %d sent (%s)",
+        key, raw_bytes, sent_bytes, compression or "uncompressed",
+    )
+    return metrics
+
+
+def payload_metrics(key=None):
+    """
+    Return the payload sizes of the last render of the table with this key.
+
+    The dict holds 'compression', 'raw_bytes' (UTF-8 size of the table HTML),
+    'compressed_bytes' (bytes actually sent for the HTML) and 'ratio', or None
+    if the table has not been rendered in this session.
+    """
+    return st.session_state.get(f"{_METRICS_STATE_PREFIX}{key if key is not None else ''}")
@@ -0,0 +1,240 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from ._html import cells_frame, cells_style, cells_text, render_cells_column, render_cells_html, render_cells_rows
+
+_DIFF_STATE_PREFIX = "_clickable_table_diff::"
+_RESYNC_STATE_PREFIX = "_clickable_table_resync::"
+
+# Patches touching more than this fraction of the cells are sent as a full render
+_MAX_PATCH_RATIO = 0.5
+
+# Odd 64-bit multiplier used to fold the style and class hashes into a cell digest
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+_EMPTY_PATCH = {'removed': [], 'added': [], 'rows': [], 'cells': [], 'style': None}
+
+
+def is_resync_event(value):
+    """Return True if a component value asks for a full render after a failed patch."""
+    return isinstance(value, dict) and value.get('event') == 'resync'
+
+
+def consume_resync(key):
+    """
+    Drop the diff state of a table whose frontend could not apply a patch.
+
+    The resync request stays in st.session_state[key] until the next event,
+    so each request is handled once, identified by its nonce.
+    """
+    value = st.session_state.get(key)
+    if not is_resync_event(value):
+        return
+    nonce = value.get('nonce')
+    if st.session_state.get(f"{_RESYNC_STATE_PREFIX}{key}") == nonce:
+        return
+    st.session_state[f"{_RESYNC_STATE_PREFIX}{key}"] = nonce
+    st.session_state.pop(f"{_DIFF_STATE_PREFIX}{key}", None)
+
+
+def styler_uuid(key):
+    """
+    Return a stable Styler uuid for the table with this key.
+
+    Styler embeds a random uuid in every cell id unless one is set, which
+    would make every rendered row differ from the previous render.
+    """
+    return "ct_" + hashlib.blake2b(str(key).encode('utf-8'), digest_size=4).hexdigest()
+
+
+def _digest(text, size=16):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=size).digest()
+
+
+def _hash_strings(values):
+    """64-bit hashes of an object array of strings, '' for missing values."""
+    values = np.asarray(values, dtype=object)
+    if values.size == 0:
+        return np.zeros(0, dtype=np.uint64)
+    return pd.util.hash_array(np.where(pd.isna(values), '', values).astype(object))
+
+
+def _cell_digests(cells):
+    """
+    One 64-bit digest per data cell of table cells, from the cell value, its
+    inline style and its classes. Columns with a custom Styler.format() are
+    hashed by their display text, since the formatter may change the text of
+    an unchanged value.
+    """
+    data = cells['data']
+    n_rows, n_cols = data.shape
+    digests = np.empty((n_rows, n_cols), dtype=np.uint64)
+    empty = np.full(n_rows, '', dtype=object)
+    for c in range(n_cols):
+        if c in cells['custom_columns']:
+            digest = _hash_strings(cells_text(cells, slice(None), c))
+        else:
+            digest = pd.util.hash_pandas_object(data.iloc[:, c], index=False).to_numpy()
+        for name in ('styles', 'classes'):
+            attribute = cells[name][:, c] if cells[name] is not None else empty
+            # uint64 arithmetic wraps around, which is what a hash combination wants
+            digest = digest * _HASH_MULTIPLIER ^ _hash_strings(attribute)
+        digests[:, c] = digest
+    return digests
+
+
+def _index_digests(index):
+    """Row labels as 64-bit hashes, so the labels themselves are not kept."""
+    return pd.Index(pd.util.hash_pandas_object(index, index=False).to_numpy())
+
+
+def _align_rows(old_index, new_index):
+    """
+    Match rows of two renders by index label.
+
+    Returns (removed, added): positions of rows that only exist in the old
+    render and in the new render. Returns None when the remaining rows were
+    reordered or the labels are not unique, since positions can't be mapped.
+    """
+    if old_index.equals(new_index):
+        return np.array([], dtype=int), np.array([], dtype=int)
+    if not (old_index.is_unique and new_index.is_unique):
+        return None
+    removed_mask = ~old_index.isin(new_index)
+    added_mask = ~new_index.isin(old_index)
+    if not old_index[~removed_mask].equals(new_index[~added_mask]):
+        return None
+    return np.flatnonzero(removed_mask), np.flatnonzero(added_mask)
+
+
+def _changed_cells(state, digests, index):
+    """
+    Compare the cell digests of the previous and the new table.
+
+    Returns (removed, added, changed, kept_new) as from _align_rows, plus a
+    boolean array with one row per kept row marking its changed cells and the
+    new positions of the kept rows. Returns None if the rows can't be matched.
+    """
+    aligned = _align_rows(state['index'], index)
+    if aligned is None:
+        return None
+    removed, added = aligned
+    kept_old = np.delete(np.arange(len(state['index'])), removed)
+    kept_new = np.delete(np.arange(len(index)), added)
+    changed = state['cells'][kept_old] != digests[kept_new]
+    return removed, added, changed, kept_new
+
+
+def _build_patch(cells, removed, added, changed, kept_new, style):
+    """
+    Render the patch turning the previous table into the new one: only the
+    added rows and the changed cells are written. Rows whose data cells all
+    changed are sent whole.
+    """
+    index_cells = cells['data'].index.nlevels
+    whole = changed.all(axis=1) & (changed.shape[1] > 0)
+    replaced = kept_new[whole]
+
+    cell_changes = {}
+    partial = changed & ~whole[:, None]
+    for column in np.flatnonzero(partial.any(axis=0)):
+        rows = kept_new[partial[:, column]]
+        for position, cell_html in zip(rows.tolist(), render_cells_column(cells, rows, column)):
+            cell_changes.setdefault(position, []).append([index_cells + int(column), cell_html])
+
+    return {
+        'removed': removed.tolist(),
+        'added': [[int(pos), row] for pos, row in zip(added, render_cells_rows(cells, added))],
+        'rows': [[int(pos), row] for pos, row in zip(replaced, render_cells_rows(cells, replaced))],
+        'cells': [[position, cell_changes[position]] for position in sorted(cell_changes)],
+        'style': style,
+    }
+
+
+def _unchanged_arg(version):
+    """Diff argument for a table that did not change since version."""
+    return {'version': version, 'base': version, 'patch': _EMPTY_PATCH}
+
+
+def current_update(key, content_key, config_key):
+    """
+    Return the diff argument for a rerun of an unchanged table, or None when
+    the table has to be rendered and compared.
+
+    content_key identifies the dataframe and its styling (the HTML cache key);
+    when it matches the one of the last render, the table is neither styled
+    nor compared again. None never matches.
+    """
+    state = st.session_state.get(f"{_DIFF_STATE_PREFIX}{key}")
+    if state is None or content_key is None:
+        return None
+    if state['content'] != content_key or state['config'] != config_key:
+        return None
+    return _unchanged_arg(state['version'])
+
+
+def discard_update(key):
+    """Forget the last render of key, e.g. when the table can't be diffed."""
+    st.session_state.pop(f"{_DIFF_STATE_PREFIX}{key}", None)
+
+
+def prepare_update(key, cells, config_key, content_key=None):
+    """
+    Compare new table cells with the ones last sent for this key.
+
+    The cell values, inline styles and classes are compared as digests
+    before any HTML is written, so only the changed cells and added rows are
+    rendered. Returns (html, diff): html is the full table HTML for a full
+    render and None when a patch is sent; diff is {'version'} for a full
+    render, or {'version', 'base', 'patch'} when only the patch needs to be
+    sent. The patch applies on top of version 'base'; the frontend asks for
+    a resync when it holds a different version. A full render is used when
+    the table markup outside the body rows, its formatting or the config
+    changed, when rows were reordered, or when the patch would touch more
+    than half of the cells.
+
+    The previous render is kept in st.session_state as digests, 8 bytes per
+    cell and row label, rather than as HTML or data.
+    """
+    state_key = f"{_DIFF_STATE_PREFIX}{key}"
+    state = st.session_state.get(state_key)
+
+    frame_digest = _digest(repr([cells_frame(cells), cells['format_key']]))
+    style = cells_style(cells)
+    style_digest = _digest(style)
+    digests = _cell_digests(cells)
+    index = _index_digests(cells['data'].index)
+
+    html = None
+    arg = None
+    version = state['version'] + 1 if state is not None else 1
+    if state is not None and state['frame'] == frame_digest and state['config'] == config_key:
+        compared = _changed_cells(state, digests, index)
+        if compared is not None:
+            removed, added, changed, kept_new = compared
+            style_patch = style if style_digest != state['style'] else None
+            touched = changed.sum() + len(added) * digests.shape[1]
+            if not (touched or len(removed) or style_patch is not None):
+                # Nothing changed: the frontend keeps the table it shows
+                version = state['version']
+                arg = _unchanged_arg(version)
+            elif touched <= _MAX_PATCH_RATIO * digests.size:
+                patch = _build_patch(cells, removed, added, changed, kept_new, style_patch)
+                arg = {'version': version, 'base': state['version'], 'patch': patch}
+    if arg is None:
+        html = render_cells_html(cells)
+        arg = {'version': version}
+
+    st.session_state[state_key] = {
+        'version': version,
+        'frame': frame_digest,
+        'style': style_digest,
+        'cells': digests,
+        'index': index,
+        'config': config_key,
+        'content': content_key,
+    }
+    return html, arg
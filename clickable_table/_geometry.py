@@ -0,0 +1,138 @@
+import numpy as np
+
+from ._numeric import numeric_column
+
+# Decimal places kept for percentages sent to the frontend
+_PRECISION = 3
+
+
+def _to_list(values):
+    """Round and convert to a JSON-friendly list, with NaN/inf sent as None."""
+    rounded = np.round(values, _PRECISION)
+    return np.where(np.isfinite(rounded), rounded, None).tolist()
+
+
+def _column_or_nan(df, data_col):
+    values = numeric_column(df, data_col)
+    return values if values is not None else np.full(len(df), np.nan)
+
+
+def _left_position(values, low, high):
+    """Vectorized getLeftPosition: position within [low, high] scaled to 98%."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (values - low) / (high - low) * 98
+
+
+def data_bar_geometry(df, config, index_cells):
+    """
+    Bar widths (percent of the cell), sign and recommendation marker position
+    for one data_bar_columns entry. col_idx counts the index cells.
+    """
+    values = _column_or_nan(df, config['col_idx'] - index_cells)
+    # A zero min/max gives an infinite scale, as in the browser
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale_left = np.float64(50) / abs(config['min'])
+        scale_right = np.float64(50) / config['max']
+    negative = values < 0
+    with np.errstate(invalid='ignore'):
+        width = np.where(negative, np.abs(values) * scale_left, values * scale_right)
+
+    geometry = {
+        'width': _to_list(width),
+        'negative': negative.astype(int).tolist(),
+    }
+
+    recommended_idx = config.get('recommended_idx')
+    if recommended_idx is not None:
+        recommended = _column_or_nan(df, recommended_idx - index_cells)
+        with np.errstate(invalid='ignore'):
+            marker = np.where(
+                recommended < 0,
+                50 - np.abs(recommended) * scale_left,
+                50 + recommended * scale_right,
+            )
+        # Tooltip values are sent as-is so they match the cell text
+        geometry['marker'] = _to_list(marker)
+        geometry['value'] = np.where(np.isnan(values), None, values).tolist()
+        geometry['recommended'] = np.where(np.isnan(recommended), None, recommended).tolist()
+    return geometry
+
+
+def david_hum_geometry(df, config, index_cells):
+    """Bar widths (percent of the cell) for one david_hum_columns entry."""
+    values = _column_or_nan(df, config['col_idx'] - index_cells)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        width = values * (np.float64(65) / config['max'])
+    return {'width': _to_list(width)}
+
+
+def range_chart_geometry(df, config, index_cells):
+    """
+    Band and marker positions for one range_chart entry, scaled to the row's
+    long-term range, plus a state per row: -1 shows low_text, 1 shows
+    high_text, 0 draws the chart.
+    """
+    def column(name):
+        return _column_or_nan(df, config[name] - index_cells)
+
+    long_high = column('long_term_high_idx')
+    long_low = column('long_term_low_idx')
+    short_high = column('short_term_high_idx')
+    short_low = column('short_term_low_idx')
+    current = column('current_idx')
+
+    state = np.zeros(len(df), dtype=int)
+    if config.get('high_text'):
+        state[(current > short_high) & (current > long_high)] = 1
+    if config.get('low_text'):
+        state[(current < short_low) & (current < long_low)] = -1
+
+    return {
+        'long_low': _to_list(_left_position(long_low, long_low, long_high)),
+        'long_high': _to_list(_left_position(long_high, long_low, long_high)),
+        'short_low': _to_list(_left_position(short_low, long_low, long_high)),
+        'short_high': _to_list(_left_position(short_high, long_low, long_high)),
+        'current': _to_list(_left_position(current, long_low, long_high)),
+        'state': state.tolist(),
+    }
+
+
+def fixed_scale_geometry(df, config, index_cells):
+    """
+    Dot positions (percent, clamped to the fixed min/max) for one
+    fixed_scale_range_chart entry. The frontend shifts its indices by one
+    for the index column, so they count the index cells minus one.
+    """
+    low, high = config['min'], config['max']
+    dots = []
+    for name in ('dot1_idx', 'dot2_idx', 'dot3_idx'):
+        values = _column_or_nan(df, config[name] + 1 - index_cells)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            positions = np.clip((values - low) / (high - low) * 100, 0, 100)
+        dots.append(_to_list(positions))
+    return {'dots': dots}
+
+
+def compute_geometry(df, config):
+    """
+    Precompute chart geometry for every chart config with vectorized NumPy.
+
+    Returns a dict with one list per chart type, parallel to the config lists,
+    so the frontend only has to lay out the numbers. Row i of each array is the
+    i-th body row of the table sent to the browser.
+    """
+    index_cells = df.index.nlevels
+    return {
+        'data_bar_chart_columns': [
+            data_bar_geometry(df, c, index_cells) for c in config['data_bar_chart_columns']
+        ],
+        'david_hum_columns': [
+            david_hum_geometry(df, c, index_cells) for c in config['david_hum_columns']
+        ],
+        'range_chart': [
+            range_chart_geometry(df, c, index_cells) for c in config['range_chart']
+        ],
+        'fixed_scale_range_chart': [
+            fixed_scale_geometry(df, c, index_cells) for c in config['fixed_scale_range_chart']
+        ],
+    }
@@ -0,0 +1,364 @@
+from functools import partial
+from html import escape
+
+import re
+
+import numpy as np
+import pandas as pd
+
+_ESCAPE_RE = re.compile(r'[&<>"\']')
+
+
+def _escape_column(text):
+    """HTML-escape an object array of strings, touching only values that need it."""
+    # One scan over the joined column is much cheaper than a check per value
+    if not _ESCAPE_RE.search(''.join(text)):
+        return text
+    return np.array([escape(value) for value in text], dtype=object)
+
+
+def _format_values(values, precision):
+    """
+    Format a column like Styler's default formatter: floats with a fixed
+    number of decimals, everything else with str(). Plain NumPy float, integer
+    and boolean columns are formatted in one vectorized call.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == 'f':
+            return np.char.mod(f'%.{precision}f', values).astype(object)
+        if values.dtype.kind in 'iub':
+            return values.astype(str).astype(object)
+    return np.array(
+        [f'{value:.{precision}f}' if isinstance(value, float) else str(value) for value in values],
+        dtype=object,
+    )
+
+
+def _attribute_column(values, name):
+    """Build ' name="value"' strings for an object array, '' where the value is empty."""
+    values = np.asarray(values, dtype=object)
+    present = pd.notna(values)
+    present[present] = values[present] != ''
+    result = np.full(len(values), '', dtype=object)
+    if present.any():
+        quoted = _escape_column(values[present].astype(str).astype(object))
+        result[present] = f' {name}="' + quoted + '"'
+    return result
+
+
+def _label_text(labels):
+    return _escape_column(np.array(['' if label is None else str(label) for label in labels], dtype=object))
+
+
+def _header_spans(columns, level):
+    """
+    Return (starts, spans) of the header cells for one column level. Adjacent
+    columns sharing the label at this level and every level above it are
+    merged into one colspan cell; the bottom level is never merged.
+    """
+    n_cols = len(columns)
+    if n_cols == 0:
+        return np.array([], dtype=int), np.array([], dtype=int)
+    if level == columns.nlevels - 1:
+        return np.arange(n_cols), np.ones(n_cols, dtype=int)
+
+    change = np.zeros(n_cols, dtype=bool)
+    change[0] = True
+    for upper in range(level + 1):
+        codes = np.asarray(columns.codes[upper])
+        change[1:] |= codes[1:] != codes[:-1]
+    starts = np.flatnonzero(change)
+    spans = np.diff(np.append(starts, n_cols))
+    return starts, spans
+
+
+def _header_rows(df):
+    """
+    Write the <thead> rows like Styler: one blank cell per index level in
+    each column level row, and a row of index names below them when the
+    index has names.
+    """
+    columns = df.columns
+    index_levels = df.index.nlevels
+    rows = []
+    for level in range(columns.nlevels):
+        cells = [f'<th class="blank level{level}"></th>'] * index_levels
+        column_name = columns.names[level]
+        if column_name is not None:
+            cells[-1] = f'<th class="index_name level{level}">{escape(str(column_name))}</th>'
+
+        starts, spans = _header_spans(columns, level)
+        labels = _label_text(columns.get_level_values(level)[starts])
+        for start, span, label in zip(starts.tolist(), spans.tolist(), labels):
+            colspan = f' colspan="{span}"' if span > 1 else ''
+            cells.append(f'<th class="col_heading level{level} col{start}"{colspan}>{label}</th>')
+        rows.append('<tr>' + ''.join(cells) + '</tr>')
+
+    if any(name is not None for name in df.index.names):
+        names = _label_text(df.index.names)
+        cells = [f'<th class="index_name level{i}">{name}</th>' for i, name in enumerate(names)]
+        cells.extend(f'<th class="blank col{c}"></th>' for c in range(len(columns)))
+        rows.append('<tr>' + ''.join(cells) + '</tr>')
+    return rows
+
+
+def _td_cells(text, styles=None, classes=None):
+    """Write the <td> strings of one column from its text, inline styles and classes."""
+    attributes = np.full(len(text), '', dtype=object)
+    if classes is not None:
+        attributes = attributes + _attribute_column(classes, 'class')
+    if styles is not None:
+        attributes = attributes + _attribute_column(styles, 'style')
+    return '<td' + attributes + '>' + np.asarray(text, dtype=object) + '</td>'
+
+
+def _body_rows(index, column_cells):
+    """Join the index <th> cells and per-column <td> strings into <tr> rows."""
+    # One array of finished cell strings per column, joined row-wise at the end
+    columns = []
+    for level in range(index.nlevels):
+        labels = _label_text(index.get_level_values(level))
+        columns.append(f'<th class="row_heading level{level}">' + labels + '</th>')
+    columns.extend(column_cells)
+    return ['<tr>' + ''.join(cells) + '</tr>' for cells in zip(*columns)]
+
+
+def _style_block(css):
+    return f'<style type="text/css">\n{css}\n</style>' if css else ''
+
+
+def _table_open(table_id, table_attributes):
+    id_attribute = f' id="{table_id}"' if table_id else ''
+    extra_attributes = f' {table_attributes}' if table_attributes else ''
+    return f'<table{id_attribute} class="dataframe"{extra_attributes}>'
+
+
+def _table_html(df, body, css, table_id, table_attributes):
+    parts = []
+    if css:
+        parts.append(_style_block(css))
+    parts.append(_table_open(table_id, table_attributes))
+    parts.append('<thead>')
+    parts.extend(_header_rows(df))
+    parts.append('</thead>')
+    parts.append('<tbody>')
+    parts.extend(body)
+    parts.append('</tbody>')
+    parts.append('</table>')
+    return '\n'.join(parts)
+
+
+def _default_text(values, precision, escape_text):
+    text = _format_values(values, precision)
+    if escape_text and values.dtype.kind not in 'fiub':
+        text = _escape_column(text)
+    return text
+
+
+def render_table_html(df, text=None, styles=None, classes=None, css='', table_id=None,
+                      table_attributes='', precision=None):
+    """
+    Write the table HTML directly with vectorized string operations.
+
+    A faster replacement for Styler.to_html() for the table shape used by
+    the component: single or MultiIndex columns (upper levels merged with
+    colspan), every index level written as a <th> in each body row, and an
+    optional class and inline style per data cell.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        The data to render
+    text : numpy.ndarray, optional
+        Object array of display strings with the shape of df. By default the
+        values are formatted like Styler's default formatter and HTML-escaped.
+    styles : numpy.ndarray, optional
+        Object array of inline CSS declarations per cell ('' for none)
+    classes : numpy.ndarray, optional
+        Object array of CSS class names per cell ('' for none)
+    css : str, optional
+        Style sheet written in a <style> block before the table
+    table_id : str, optional
+        id attribute of the <table> element
+    table_attributes : str, optional
+        Extra attributes for the <table> element
+    precision : int, optional
+        Float precision used when text is not given. Defaults to the
+        styler.format.precision option.
+
+    Returns:
+    --------
+    str
+        The table HTML
+    """
+    if precision is None:
+        precision = pd.get_option("styler.format.precision")
+
+    column_cells = []
+    for c in range(df.shape[1]):
+        if text is not None:
+            cell_text = np.asarray(text[:, c], dtype=object)
+        else:
+            cell_text = _default_text(df.iloc[:, c].to_numpy(), precision, True)
+        column_cells.append(_td_cells(
+            cell_text,
+            styles[:, c] if styles is not None else None,
+            classes[:, c] if classes is not None else None,
+        ))
+    return _table_html(df, _body_rows(df.index, column_cells), css, table_id, table_attributes)
+
+
+def table_cells(df, classes=None, css='', table_id=None):
+    """
+    Describe an unstyled DataFrame as table cells for the render_cells_*
+    functions: values are formatted like render_table_html's default and
+    HTML-escaped, with optional class names per cell.
+    """
+    precision = pd.get_option("styler.format.precision")
+    return {
+        'data': df,
+        'styles': None,
+        'classes': classes,
+        'css': css,
+        'table_id': table_id,
+        'table_attributes': '',
+        'display_funcs': None,
+        'custom_columns': set(),
+        'precision': precision,
+        'escape': True,
+        'format_key': ('plain', precision),
+    }
+
+
+def styler_cells(styler, uuid=None, extra_classes=None, extra_css=''):
+    """
+    Describe a pandas Styler as table cells for the render_cells_* functions.
+
+    The styling functions queued on the Styler are run once and the per-cell
+    CSS is kept as one inline style per cell, skipping the per-cell context
+    dicts, the Jinja2 template and the per-id CSS rules. Display text is
+    formatted when cells are rendered. Returns None for Styler features the
+    writer does not cover (hidden rows or columns, hidden index, header
+    styles, tooltips). extra_classes (an object array of class names) and
+    extra_css are added to the Styler's own td classes and table styles.
+    """
+    hides_index = any(getattr(styler, 'hide_index_', []))
+    hides_columns = any(getattr(styler, 'hide_columns_', []))
+    # hidden_rows/hidden_columns may be arrays, where [0] would test as False
+    if len(styler.hidden_rows) or len(styler.hidden_columns) or hides_index or hides_columns:
+        return None
+    if getattr(styler, 'tooltips', None) is not None:
+        return None
+
+    styler._compute()
+    if getattr(styler, 'ctx_index', None) or getattr(styler, 'ctx_columns', None):
+        return None
+
+    n_rows, n_cols = styler.data.shape
+    styles = None
+    if styler.ctx:
+        styles = np.full((n_rows, n_cols), '', dtype=object)
+        for (r, c), props in styler.ctx.items():
+            if props:
+                styles[r, c] = ' '.join(f'{name}: {value};' for name, value in props)
+    classes = extra_classes
+    if styler.cell_context:
+        classes = np.full((n_rows, n_cols), '', dtype=object) if classes is None else classes.copy()
+        for (r, c), class_name in styler.cell_context.items():
+            classes[r, c] = f"{classes[r, c]} {class_name}".strip()
+
+    display_funcs = styler._display_funcs
+    default = display_funcs.default_factory()
+    precision = default.keywords.get('precision') if isinstance(default, partial) else None
+    table_id = f"T_{uuid if uuid is not None else styler.uuid}"
+    return {
+        'data': styler.data,
+        'styles': styles,
+        'classes': classes,
+        'css': '\n'.join(filter(None, [_table_styles_css(styler.table_styles, table_id), extra_css])),
+        'table_id': table_id,
+        'table_attributes': styler.table_attributes or '',
+        'display_funcs': display_funcs,
+        # Columns with a custom Styler.format() are formatted cell by cell
+        'custom_columns': {c for (_, c) in display_funcs.keys()},
+        'precision': precision,
+        'escape': False,
+        'format_key': ('styler', repr(default.keywords) if isinstance(default, partial) else repr(default)),
+    }
+
+
+def cells_text(cells, rows, column):
+    """
+    Display strings of one column of table cells for the rows selected by
+    rows (a slice or an array of positions). Columns without a custom
+    Styler.format() are formatted in one vectorized call.
+    """
+    data = cells['data']
+    values = data.iloc[rows, column].to_numpy()
+    if column not in cells['custom_columns'] and cells['precision'] is not None:
+        return _default_text(values, cells['precision'], cells['escape'])
+    display_funcs = cells['display_funcs']
+    default = display_funcs.default_factory()
+    positions = np.arange(len(data))[rows]
+    return np.array(
+        [str(display_funcs.get((r, column), default)(value)) for r, value in zip(positions.tolist(), values)],
+        dtype=object,
+    )
+
+
+def render_cells_column(cells, rows, column):
+    """The <td> strings of one column of table cells for the selected rows."""
+    styles, classes = cells['styles'], cells['classes']
+    return _td_cells(
+        cells_text(cells, rows, column),
+        styles[rows, column] if styles is not None else None,
+        classes[rows, column] if classes is not None else None,
+    )
+
+
+def render_cells_rows(cells, rows):
+    """The <tr> strings of the selected rows of table cells, index cells included."""
+    data = cells['data']
+    column_cells = [render_cells_column(cells, rows, c) for c in range(data.shape[1])]
+    return _body_rows(data.index[rows], column_cells)
+
+
+def render_cells_html(cells):
+    """Write the full table HTML of table cells."""
+    return _table_html(cells['data'], render_cells_rows(cells, slice(None)), cells['css'], cells['table_id'],
+                       cells['table_attributes'])
+
+
+def cells_frame(cells):
+    """The table markup of table cells outside the body rows and the style sheet."""
+    return '\n'.join([_table_open(cells['table_id'], cells['table_attributes'])] + _header_rows(cells['data']))
+
+
+def cells_style(cells):
+    """The <style> block of table cells, '' without a style sheet."""
+    return _style_block(cells['css'])
+
+
+def _table_styles_css(table_styles, table_id):
+    rules = []
+    for style in table_styles or []:
+        props = style.get('props', [])
+        if isinstance(props, str):
+            declarations = props
+        else:
+            declarations = ' '.join(f'{name}: {value};' for name, value in props)
+        rules.append(f'#{table_id} {style["selector"]} {{ {declarations} }}')
+    return '\n'.join(rules)
+
+
+def render_styler_html(styler, uuid=None, extra_classes=None, extra_css=''):
+    """
+    Render a pandas Styler with the vectorized writer instead of Styler.to_html.
+
+    Returns None for Styler features the writer does not cover (see
+    styler_cells), in which case the caller should use Styler.to_html().
+    extra_classes (an object array of class names) and extra_css are added to
+    the Styler's own td classes and table styles.
+    """
+    cells = styler_cells(styler, uuid, extra_classes, extra_css)
+    return render_cells_html(cells) if cells is not None else None
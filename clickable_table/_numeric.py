@@ -0,0 +1,16 @@
+import pandas as pd
+
+
+def numeric_column(df, data_col):
+    """
+    Return a data column as a float array, or None when out of range.
+
+    Mirrors the frontend's parseNumericValue: a '%' suffix is stripped and
+    anything non-numeric becomes NaN.
+    """
+    if data_col < 0 or data_col >= df.shape[1]:
+        return None
+    column = df.iloc[:, data_col]
+    if not pd.api.types.is_numeric_dtype(column):
+        column = column.astype(str).str.replace('%', '', regex=False).str.strip()
+    return pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
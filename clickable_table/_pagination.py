@@ -0,0 +1,59 @@
+import math
+
+import streamlit as st
+
+_PAGE_STATE_PREFIX = "_clickable_table_page::"
+
+
+def _state_key(key):
+    return f"{_PAGE_STATE_PREFIX}{key if key is not None else ''}"
+
+
+def is_page_event(value):
+    """Return True if a component value is a page request rather than a cell click."""
+    return isinstance(value, dict) and value.get('event') == 'page'
+
+
+def current_page(key):
+    """
+    Return the page last requested for the table with this key.
+
+    When the component has a key, Streamlit keeps its latest value in
+    st.session_state[key], so a page request is picked up before rendering.
+    """
+    if key is not None and key in st.session_state:
+        value = st.session_state[key]
+        if is_page_event(value):
+            st.session_state[_state_key(key)] = int(value.get('page', 0))
+    return st.session_state.get(_state_key(key), 0)
+
+
+def set_page(key, page):
+    st.session_state[_state_key(key)] = int(page)
+
+
+def page_bounds(page, page_size, total_rows):
+    """
+    Clamp page to the valid range and return the page metadata sent to the
+    frontend, including the [start, end) row positions of the page.
+    """
+    page_count = max(1, math.ceil(total_rows / page_size))
+    page = min(max(int(page), 0), page_count - 1)
+    start = page * page_size
+    end = min(start + page_size, total_rows)
+    return {
+        'page': page,
+        'page_size': page_size,
+        'page_count': page_count,
+        'total_rows': total_rows,
+        'start': start,
+        'end': end,
+    }
+
+
+def rerun():
+    """Trigger a script rerun on both old and new Streamlit versions."""
+    if hasattr(st, 'rerun'):
+        st.rerun()
+    else:
+        st.experimental_rerun()
@@ -0,0 +1,83 @@
+import numpy as np
+
+from ._numeric import numeric_column
+
+# Config keys holding row-cell indices, per chart type. Fixed-scale indices are
+# shifted by one in the frontend (see fixed_scale_geometry).
+_CHART_INDEX_KEYS = {
+    'data_bar_chart_columns': ('col_idx', 'recommended_idx'),
+    'david_hum_columns': ('col_idx',),
+    'range_chart': ('col_idx', 'long_term_high_idx', 'long_term_low_idx',
+                    'short_term_high_idx', 'short_term_low_idx', 'current_idx'),
+}
+_FIXED_SCALE_INDEX_KEYS = ('col_idx', 'dot1_idx', 'dot2_idx', 'dot3_idx')
+
+
+def kept_columns(df, hidden_columns):
+    """Data column positions that remain after dropping the hidden data columns."""
+    index_cells = df.index.nlevels
+    hidden = {i - index_cells for i in hidden_columns if index_cells <= i < index_cells + df.shape[1]}
+    return [c for c in range(df.shape[1]) if c not in hidden]
+
+
+def reduce_hidden_columns(df, config):
+    """
+    Drop the hidden data columns from df before it is rendered.
+
+    Chart configs are rewritten for the narrower table. Hidden columns that a
+    chart reads from are not rendered but sent in a compact side channel:
+    they get row-cell indices past the last rendered cell, and the frontend
+    reads those indices from the side channel instead of from the row.
+
+    Returns (reduced_df, reduced_config, side_columns), where side_columns is
+    None when nothing is hidden, or a dict with 'start' (the first side
+    channel index), 'names' (header labels) and 'values' (one list of
+    numbers per column, None for non-numeric cells).
+    """
+    index_cells = df.index.nlevels
+    kept = kept_columns(df, config['hidden_columns'])
+    if len(kept) == df.shape[1]:
+        return df, config, None
+
+    hidden = set(range(df.shape[1])) - set(kept)
+    reduced_df = df.iloc[:, kept]
+    width = index_cells + len(kept)
+    new_cell = {index_cells + old: index_cells + new for new, old in enumerate(kept)}
+    side_cells = []
+
+    def remap(cell_idx):
+        if cell_idx is None or cell_idx < index_cells:
+            return cell_idx
+        if cell_idx in new_cell:
+            return new_cell[cell_idx]
+        if cell_idx not in side_cells:
+            side_cells.append(cell_idx)
+        return width + side_cells.index(cell_idx)
+
+    reduced_config = dict(config)
+    for chart_type, keys in _CHART_INDEX_KEYS.items():
+        reduced_config[chart_type] = [
+            {**chart, **{k: remap(chart[k]) for k in keys if k in chart}}
+            for chart in config[chart_type]
+        ]
+    reduced_config['fixed_scale_range_chart'] = [
+        {**chart, **{k: remap(chart[k] + 1) - 1 for k in _FIXED_SCALE_INDEX_KEYS if k in chart}}
+        for chart in config['fixed_scale_range_chart']
+    ]
+    # Index cells stay in the table, so hiding them is still done in the browser
+    reduced_config['hidden_columns'] = [i for i in config['hidden_columns'] if i < index_cells]
+    reduced_config['column_width'] = [
+        width_value for i, width_value in enumerate(config['column_width'])
+        if i - index_cells not in hidden
+    ]
+
+    values = []
+    for cell_idx in side_cells:
+        column = numeric_column(df, cell_idx - index_cells)
+        values.append(np.where(np.isnan(column), None, column).tolist())
+    side_columns = {
+        'start': width,
+        'names': [str(df.columns[cell_idx - index_cells]) for cell_idx in side_cells],
+        'values': values,
+    }
+    return reduced_df, reduced_config, side_columns
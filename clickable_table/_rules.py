@@ -0,0 +1,214 @@
+import numbers
+import re
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from ._numeric import numeric_column
+
+_OPERATORS = {
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+    '==': np.equal,
+    '!=': np.not_equal,
+}
+
+_RULE_TYPES = ('threshold', 'color_scale', 'in_set')
+
+_DEFAULT_SCALE_COLORS = ['#F8696B', '#FFFFFF', '#63BE7B']
+
+_HEX_COLOR = re.compile(r'#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})')
+
+
+def _has_column(columns, label):
+    try:
+        columns.get_loc(label)
+    except (KeyError, TypeError, pd.errors.InvalidIndexError):
+        return False
+    return True
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def _rule_error(rule, columns):
+    """Error message for one rule, without the style_rules[i] prefix, or None."""
+    rule_type = rule.get('type') if isinstance(rule, dict) else None
+    if rule_type not in _RULE_TYPES:
+        return f"unknown rule type {rule_type!r}. Expected one of {', '.join(_RULE_TYPES)}."
+    labels = rule.get('columns')
+    if labels is not None:
+        if not isinstance(labels, (list, tuple)):
+            return "'columns' must be a list of column labels"
+        for label in labels:
+            if not _has_column(columns, label):
+                return f"column {label!r} is not in the rendered table"
+    if rule_type in ('threshold', 'in_set'):
+        required = 'value' if rule_type == 'threshold' else 'values'
+        if required not in rule or 'style' not in rule:
+            return f"{rule_type} rules need '{required}' and 'style'"
+        if not isinstance(rule['style'], str):
+            return "'style' must be a string of CSS declarations"
+    if rule_type == 'threshold':
+        if rule.get('op') not in _OPERATORS:
+            return f"unknown op {rule.get('op')!r}. Expected one of {', '.join(_OPERATORS)}."
+        if not _is_number(rule['value']):
+            return f"threshold 'value' must be a number, got {rule['value']!r}"
+    elif rule_type == 'in_set':
+        values = rule['values']
+        if isinstance(values, (str, bytes)) or not isinstance(values, Iterable):
+            return f"in_set 'values' must be a list of cell values, got {values!r}"
+    elif rule_type == 'color_scale':
+        colors = rule.get('colors', _DEFAULT_SCALE_COLORS)
+        if not isinstance(colors, (list, tuple)) or len(colors) < 2:
+            return "color_scale rules need a list of at least 2 colors"
+        for color in colors:
+            if not isinstance(color, str) or not _HEX_COLOR.fullmatch(color):
+                return f"color {color!r} is not a hex color like '#F8696B' or '#F66'"
+        steps = rule.get('steps', 10)
+        if not isinstance(steps, numbers.Integral) or isinstance(steps, bool) or steps < 2:
+            return f"color_scale steps must be an integer of at least 2, got {steps!r}"
+        for bound in ('min', 'max'):
+            if bound in rule and not _is_number(rule[bound]):
+                return f"color_scale {bound!r} must be a number, got {rule[bound]!r}"
+        if not isinstance(rule.get('property', ''), str):
+            return "color_scale 'property' must be a CSS property name"
+    return None
+
+
+def validate_style_rules(rules, columns):
+    """
+    Return an error message for the first invalid rule, or None if all are
+    valid. columns are the column labels of the table as it is rendered.
+    """
+    if not isinstance(rules, (list, tuple)):
+        return "style_rules must be a list of rule dicts"
+    for i, rule in enumerate(rules):
+        error = _rule_error(rule, columns)
+        if error is not None:
+            return f"style_rules[{i}]: {error}"
+    return None
+
+
+def _rule_columns(df, rule, numeric):
+    """
+    Column positions a rule applies to. 'columns' holds column labels; a top
+    level label of MultiIndex columns selects all columns below it. Without
+    'columns', numeric rules apply to every numeric column and in_set rules
+    to every column.
+    """
+    labels = rule.get('columns')
+    if labels is None:
+        if numeric:
+            return [i for i, dtype in enumerate(df.dtypes) if pd.api.types.is_numeric_dtype(dtype)]
+        return list(range(df.shape[1]))
+
+    positions = []
+    for label in labels:
+        loc = df.columns.get_loc(label)
+        if isinstance(loc, slice):
+            positions.extend(range(*loc.indices(df.shape[1])))
+        elif isinstance(loc, np.ndarray):
+            positions.extend(np.flatnonzero(loc).tolist())
+        else:
+            positions.append(loc)
+    return positions
+
+
+def _hex_to_rgb(color):
+    color = color.lstrip('#')
+    if len(color) == 3:
+        color = ''.join(channel * 2 for channel in color)
+    return np.array([int(color[i:i + 2], 16) for i in (0, 2, 4)], dtype=float)
+
+
+def _scale_colors(colors, steps):
+    """Interpolate the anchor colors into one hex color per step."""
+    anchors = np.array([_hex_to_rgb(color) for color in colors])
+    anchor_positions = np.linspace(0, 1, len(anchors))
+    step_positions = np.linspace(0, 1, steps)
+    channels = [np.interp(step_positions, anchor_positions, anchors[:, i]) for i in range(3)]
+    rgb = np.rint(np.column_stack(channels)).astype(int)
+    return ['#{:02X}{:02X}{:02X}'.format(*color) for color in rgb]
+
+
+def _add_class(classes, mask, column, class_name):
+    """Append class_name to the cells of one column selected by mask."""
+    if mask.any():
+        classes[mask, column] = classes[mask, column] + (' ' + class_name)
+
+
+def evaluate_style_rules(df, rules):
+    """
+    Evaluate declarative styling rules with NumPy masks over whole columns.
+
+    Each rule maps to one CSS class (one per step for color scales), so the
+    HTML only carries class names and the declarations are written once in
+    a style sheet.
+
+    Returns (classes, css): an object array of space-separated class names
+    with the shape of df ('' for unstyled cells) and a list of
+    (selector, declarations) CSS rules.
+    """
+    n_rows, n_cols = df.shape
+    classes = np.full((n_rows, n_cols), '', dtype=object)
+    css = []
+
+    for i, rule in enumerate(rules):
+        rule_type = rule['type']
+        class_name = f"ct-rule{i}"
+
+        if rule_type == 'in_set':
+            allowed = list(rule['values'])
+            for c in _rule_columns(df, rule, numeric=False):
+                mask = df.iloc[:, c].isin(allowed).to_numpy(dtype=bool)
+                _add_class(classes, mask, c, class_name)
+            css.append((f".{class_name}", rule['style']))
+            continue
+
+        columns = _rule_columns(df, rule, numeric=True)
+        values = {c: numeric_column(df, c) for c in columns}
+
+        if rule_type == 'threshold':
+            compare = _OPERATORS[rule['op']]
+            for c in columns:
+                with np.errstate(invalid='ignore'):
+                    mask = compare(values[c], rule['value'])
+                _add_class(classes, mask, c, class_name)
+            css.append((f".{class_name}", rule['style']))
+
+        elif rule_type == 'color_scale':
+            steps = int(rule.get('steps', 10))
+            colors = _scale_colors(rule.get('colors', _DEFAULT_SCALE_COLORS), steps)
+            prop = rule.get('property', 'background-color')
+            stacked = np.concatenate([values[c] for c in columns]) if columns else np.array([])
+            # An infinite cell would stretch the scale over every other value
+            finite = stacked[np.isfinite(stacked)]
+            low = rule.get('min', finite.min() if finite.size else 0.0)
+            high = rule.get('max', finite.max() if finite.size else 0.0)
+            span = high - low if high != low else 1.0
+
+            for c in columns:
+                column = values[c]
+                valid = np.isfinite(column)
+                position = np.clip((column[valid] - low) / span, 0, 1)
+                buckets = np.full(n_rows, -1)
+                buckets[valid] = np.rint(position * (steps - 1)).astype(int)
+                for step in np.unique(buckets[valid]):
+                    _add_class(classes, buckets == step, c, f"{class_name}-{step}")
+            css.extend((f".{class_name}-{step}", f"{prop}: {color};") for step, color in enumerate(colors))
+
+    # Drop the separator in front of the first class of each cell
+    styled = classes != ''
+    classes[styled] = [names[1:] for names in classes[styled]]
+    return classes, css
+
+
+def style_sheet(css, table_id=None):
+    """Write (selector, declarations) rules as CSS, scoped to the table id if given."""
+    scope = f"#{table_id} " if table_id else ""
+    return '\n'.join(f"{scope}{selector} {{ {declarations} }}" for selector, declarations in css)
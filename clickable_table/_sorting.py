@@ -0,0 +1,188 @@
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from ._numeric import numeric_column
+
+_VIEW_STATE_PREFIX = "_clickable_table_view::"
+
+_NUMERIC_FILTER_RE = re.compile(r'^\s*(>=|<=|!=|>|<|=)\s*(-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*%?\s*$')
+
+_FILTER_OPERATORS = {
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+    '=': np.equal,
+    '!=': np.not_equal,
+}
+
+
+def _state_key(key):
+    return f"{_VIEW_STATE_PREFIX}{key if key is not None else ''}"
+
+
+def is_view_event(value):
+    """Return True if a component value is a sort or filter request rather than a cell click."""
+    return isinstance(value, dict) and value.get('event') in ('sort', 'filter')
+
+
+def empty_view():
+    return {'sort': None, 'filters': {}}
+
+
+def apply_view_event(key, value):
+    """
+    Store the sort or filter request in value for the table with this key.
+    Returns True if the view changed.
+    """
+    state = st.session_state.get(_state_key(key), empty_view())
+    view = {'sort': state['sort'], 'filters': dict(state['filters'])}
+    if value.get('event') == 'sort':
+        column = value.get('column')
+        view['sort'] = None if column is None else {
+            'column': int(column),
+            'ascending': bool(value.get('ascending', True)),
+        }
+    else:
+        view['filters'] = {
+            str(int(column)): str(text)
+            for column, text in (value.get('filters') or {}).items()
+            if str(text).strip()
+        }
+    if view == state:
+        return False
+    st.session_state[_state_key(key)] = view
+    return True
+
+
+def current_view(key):
+    """
+    Return the sort and filter state of the table with this key as
+    (view, changed). As with pagination, a request made in the browser is
+    picked up from st.session_state[key] before rendering.
+    """
+    changed = False
+    if key is not None and is_view_event(st.session_state.get(key)):
+        changed = apply_view_event(key, st.session_state[key])
+    return st.session_state.get(_state_key(key), empty_view()), changed
+
+
+class PermutationCache:
+    """
+    Bounded LRU cache of sort permutations, keyed by
+    (dataframe fingerprint, column, ascending). Shared across sessions.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            permutation = self._entries.get(key)
+            if permutation is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return permutation
+
+    def put(self, key, permutation):
+        with self._lock:
+            self._entries[key] = permutation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def sort_permutation(df, column, ascending):
+    """
+    Row positions that sort df by one data column. The sort is stable and
+    missing values come last in both directions. Numeric columns sort by
+    value, all others by their text.
+    """
+    series = df.iloc[:, column].reset_index(drop=True)
+    if not pd.api.types.is_numeric_dtype(series):
+        series = series.astype(str).where(series.notna())
+    ordered = series.sort_values(ascending=ascending, kind='mergesort', na_position='last')
+    return ordered.index.to_numpy()
+
+
+def filter_mask(df, filters):
+    """
+    Boolean mask of the rows matching every column filter. A filter like
+    '> 5', '<= -1.5' or '!= 0' compares the column's numeric values (with
+    the same parsing as the charts); any other text is a case-insensitive
+    substring match.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for column, text in filters.items():
+        column = int(column)
+        if column < 0 or column >= df.shape[1]:
+            continue
+        match = _NUMERIC_FILTER_RE.match(text)
+        if match:
+            values = numeric_column(df, column)
+            with np.errstate(invalid='ignore'):
+                mask &= _FILTER_OPERATORS[match.group(1)](values, float(match.group(2)))
+        else:
+            cells = df.iloc[:, column].astype(str)
+            mask &= cells.str.contains(text.strip(), case=False, regex=False).to_numpy(dtype=bool)
+    return mask
+
+
+def view_positions(df, view, fingerprint, cache):
+    """
+    Row positions of df in the sorted and filtered view, or None if the view
+    is the unchanged frame. Sort permutations of the full frame are cached, so
+    re-sorting by a column seen before is a single take.
+    """
+    sort = view['sort']
+    if sort is not None and not 0 <= sort['column'] < df.shape[1]:
+        sort = None
+    if sort is None and not view['filters']:
+        return None
+
+    positions = None
+    if sort is not None:
+        cache_key = (fingerprint, sort['column'], sort['ascending']) if fingerprint is not None else None
+        positions = cache.get(cache_key) if cache_key is not None else None
+        if positions is None:
+            positions = sort_permutation(df, sort['column'], sort['ascending'])
+            if cache_key is not None:
+                cache.put(cache_key, positions)
+
+    if view['filters']:
+        mask = filter_mask(df, view['filters'])
+        positions = np.flatnonzero(mask) if positions is None else positions[mask[positions]]
+    return positions
+
+
+def view_columns(df, kept):
+    """
+    The sortable columns as sent to the frontend: [cell, column, label] for
+    each rendered data column, where cell is its child index in a body row and
+    column its position in df. kept lists the rendered data column positions.
+    """
+    index_cells = df.index.nlevels
+    labels = df.columns
+    return [
+        [index_cells + cell, column, ' / '.join(map(str, labels[column])) if isinstance(labels[column], tuple)
+         else str(labels[column])]
+        for cell, column in enumerate(kept)
+    ]
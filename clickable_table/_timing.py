@@ -0,0 +1,109 @@
+import contextlib
+import json
+import logging
+import random
+import time
+
+logger = logging.getLogger("clickable_table")
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+def payload_size(html, html_compressed, diff):
+    """Bytes of table markup sent for one call: compressed HTML, HTML or the diff patch."""
+    if html_compressed is not None:
+        return len(html_compressed)
+    if html:
+        return len(html.encode('utf-8'))
+    if diff is not None and 'patch' in diff:
+        return len(json.dumps(diff['patch']).encode('utf-8'))
+    return 0
+
+
+class CallTimer:
+    """Collects the stage timings of one clickable_table() call."""
+
+    enabled = True
+
+    def __init__(self, hooks, key):
+        self.key = key
+        self.stages = {}
+        self.info = {}
+        self._hooks = hooks
+        self._start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time the block and add it to the stage name, in milliseconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def finish(self):
+        """Report the call to the callback and the logger, and return the record."""
+        record = {
+            'key': self.key,
+            'total_ms': (time.perf_counter() - self._start) * 1000,
+            'stages_ms': dict(self.stages),
+            **self.info,
+        }
+        logger.debug(
+            "clickable_table %r timings: %.1f ms total, %s, %s",
+            self.key, record['total_ms'],
+            ', '.join(f"{name} {ms:.1f} ms" for name, ms in record['stages_ms'].items()),
+            ', '.join(f"{name}={value}" for name, value in self.info.items()),
+        )
+        callback = self._hooks.callback
+        if callback is not None:
+            try:
+                callback(record)
+            except Exception:
+                # Instrumentation must never break the table
+                logger.exception("clickable_table timing callback failed")
+        return record
+
+
+class _NullTimer:
+    """Stand-in for CallTimer when a call is not timed."""
+
+    enabled = False
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def finish(self):
+        return None
+
+
+NULL_TIMER = _NullTimer()
+
+
+class TimingHooks:
+    """
+    Process-wide switch for server-side timing of clickable_table() calls.
+
+    A call is timed when ``callback`` is set or the "clickable_table" logger is
+    enabled for DEBUG, and then only for a ``sample_rate`` fraction of calls.
+    Untimed calls only pay for the check.
+
+    Each timed call reports a dict with 'key', 'total_ms', 'stages_ms' (time
+    per stage: 'sort_filter', 'config', 'styling_function', 'html', 'diff',
+    'compression', 'geometry', 'component'; only stages that ran are present, and 'html'
+    includes 'styling_function'), 'rows', 'columns', 'payload',
+    'payload_bytes' and 'cache_hit'. The record is passed to ``callback`` and
+    logged at DEBUG level.
+    """
+
+    def __init__(self, callback=None, sample_rate=1.0):
+        self.callback = callback
+        self.sample_rate = sample_rate
+
+    def start(self, key):
+        """Return a CallTimer for a sampled call, or NULL_TIMER."""
+        if self.callback is None and not logger.isEnabledFor(logging.DEBUG):
+            return NULL_TIMER
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return NULL_TIMER
+        return CallTimer(self, key)
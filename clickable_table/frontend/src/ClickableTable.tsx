@@ -1,7 +1,7 @@
 import {
+  ArrowTable,
   Streamlit,
   StreamlitComponentBase,
-  withStreamlitConnection,
 } from "streamlit-component-lib"
 import React, { ReactNode } from "react"
 import "./app.css"
@@ -19,6 +19,7 @@ interface DataBarParams {
   max: number
   recommended_idx?: number
   line_color?: string
+  renderer?: 'dom' | 'canvas'
 }
 
 interface DavidHumParams {
@@ -26,6 +27,7 @@ interface DavidHumParams {
   min: number
   max: number
   exception_col_color: string
+  renderer?: 'dom' | 'canvas'
 }
 
 interface RangeChartParams {
@@ -40,6 +42,7 @@ interface RangeChartParams {
   current_color: string
   low_text?: string
   high_text?: string
+  renderer?: 'dom' | 'canvas'
 }
 
 interface FixedScaleChartParams {
@@ -55,6 +58,171 @@ interface FixedScaleChartParams {
   line_color?: string
   line_height?: number
   tick_marks?: boolean
+  tick_axis?: 'row' | 'header'
+  renderer?: 'dom' | 'canvas'
+}
+
+// Chart geometry precomputed in Python (precompute_geometry=True) or in the
+// geometry worker (geometry_worker=True, typed arrays with NaN for missing values).
+// Arrays are indexed by body row position; null stands for NaN.
+type GeometryValues = ArrayLike<number | null>
+
+interface DataBarGeometry {
+  width: GeometryValues
+  negative: ArrayLike<number>
+  marker?: GeometryValues
+  value?: GeometryValues
+  recommended?: GeometryValues
+}
+
+interface DavidHumGeometry {
+  width: GeometryValues
+  value?: GeometryValues
+}
+
+interface RangeChartGeometry {
+  long_low: GeometryValues
+  long_high: GeometryValues
+  short_low: GeometryValues
+  short_high: GeometryValues
+  current: GeometryValues
+  state: ArrayLike<number>
+}
+
+interface FixedScaleGeometry {
+  dots: GeometryValues[]
+  values?: GeometryValues[]
+}
+
+interface ChartGeometry {
+  data_bar_chart_columns: DataBarGeometry[]
+  david_hum_columns: DavidHumGeometry[]
+  range_chart: RangeChartGeometry[]
+  fixed_scale_range_chart: FixedScaleGeometry[]
+}
+
+// Diff-mode patch against the previously rendered rows (diff_updates=True).
+// Row positions in removed refer to the old rows, all others to the new rows.
+interface TablePatch {
+  removed: number[]
+  added: [number, string][]
+  rows: [number, string][]
+  cells: [number, [number, string][]][]
+  style: string | null
+}
+
+interface DiffInfo {
+  version: number
+  base?: number
+  patch?: TablePatch
+}
+
+// Hidden columns dropped on the Python side (drop_hidden_columns=True) that
+// charts read from. Column k is addressed by child index start + k.
+type SideColumnValues = (number | null)[]
+
+interface SideColumns {
+  start: number
+  names: string[]
+  values: SideColumnValues[]
+}
+
+interface PageInfo {
+  page: number
+  page_size: number
+  page_count: number
+  total_rows: number
+  start: number
+  end: number
+}
+
+// Sort and filter state of a sortable/filterable table. Columns are data
+// column positions in the DataFrame; each entry of columns maps a rendered
+// cell index to its column and header label.
+interface SortInfo {
+  column: number
+  ascending: boolean
+}
+
+interface ViewInfo {
+  sort: SortInfo | null
+  filters: { [column: string]: string }
+  columns: [number, number, string][]
+  total_rows: number
+  rows: number
+}
+
+interface DecorationContext {
+  headers: NodeListOf<Element>
+  indexOffset: number
+  dataBarChartColumns?: DataBarParams[]
+  davidHumColumns?: DavidHumParams[]
+  rangeChartColumns?: RangeChartParams[]
+  fixedScaleRangeCharts?: FixedScaleChartParams[]
+  dataBarSignatures: string[]
+  davidHumSignatures: string[]
+  rangeChartSignatures: string[]
+  fixedScaleSignatures: string[]
+  geometry: ChartGeometry | null
+  barRounded: boolean
+}
+
+// Raw values of one column sent to the geometry worker: numbers, or the cell
+// texts as UTF-8 separated by GEOMETRY_CELL_SEPARATOR
+interface GeometryColumn {
+  childIdx: number
+  numbers?: Float64Array
+  text?: Uint8Array
+}
+
+interface GeometryRequest {
+  id: number
+  callback: (geometry: ChartGeometry | null) => void
+}
+
+// A decoration pass split into frame-budgeted chunks (decoration_budget_ms)
+interface DecorationTask {
+  rows: HTMLTableRowElement[]
+  order: number[]
+  next: number
+  context: DecorationContext
+  budget: number
+  done: () => void
+}
+
+// Timings of the latest render and decoration pass (debug_metrics=True),
+// in milliseconds. Also recorded as clickable_table:* performance measures.
+interface ChartTimings {
+  data_bar: number
+  david_hum: number
+  range_chart: number
+  fixed_scale: number
+}
+
+interface DebugMetrics {
+  render_ms: number
+  decorate_ms: number
+  chart_ms: ChartTimings
+  column_width_ms: number
+  hidden_columns_ms: number
+  cells_decorated: number
+  nodes_created: number
+}
+
+interface HeaderColumn {
+  label: string
+  path: string[]
+}
+
+interface HeaderMap {
+  thead: HTMLTableSectionElement
+  rowCount: number
+  columns: HeaderColumn[]
+}
+
+interface CellOriginal {
+  text: string
+  className: string
 }
 
 interface TooltipData {
@@ -64,6 +232,36 @@ interface TooltipData {
   recommendedValue: number
 }
 
+// A chart cell drawn on the canvas overlay (renderer: 'canvas') instead of
+// with nested divs. Positions are percentages of the chart width, as in the DOM charts.
+type CanvasChart =
+  | { kind: 'data_bar', width: number, negative: boolean, marker: number, text: string, rounded: boolean }
+  | { kind: 'david_hum', width: number, text: string, rounded: boolean }
+  | { kind: 'range', text: string | null, positions: number[], color: string, rounded: boolean }
+  | {
+      kind: 'fixed_scale', min: number, max: number, ticks: boolean, dots: { position: number, color: string }[],
+      lineColor: string, lineHeight: number, rounded: boolean
+    }
+
+// Chart geometry shared by the DOM and canvas renderers, in pixels (see app.css)
+const CHART_BAR_HEIGHT = 18;
+const CHART_RADIUS = 9;
+const DAVID_HUM_HEIGHT = 20;
+const FIXED_SCALE_HEIGHT = 40;
+const MARKER_COLOR = '#9CA3AF';
+const BAND_COLOR = '#6B7280';
+
+/** Adds a rectangle with rounded corners (radius clamped to the size) to the current path. */
+function roundedRectPath(ctx: CanvasRenderingContext2D, x: number, y: number, w: number, h: number, r: number): void {
+  const radius = Math.max(0, Math.min(r, w / 2, h / 2));
+  ctx.moveTo(x + radius, y);
+  ctx.arcTo(x + w, y, x + w, y + h, radius);
+  ctx.arcTo(x + w, y + h, x, y + h, radius);
+  ctx.arcTo(x, y + h, x, y, radius);
+  ctx.arcTo(x, y, x + w, y, radius);
+  ctx.closePath();
+}
+
 function adjustColor(hex: string, percent: number) {
   hex = hex.replace(/^\s*#|\s*$/g, '');
 
@@ -86,13 +284,186 @@ function adjustColor(hex: string, percent: number) {
   return "#" + rr + gg + bb;
 }
 
+function escapeHtml(text: string): string {
+  return text
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;');
+}
+
+function emptyMetrics(): DebugMetrics {
+  return {
+    render_ms: 0,
+    decorate_ms: 0,
+    chart_ms: { data_bar: 0, david_hum: 0, range_chart: 0, fixed_scale: 0 },
+    column_width_ms: 0,
+    hidden_columns_ms: 0,
+    cells_decorated: 0,
+    nodes_created: 0
+  };
+}
+
+// Numeric column filters like '> 5' or '<= -1.5' (same syntax as in Python)
+const NUMERIC_FILTER_RE = /^\s*(>=|<=|!=|>|<|=)\s*(-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*%?\s*$/;
+
+function compareNumber(value: number, op: string, target: number): boolean {
+  switch (op) {
+    case '>': return value > target;
+    case '>=': return value >= target;
+    case '<': return value < target;
+    case '<=': return value <= target;
+    case '=': return value === target;
+    default: return value !== target;
+  }
+}
+
+// Virtualized rows: estimated row height before measuring, and how many
+// rows to keep attached above and below the viewport
+const VIRTUAL_DEFAULT_ROW_HEIGHT = 30;
+const VIRTUAL_OVERSCAN_ROWS = 20;
+const VIRTUAL_DEFAULT_COLUMN_WIDTH = 100;
+const VIRTUAL_OVERSCAN_COLUMNS = 3;
+
+// Separates cell texts in the buffers sent to the geometry worker
+const GEOMETRY_CELL_SEPARATOR = '\u001f';
+
+// Arrow type ids (apache-arrow `Type` enum) that hold plain numbers
+const ARROW_TYPE_INT = 2;
+const ARROW_TYPE_FLOAT = 3;
+
+// Numbers the mounted tables, for their instance classes
+let instanceCount = 0;
+
 class ClickableTable extends StreamlitComponentBase<State> {
   public state = { key: "", cellValue: "", header: "", rowIndex: -2 }
 
+  // The scroll container of this table. clickable_tables() renders several
+  // tables in one document, so DOM lookups and generated styles are scoped
+  // to this container and its instance class.
+  private containerRef = React.createRef<HTMLDivElement>()
+  private instanceClass = `ct-table-${++instanceCount}`
+
+  // Arrow payload: the table the HTML was built from, the generated HTML,
+  // and typed numeric values per data column (null for non-numeric columns)
+  private arrowSource: ArrowTable | null = null
+  private arrowHtml = ""
+  private columnValues: (Float64Array | null)[] | null = null
+  private headerColumnCount = 1
+
+  // Virtualized rows: all body rows (detached), the live <tbody>, spacer rows
+  // and the currently attached [start, end) window
+  private tableHostRef = React.createRef<HTMLDivElement>()
+  private filterColumnRef = React.createRef<HTMLSelectElement>()
+  private filterTextRef = React.createRef<HTMLInputElement>()
+  private virtualRows: HTMLTableRowElement[] = []
+  private virtualSourceKey = ""
+  private virtualTbody: HTMLTableSectionElement | null = null
+  private virtualTopSpacer: HTMLTableRowElement | null = null
+  private virtualBottomSpacer: HTMLTableRowElement | null = null
+  private virtualContext: DecorationContext | null = null
+  private virtualRowHeight = 0
+  private virtualRange = { start: -1, end: -1 }
+  private virtualScrollFrame: number | null = null
+
+  // Virtualized columns: the table and host they were set up for, each
+  // column's width (estimated until measured), the number of sticky leading
+  // columns and the displayed [start, end) window. Columns outside the
+  // window are hidden by the rules in columnStyle, not removed from the DOM.
+  private columnTable: HTMLTableElement | null = null
+  private columnHost: HTMLElement | null = null
+  private columnConfigKey = ""
+  private columnWidths: number[] = []
+  private columnMeasured: boolean[] = []
+  private columnPinned = 0
+  private columnWindow = { start: -1, end: -1 }
+  private columnStyle: HTMLStyleElement | null = null
+  private columnScrollFrame: number | null = null
+
+  // Incremental decoration: the html/config last decorated, each decorated
+  // cell's signature and original content, and cells touched in the last pass
+  private decoratedHtml: string | null = null
+  private decoratedConfigKey = ""
+  private decoratedHiddenClass = ""
+  private cellDecorations = new WeakMap<HTMLElement, string>()
+  private cellOriginals = new WeakMap<HTMLElement, CellOriginal>()
+  private decoratedCells = new Set<HTMLElement>()
+  private cellsTouched = 0
+  private decorationTask: DecorationTask | null = null
+  private decorationFrame: number | null = null
+
+  // Chart geometry computed off the main thread (geometry_worker=True)
+  private geometryWorker: Worker | null = null
+  private geometryWorkerFailed = false
+  private geometryRequestId = 0
+  private pendingGeometry: GeometryRequest | null = null
+
+  // Tooltips: one pooled element, shown by delegated mouse handlers using
+  // the per-cell data registered by attachTooltip
+  private tooltipElement: HTMLElement | null = null
+  private tooltipData = new WeakMap<HTMLElement, TooltipData>()
+  private tooltipCell: HTMLElement | null = null
+
+  // Compressed html arg and its inflated text, once DecompressionStream is done
+  private compressedSource: Uint8Array | null = null
+  private decompressedHtml: string | null = null
+  // Html of the last render, kept on screen while a new payload is inflated
+  private renderedHtml = ""
+
+  // Diff mode: last full html and the version of the rows on screen
+  private diffBaseHtml: string | null = null
+  private diffVersion = 0
+  private diffPatched = false
+  private resyncVersion = 0
+  // Bumped to remount the table markup after patched rows are replaced
+  private tableGeneration = 0
+
+  // Tick-mark subtrees per fixed scale, cloned instead of rebuilt per row
+  private tickTemplates: Map<string, HTMLElement> = new Map()
+
+  // Canvas renderer: paint data per chart cell, drawn for the visible rows
+  // into one overlay canvas pinned to the scroll viewport
+  private canvasRef = React.createRef<HTMLCanvasElement>()
+  private canvasCharts = new WeakMap<HTMLElement, CanvasChart>()
+  private canvasFrame: number | null = null
+
+  // Performance metrics: per-chart timings and node counts are only collected
+  // with debug_metrics=True; the top-level performance measures are always set
+  private metricsEnabled = false
+  private metrics: DebugMetrics = emptyMetrics()
+
+  // Client-side sort and filter (sort_mode="client"): the rows in their
+  // original order and the column values, parsed once per table. The sort
+  // column and filter keys are cell indices of the rendered rows.
+  private clientRows: HTMLTableRowElement[] | null = null
+  private clientSourceKey: string | null = null
+  private clientSort: SortInfo | null = null
+  private clientFilters: { [cell: string]: string } = {}
+  private clientVisibleRows = 0
+  private clientNumbers = new Map<number, Float64Array>()
+  private clientTexts = new Map<number, string[]>()
+
+  // Header labels by cellIndex, rebuilt after each render so clicks need no DOM queries
+  private headerMap: HeaderMap | null = null
+
   // ========================================
   // Utility Methods
   // ========================================
 
+  private queryContainer(selector: string): Element | null {
+    const container = this.containerRef.current;
+    return container ? container.querySelector(selector) : null;
+  }
+
+  /**
+   * Sends a click or a request to Python. Tables rendered by clickable_tables()
+   * add their table name, so the value reaches the right table.
+   */
+  private sendValue(value: { [name: string]: any }): void {
+    const table = this.props.args["table"];
+    Streamlit.setComponentValue(table !== undefined ? { ...value, table } : value);
+  }
+
   private setElementStyles(element: HTMLElement, styles: Partial<CSSStyleDeclaration>): void {
     Object.keys(styles).forEach(key => {
       (element.style as any)[key] = (styles as any)[key];
@@ -119,6 +490,70 @@ class ClickableTable extends StreamlitComponentBase<State> {
     return { headers: tableContainer.querySelectorAll('th'), theadRows: null };
   }
 
+  /** The colspan a header cell was rendered with; column virtualization narrows the live one. */
+  private headerColSpan(cell: HTMLTableCellElement): number {
+    return cell.dataset.colspan !== undefined ? Number(cell.dataset.colspan) : cell.colSpan;
+  }
+
+  /**
+   * Maps each cellIndex to its bottom-level header label and its full header
+   * path (one label per header row; upper MultiIndex rows are expanded by
+   * colspan). Built once per rendered table from textContent, so resolving a
+   * click needs neither selector queries nor a layout read.
+   */
+  private buildHeaderMap(table: Element | null): void {
+    const thead = table ? table.querySelector('thead') : null;
+    if (!thead || thead.rows.length === 0) {
+      this.headerMap = null;
+      return;
+    }
+
+    const rows = Array.from(thead.rows);
+    const lastRow = rows[rows.length - 1];
+    const columns: HeaderColumn[] = Array.from(lastRow.cells).map(cell => ({
+      label: (cell.textContent || '').trim(),
+      path: []
+    }));
+    rows.forEach((row, rowIdx) => {
+      let col = 0;
+      Array.from(row.cells).forEach(cell => {
+        const text = (cell.textContent || '').trim();
+        const span = this.headerColSpan(cell);
+        for (let i = 0; i < span && col < columns.length; i++, col++) {
+          columns[col].path[rowIdx] = text;
+        }
+      });
+    });
+    columns.forEach(column => {
+      for (let rowIdx = 0; rowIdx < rows.length; rowIdx++) {
+        if (column.path[rowIdx] === undefined) column.path[rowIdx] = '';
+      }
+    });
+
+    this.headerMap = { thead, rowCount: rows.length, columns };
+  }
+
+  /** The header map of the table containing cell, rebuilt if the table was replaced. */
+  private getHeaderMap(cell: HTMLTableCellElement): HeaderMap | null {
+    if (!this.headerMap || !this.headerMap.thead.isConnected) {
+      this.buildHeaderMap(cell.closest('table'));
+    }
+    return this.headerMap;
+  }
+
+  /**
+   * Sets CSS custom properties in a single style write. Chart elements get
+   * their static styles from app.css classes and only per-cell values here.
+   */
+  private setCssVars(element: HTMLElement, vars: { [name: string]: string }): void {
+    element.style.cssText = Object.keys(vars).map(name => `${name}:${vars[name]}`).join(';');
+  }
+
+  private geometryValue(values: GeometryValues | undefined, rowPos: number): number {
+    const value = values ? values[rowPos] : null;
+    return value === null || value === undefined ? NaN : value;
+  }
+
   private getLeftPosition(value: number, min: number, max: number): number {
     return ((value - min) / (max - min)) * 98;
   }
@@ -136,230 +571,268 @@ class ClickableTable extends StreamlitComponentBase<State> {
     return parseFloat(cellContent);
   }
 
+  /**
+   * Returns the side channel column for childIdx, or null when childIdx is a
+   * rendered cell. Hidden columns dropped on the Python side keep chart
+   * indices past the last rendered cell.
+   */
+  private sideColumn(childIdx: number): SideColumnValues | null {
+    const side: SideColumns | undefined = this.props.args.side_columns;
+    if (!side || childIdx < side.start) return null;
+    return side.values[childIdx - side.start] || null;
+  }
+
+  /**
+   * Returns the numeric value of row.children[childIdx].
+   * Dropped hidden columns are read from the side channel at rowPos. With the
+   * arrow payload, numeric columns are read straight from the typed column
+   * arrays; otherwise (or for non-numeric columns) the cell text is parsed.
+   */
+  private readCellNumber(row: Element, childIdx: number, rowPos: number): number {
+    const sideValues = this.sideColumn(childIdx);
+    if (sideValues) {
+      const value = sideValues[rowPos];
+      return value === null || value === undefined ? NaN : value;
+    }
+    const dataRow = (row as HTMLElement).dataset ? (row as HTMLElement).dataset.row : undefined;
+    if (this.columnValues && dataRow !== undefined) {
+      const values = this.columnValues[childIdx - this.headerColumnCount];
+      if (values) {
+        return values[Number(dataRow)];
+      }
+    }
+    return this.parseNumericValue(row.children[childIdx]?.textContent || '0');
+  }
+
   // ========================================
-  // Data Bar Chart Methods
+  // Arrow Payload Methods
   // ========================================
 
-  private createDataBarContainer(): HTMLElement {
-    const container = document.createElement('div');
-    this.setElementStyles(container, {
-      position: 'relative',
-      width: '100%',
-      height: '18px'
-    });
-    return container;
+  private formatArrowValue(value: any): string {
+    if (value === null || value === undefined) return '';
+    if (value instanceof Date) return value.toISOString();
+    return String(value);
   }
 
-  private createBar(width: number, isNegative: boolean, barRounded: boolean): HTMLElement {
-    const bar = document.createElement('div');
+  private toFloat64Array(vector: any, typeId: number): Float64Array | null {
+    if (!vector || (typeId !== ARROW_TYPE_INT && typeId !== ARROW_TYPE_FLOAT)) return null;
+    // Half-precision floats come back as raw Uint16 bits
+    if (typeId === ARROW_TYPE_FLOAT && vector.type && vector.type.precision === 0) return null;
 
-    const styles: Partial<CSSStyleDeclaration> = {
-      position: 'absolute',
-      height: '18px',
-      top: '0',
-      width: `${width}%`,
-      opacity: '60%',
-      borderRadius: barRounded ? '9px' : '0px'
-    };
+    const raw = vector.toArray();
+    if (!ArrayBuffer.isView(raw) || raw instanceof DataView) return null;
 
-    if (isNegative) {
-      styles.right = '50%';
-      styles.left = 'auto';
-      styles.backgroundColor = 'var(--neg-color)';
-    } else {
-      styles.left = '50%';
-      styles.right = 'auto';
-      styles.backgroundColor = 'var(--pos-color)';
-    }
+    const values = raw instanceof Float64Array && vector.nullCount === 0
+      ? raw
+      : Float64Array.from(raw as any, Number);
 
-    this.setElementStyles(bar, styles);
-    return bar;
+    if (vector.nullCount > 0) {
+      for (let i = 0; i < values.length; i++) {
+        if (!vector.isValid(i)) values[i] = NaN;
+      }
+    }
+    return values;
   }
 
-  private createBarText(cellContent: string, isNegative: boolean): HTMLElement {
-    const textContainer = document.createElement('div');
+  /**
+   * Builds the table markup from an Arrow-serialized DataFrame, mirroring the
+   * structure of pandas to_html (index <th> cells, colspan group headers for
+   * MultiIndex columns) so the chart decoration code works unchanged.
+   * Each body row carries data-row with its DataFrame row position.
+   */
+  private buildArrowTableHtml(table: ArrowTable): string {
+    const { headerRows, headerColumns, dataRows, dataColumns } = table;
+    const parts: string[] = ['<table class="dataframe"><thead>'];
+
+    const headerLabel = (level: number, col: number): string =>
+      this.formatArrowValue(table.getCell(level, headerColumns + col).content);
+
+    for (let level = 0; level < headerRows; level++) {
+      const isBottom = level === headerRows - 1;
+      parts.push('<tr>');
+      for (let c = 0; c < headerColumns; c++) {
+        parts.push(`<th class="blank level${level}"></th>`);
+      }
 
-    const styles: Partial<CSSStyleDeclaration> = {
-      position: 'absolute',
-      zIndex: '100',
-      padding: '0 5px'
-    };
+      let col = 0;
+      while (col < dataColumns) {
+        const label = headerLabel(level, col);
+        let span = 1;
+        if (!isBottom) {
+          // Merge adjacent columns sharing this label and all parent labels
+          while (col + span < dataColumns) {
+            let same = true;
+            for (let l = 0; l <= level && same; l++) {
+              same = headerLabel(l, col + span) === headerLabel(l, col);
+            }
+            if (!same) break;
+            span++;
+          }
+        }
+        const colspan = span > 1 ? ` colspan="${span}"` : '';
+        parts.push(`<th class="col_heading level${level} col${col}"${colspan}>${escapeHtml(label)}</th>`);
+        col += span;
+      }
+      parts.push('</tr>');
+    }
+    parts.push('</thead><tbody>');
 
-    if (isNegative) {
-      styles.left = 'auto';
-      styles.right = '5px';
-      styles.textAlign = 'right';
-    } else {
-      styles.right = 'auto';
-      styles.left = '5px';
-      styles.textAlign = 'left';
+    const dataTable: any = table.table;
+    const dataVectors: any[] = [];
+    for (let c = 0; c < dataColumns; c++) {
+      dataVectors.push(dataTable.getChildAt(c));
+    }
+
+    for (let r = 0; r < dataRows; r++) {
+      parts.push(`<tr data-row="${r}">`);
+      for (let c = 0; c < headerColumns; c++) {
+        const label = this.formatArrowValue(table.getCell(headerRows + r, c).content);
+        parts.push(`<th class="row_heading level${c} row${r}">${escapeHtml(label)}</th>`);
+      }
+      for (let c = 0; c < dataColumns; c++) {
+        const vector = dataVectors[c];
+        const text = vector ? this.formatArrowValue(vector.get(r)) : '';
+        parts.push(`<td class="data row${r} col${c}">${escapeHtml(text)}</td>`);
+      }
+      parts.push('</tr>');
+    }
+    parts.push('</tbody></table>');
+    return parts.join('');
+  }
+
+  /**
+   * Returns the HTML for the arrow payload, rebuilding it (and the typed
+   * column arrays) only when a new table arrives from Python.
+   */
+  private getArrowHtml(table: ArrowTable): string {
+    if (table === this.arrowSource) return this.arrowHtml;
+
+    const dataTable: any = table.table;
+    const fields = dataTable.schema.fields;
+    const columnValues: (Float64Array | null)[] = [];
+    for (let c = 0; c < table.dataColumns; c++) {
+      columnValues.push(this.toFloat64Array(dataTable.getChildAt(c), fields[c].type.typeId));
     }
 
-    this.setElementStyles(textContainer, styles);
+    this.arrowSource = table;
+    this.arrowHtml = this.buildArrowTableHtml(table);
+    this.columnValues = columnValues;
+    this.headerColumnCount = table.headerColumns;
+    return this.arrowHtml;
+  }
+
+  // ========================================
+  // Data Bar Chart Methods
+  // ========================================
+
+  private createDataBarContainer(barRounded: boolean): HTMLElement {
+    const container = document.createElement('div');
+    container.className = barRounded ? 'ct-data-bar' : 'ct-data-bar ct-square';
+    return container;
+  }
+
+  private createBar(width: number, isNegative: boolean): HTMLElement {
+    const bar = document.createElement('div');
+    bar.className = isNegative ? 'ct-data-bar-fill ct-negative' : 'ct-data-bar-fill ct-positive';
+    this.setCssVars(bar, { '--ct-width': `${width}%` });
+    return bar;
+  }
+
+  private createBarText(cellContent: string, isNegative: boolean): HTMLElement {
+    const textContainer = document.createElement('div');
+    textContainer.className = isNegative ? 'ct-data-bar-text ct-negative' : 'ct-data-bar-text ct-positive';
     textContainer.textContent = cellContent.trim();
     return textContainer;
   }
 
-  private createRecommendationMarker(
+  private getMarkerPosition(
     recommendedValue: number,
     scaleFactorLeft: number,
-    scaleFactorRight: number,
-    textContainer: HTMLElement
-  ): { horizontalLine: HTMLElement; verticalMarker: HTMLElement } | null {
-    if (isNaN(recommendedValue)) return null;
-
-    let markerPosition: number;
-
+    scaleFactorRight: number
+  ): number {
     if (recommendedValue < 0) {
-      markerPosition = 50 - Math.abs(recommendedValue) * scaleFactorLeft;
-    } else {
-      markerPosition = 50 + (recommendedValue * scaleFactorRight);
+      return 50 - Math.abs(recommendedValue) * scaleFactorLeft;
     }
+    return 50 + (recommendedValue * scaleFactorRight);
+  }
+
+  private createRecommendationMarker(
+    markerPosition: number,
+    textContainer: HTMLElement
+  ): { horizontalLine: HTMLElement; verticalMarker: HTMLElement } | null {
+    if (isNaN(markerPosition)) return null;
 
     const horizontalLine = document.createElement('div');
     const lineStart = Math.min(markerPosition, 50);
     const lineEnd = Math.max(markerPosition, 50);
 
-    this.setElementStyles(horizontalLine, {
-      position: 'absolute',
-      top: '9px',
-      height: '2px',
-      backgroundColor: '#9CA3AF',
-      zIndex: '45',
-      left: `${lineStart}%`,
-      width: `${lineEnd - lineStart}%`
+    horizontalLine.className = 'ct-recommended-line';
+    this.setCssVars(horizontalLine, {
+      '--ct-left': `${lineStart}%`,
+      '--ct-width': `${lineEnd - lineStart}%`
     });
 
     const verticalMarker = document.createElement('div');
-    this.setElementStyles(verticalMarker, {
-      position: 'absolute',
-      width: '2px',
-      height: '12px',
-      backgroundColor: '#9CA3AF',
-      top: '5px',
-      left: `${markerPosition}%`,
-      transform: 'translateX(-50%)',
-      zIndex: '50'
-    });
+    verticalMarker.className = 'ct-recommended-marker';
+    this.setCssVars(verticalMarker, { '--ct-left': `${markerPosition}%` });
 
     // Flip text position based on marker location
-    if (markerPosition <= 50) {
-      this.setElementStyles(textContainer, {
-        left: '52%',
-        right: 'auto',
-        textAlign: 'left'
-      });
-    } else {
-      this.setElementStyles(textContainer, {
-        right: '52%',
-        left: 'auto',
-        textAlign: 'right'
-      });
-    }
+    textContainer.className = markerPosition <= 50
+      ? 'ct-data-bar-text ct-flip-left'
+      : 'ct-data-bar-text ct-flip-right';
 
     return { horizontalLine, verticalMarker };
   }
 
-  private attachTooltip(cell: HTMLElement, data: TooltipData): void {
-    const tooltip = document.createElement('div');
-    tooltip.className = 'data-bar-tooltip';
-
-    this.setElementStyles(tooltip, {
-      display: 'none',
-      position: 'absolute',
-      backgroundColor: 'rgba(218, 218, 218, 0.76)',
-      color: 'black',
-      padding: '5px 10px',
-      marginTop: '-20px',
-      marginLeft: '120px',
-      borderRadius: '5px',
-      zIndex: '1000',
-      whiteSpace: 'nowrap',
-      pointerEvents: 'none'
-    });
-
-    tooltip.innerHTML = `${data.columnName}: ${data.value}<br>${data.recommendedColumnName}: ${data.recommendedValue}`;
-    document.body.appendChild(tooltip);
-
-    cell.addEventListener('mouseover', () => {
-      const rect = cell.getBoundingClientRect();
-      tooltip.style.left = `${rect.left + window.scrollX + rect.width/2}px`;
-      tooltip.style.top = `${rect.top + window.scrollY - tooltip.offsetHeight - 5}px`;
-      tooltip.style.transform = 'translateX(-50%)';
-      tooltip.style.display = 'block';
-    });
-
-    cell.addEventListener('mouseout', () => {
-      tooltip.style.display = 'none';
-    });
-
-    const observer = new MutationObserver((mutations) => {
-      mutations.forEach((mutation) => {
-        if (mutation.removedNodes) {
-          mutation.removedNodes.forEach((node) => {
-            if (node === cell || cell.contains(node as Node)) {
-              document.body.removeChild(tooltip);
-              observer.disconnect();
-            }
-          });
-        }
-      });
-    });
-
-    observer.observe(cell.parentElement || document.body, {
-      childList: true,
-      subtree: true
-    });
-  }
-
   private createDataBarChart(
     cell: HTMLElement,
     params: DataBarParams,
     cellContent: string,
     headers: NodeListOf<Element>,
     row: Element,
-    barRounded: boolean
+    barRounded: boolean,
+    geometry: DataBarGeometry | null,
+    rowPos: number
   ): void {
     const { min, max, recommended_idx } = params;
 
     const scaleFactorLeft = 50 / Math.abs(min);
     const scaleFactorRight = 50 / max;
-    const numericValue = this.parseNumericValue(cellContent);
-    const isNegative = numericValue < 0;
-
-    const width = isNegative
-      ? Math.abs(numericValue) * scaleFactorLeft
-      : numericValue * scaleFactorRight;
-
-    cell.textContent = '';
-
-    const container = this.createDataBarContainer();
-    const bar = this.createBar(width, isNegative, barRounded);
-    const textContainer = this.createBarText(cellContent, isNegative);
 
-    container.appendChild(bar);
-    container.appendChild(textContainer);
+    let numericValue: number;
+    let isNegative: boolean;
+    let width: number;
+    if (geometry) {
+      numericValue = this.geometryValue(geometry.value, rowPos);
+      isNegative = geometry.negative[rowPos] === 1;
+      width = this.geometryValue(geometry.width, rowPos);
+    } else {
+      numericValue = this.readCellNumber(row, params.col_idx, rowPos);
+      isNegative = numericValue < 0;
+      width = isNegative
+        ? Math.abs(numericValue) * scaleFactorLeft
+        : numericValue * scaleFactorRight;
+    }
 
-    // Add recommendation marker if specified
+    // Recommendation marker, if specified
+    let markerPosition = NaN;
     if (recommended_idx !== undefined) {
       const recommendedCell = row.children[recommended_idx] as HTMLElement;
-      if (recommendedCell) {
-        const recommendedValue = parseFloat(recommendedCell.textContent || '0');
-        const marker = this.createRecommendationMarker(
-          recommendedValue,
-          scaleFactorLeft,
-          scaleFactorRight,
-          textContainer
-        );
-
-        if (marker) {
-          container.appendChild(marker.horizontalLine);
-          container.appendChild(marker.verticalMarker);
-
+      if (recommendedCell || this.sideColumn(recommended_idx)) {
+        const recommendedValue = geometry
+          ? this.geometryValue(geometry.recommended, rowPos)
+          : this.readCellNumber(row, recommended_idx, rowPos);
+        markerPosition = geometry
+          ? this.geometryValue(geometry.marker, rowPos)
+          : this.getMarkerPosition(recommendedValue, scaleFactorLeft, scaleFactorRight);
+
+        if (!isNaN(markerPosition)) {
           // Attach tooltip
           const columnName = headers[params.col_idx]?.textContent || `Column ${params.col_idx}`;
           const recommendedHeaderElement = headers[recommended_idx];
-          const recommendedColumnName = recommendedHeaderElement?.textContent || `Column ${recommended_idx}`;
+          const side: SideColumns | undefined = this.props.args.side_columns;
+          const sideName = this.sideColumn(recommended_idx) ? side!.names[recommended_idx - side!.start] : undefined;
+          const recommendedColumnName = sideName || recommendedHeaderElement?.textContent || `Column ${recommended_idx}`;
 
           this.attachTooltip(cell, {
             columnName,
@@ -371,112 +844,227 @@ class ClickableTable extends StreamlitComponentBase<State> {
       }
     }
 
-    cell.appendChild(container);
-  }
-
-  // ========================================
-  // David Hum Chart Methods
-  // ========================================
-
-  private createDavidHumChart(
-    cell: HTMLElement,
-    params: DavidHumParams,
-    cellContent: string,
-    barRounded: boolean
-  ): void {
-    const { max, exception_col_color } = params;
-    const scaleFactor = 65 / max;
-    const value = parseFloat(cellContent || '0');
+    if (params.renderer === 'canvas') {
+      this.setCanvasChart(cell, 'ct-canvas-data-bar', {
+        kind: 'data_bar', width, negative: isNegative, marker: markerPosition, text: cellContent.trim(), rounded: barRounded
+      });
+      return;
+    }
 
     cell.textContent = '';
 
-    if (Number.isNaN(value) && cellContent.trim() !== '') {
-      // Non-numeric value - apply exception color
-      cell.style.backgroundColor = exception_col_color;
-
-      const textContainer = document.createElement('div');
-      this.setElementStyles(textContainer, {
-        zIndex: '100',
-        width: '100%',
-        textAlign: 'center'
-      });
-      textContainer.textContent = cellContent;
-      cell.appendChild(textContainer);
-    } else {
-      // Numeric value - create bar
-      const bar = document.createElement('div');
-      this.setElementStyles(bar, {
-        height: '20px',
-        float: 'left',
-        backgroundColor: 'var(--pos-color)',
-        width: `${value * scaleFactor}%`,
-        opacity: '60%',
-        borderRadius: barRounded ? '9px' : '0px'
-      });
+    const container = this.createDataBarContainer(barRounded);
+    const bar = this.createBar(width, isNegative);
+    const textContainer = this.createBarText(cellContent, isNegative);
 
-      const textContainer = document.createElement('div');
-      this.setElementStyles(textContainer, {
-        zIndex: '100',
-        width: '35%',
-        textAlign: 'right',
-        float: 'right'
-      });
-      textContainer.textContent = `${value}%`;
+    container.appendChild(bar);
+    container.appendChild(textContainer);
 
-      cell.appendChild(bar);
-      cell.appendChild(textContainer);
+    const marker = this.createRecommendationMarker(markerPosition, textContainer);
+    if (marker) {
+      container.appendChild(marker.horizontalLine);
+      container.appendChild(marker.verticalMarker);
     }
+
+    cell.appendChild(container);
   }
 
   // ========================================
-  // Range Chart Methods
+  // Tooltip Methods
   // ========================================
 
-  private createRangeBand(
-    startPct: number,
-    endPct: number,
-    color: string,
-    opacity: number,
-    heightPx: number,
-    barRounded: boolean
-  ): HTMLElement {
-    const left = Math.min(startPct, endPct);
-    const right = Math.max(startPct, endPct);
-    const width = Math.max(right - left, 0.5);
+  /**
+   * Returns the single tooltip element shared by all cells, creating it on
+   * first use. It is removed from document.body when the component unmounts.
+   */
+  private getTooltipElement(): HTMLElement {
+    if (this.tooltipElement) return this.tooltipElement;
 
-    const band = document.createElement('div');
-    this.setElementStyles(band, {
-      position: 'absolute',
-      left: `${left}%`,
-      width: `${width}%`,
-      height: `${heightPx}px`,
-      top: '0px',
-      backgroundColor: color,
-      opacity: String(opacity),
-      borderRadius: barRounded ? `${heightPx/2}px` : '0px',
-      zIndex: '2'
-    });
+    const tooltip = document.createElement('div');
+    tooltip.className = 'data-bar-tooltip';
+
+    this.setElementStyles(tooltip, {
+      display: 'none',
+      position: 'absolute',
+      backgroundColor: 'rgba(218, 218, 218, 0.76)',
+      color: 'black',
+      padding: '5px 10px',
+      marginTop: '-20px',
+      marginLeft: '120px',
+      borderRadius: '5px',
+      zIndex: '1000',
+      whiteSpace: 'nowrap',
+      pointerEvents: 'none',
+      transform: 'translateX(-50%)'
+    });
+
+    document.body.appendChild(tooltip);
+    this.tooltipElement = tooltip;
+    return tooltip;
+  }
+
+  private attachTooltip(cell: HTMLElement, data: TooltipData): void {
+    this.tooltipData.set(cell, data);
+  }
+
+  private handleTooltipOver = (event: React.MouseEvent<HTMLDivElement, MouseEvent>): void => {
+    const target = event.target as HTMLElement;
+    const cell = target.closest ? target.closest('td') as HTMLElement | null : null;
+    if (!cell || cell === this.tooltipCell) return;
+
+    const data = this.tooltipData.get(cell);
+    if (!data) {
+      this.hideTooltip();
+      return;
+    }
+
+    const tooltip = this.getTooltipElement();
+    tooltip.innerHTML = `${escapeHtml(data.columnName)}: ${data.value}<br>` +
+      `${escapeHtml(data.recommendedColumnName)}: ${data.recommendedValue}`;
+    tooltip.style.display = 'block';
+
+    const rect = cell.getBoundingClientRect();
+    tooltip.style.left = `${rect.left + window.scrollX + rect.width/2}px`;
+    tooltip.style.top = `${rect.top + window.scrollY - tooltip.offsetHeight - 5}px`;
+    this.tooltipCell = cell;
+  }
+
+  private handleTooltipOut = (event: React.MouseEvent<HTMLDivElement, MouseEvent>): void => {
+    if (!this.tooltipCell) return;
+    const related = event.relatedTarget as Node | null;
+    if (related && this.tooltipCell.contains(related)) return;
+    this.hideTooltip();
+  }
+
+  private hideTooltip(): void {
+    if (this.tooltipElement) {
+      this.tooltipElement.style.display = 'none';
+    }
+    this.tooltipCell = null;
+  }
+
+  public componentDidMount(): void {
+    super.componentDidMount();
+    window.addEventListener('resize', this.handleResize);
+  }
+
+  public componentWillUnmount(): void {
+    this.cancelDecoration();
+    window.removeEventListener('resize', this.handleResize);
+    this.teardownVirtualColumns();
+    if (this.columnStyle) {
+      this.columnStyle.remove();
+      this.columnStyle = null;
+    }
+    if (this.canvasFrame !== null) {
+      window.cancelAnimationFrame(this.canvasFrame);
+      this.canvasFrame = null;
+    }
+    if (this.geometryWorker) {
+      this.geometryWorker.terminate();
+      this.geometryWorker = null;
+    }
+    if (this.tooltipElement && this.tooltipElement.parentNode) {
+      this.tooltipElement.parentNode.removeChild(this.tooltipElement);
+    }
+    this.tooltipElement = null;
+    this.tooltipCell = null;
+  }
+
+  // ========================================
+  // David Hum Chart Methods
+  // ========================================
+
+  private createDavidHumChart(
+    cell: HTMLElement,
+    params: DavidHumParams,
+    cellContent: string,
+    row: Element,
+    barRounded: boolean,
+    geometry: DavidHumGeometry | null,
+    rowPos: number
+  ): void {
+    const { max, exception_col_color } = params;
+    const scaleFactor = 65 / max;
+    const value = geometry && geometry.value
+      ? this.geometryValue(geometry.value, rowPos)
+      : this.readCellNumber(row, params.col_idx, rowPos);
+    const width = geometry ? this.geometryValue(geometry.width, rowPos) : value * scaleFactor;
+    const exception = Number.isNaN(value) && cellContent.trim() !== '';
+
+    if (params.renderer === 'canvas') {
+      if (exception) {
+        // The cell keeps its own text
+        cell.style.backgroundColor = exception_col_color;
+      } else {
+        this.setCanvasChart(cell, 'ct-canvas-david-hum', {
+          kind: 'david_hum', width, text: `${value}%`, rounded: barRounded
+        });
+      }
+      return;
+    }
+
+    cell.textContent = '';
+    const fragment = document.createDocumentFragment();
+
+    if (exception) {
+      // Non-numeric value - apply exception color
+      cell.style.backgroundColor = exception_col_color;
+
+      const textContainer = document.createElement('div');
+      textContainer.className = 'ct-david-hum-exception';
+      textContainer.textContent = cellContent;
+      fragment.appendChild(textContainer);
+    } else {
+      // Numeric value - create bar
+      const bar = document.createElement('div');
+      bar.className = barRounded ? 'ct-david-hum-bar' : 'ct-david-hum-bar ct-square';
+      this.setCssVars(bar, { '--ct-width': `${width}%` });
+
+      const textContainer = document.createElement('div');
+      textContainer.className = 'ct-david-hum-text';
+      textContainer.textContent = `${value}%`;
+
+      fragment.appendChild(bar);
+      fragment.appendChild(textContainer);
+    }
+
+    cell.appendChild(fragment);
+  }
+
+  // ========================================
+  // Range Chart Methods
+  // ========================================
+
+  private createRangeBand(
+    startPct: number,
+    endPct: number,
+    opacity: number
+  ): HTMLElement {
+    const left = Math.min(startPct, endPct);
+    const right = Math.max(startPct, endPct);
+    const width = Math.max(right - left, 0.5);
+
+    const band = document.createElement('div');
+    band.className = 'ct-range-band';
+    this.setCssVars(band, {
+      '--ct-left': `${left}%`,
+      '--ct-width': `${width}%`,
+      '--ct-opacity': String(opacity)
+    });
 
     return band;
   }
 
   private createCurrentMarker(
     currentPos: number,
-    currentColor: string,
-    barRounded: boolean
+    currentColor: string
   ): HTMLElement {
     const marker = document.createElement('div');
-    this.setElementStyles(marker, {
-      position: 'absolute',
-      left: `${currentPos}%`,
-      top: '3px',
-      width: '10px',
-      height: '12px',
-      transform: 'translateX(-50%)',
-      backgroundColor: currentColor,
-      borderRadius: barRounded ? '6px' : '0px',
-      boxShadow: '0 0 0 2px #fff inset, 0 0 0 1px rgba(0,0,0,.12)',
-      zIndex: '3'
+    marker.className = 'ct-range-current';
+    this.setCssVars(marker, {
+      '--ct-left': `${currentPos}%`,
+      '--ct-color': currentColor
     });
     return marker;
   }
@@ -488,68 +1076,93 @@ class ClickableTable extends StreamlitComponentBase<State> {
     return textContainer;
   }
 
+  /**
+   * The range chart of one row: the low/high text when the current value is
+   * out of range, otherwise the band and marker positions
+   * [long low, long high, short low, short high, current] in percent.
+   */
+  private rangeChartLayout(
+    params: RangeChartParams,
+    row: Element,
+    geometry: RangeChartGeometry | null,
+    rowPos: number
+  ): { text: string | null, positions: number[] } {
+    const { low_text, high_text } = params;
+
+    if (geometry) {
+      const state = geometry.state[rowPos];
+      if (state === -1 && low_text) return { text: low_text, positions: [] };
+      if (state === 1 && high_text) return { text: high_text, positions: [] };
+      return {
+        text: null,
+        positions: [
+          this.geometryValue(geometry.long_low, rowPos),
+          this.geometryValue(geometry.long_high, rowPos),
+          this.geometryValue(geometry.short_low, rowPos),
+          this.geometryValue(geometry.short_high, rowPos),
+          this.geometryValue(geometry.current, rowPos)
+        ]
+      };
+    }
+
+    const longTermHigh = this.readCellNumber(row, params.long_term_high_idx, rowPos);
+    const longTermLow = this.readCellNumber(row, params.long_term_low_idx, rowPos);
+    const shortTermHigh = this.readCellNumber(row, params.short_term_high_idx, rowPos);
+    const shortTermLow = this.readCellNumber(row, params.short_term_low_idx, rowPos);
+    const current = this.readCellNumber(row, params.current_idx, rowPos);
+
+    // Check for out-of-range conditions
+    if (low_text && current < shortTermLow && current < longTermLow) {
+      return { text: low_text, positions: [] };
+    }
+
+    if (high_text && current > shortTermHigh && current > longTermHigh) {
+      return { text: high_text, positions: [] };
+    }
+
+    return {
+      text: null,
+      positions: [longTermLow, longTermHigh, shortTermLow, shortTermHigh, current]
+        .map(value => this.getLeftPosition(value, longTermLow, longTermHigh))
+    };
+  }
+
   private createRangeChart(
     cell: HTMLElement,
     params: RangeChartParams,
     row: Element,
-    barRounded: boolean
+    barRounded: boolean,
+    geometry: RangeChartGeometry | null,
+    rowPos: number
   ): void {
-    const {
-      long_term_high_idx,
-      long_term_low_idx,
-      short_term_high_idx,
-      short_term_low_idx,
-      current_idx,
-      current_color,
-      low_text,
-      high_text
-    } = params;
+    const { text, positions } = this.rangeChartLayout(params, row, geometry, rowPos);
 
-    const longTermHigh = parseFloat(row.children[long_term_high_idx].textContent || '0');
-    const longTermLow = parseFloat(row.children[long_term_low_idx].textContent || '0');
-    const shortTermHigh = parseFloat(row.children[short_term_high_idx].textContent || '0');
-    const shortTermLow = parseFloat(row.children[short_term_low_idx].textContent || '0');
-    const current = parseFloat(row.children[current_idx].textContent || '0');
+    if (params.renderer === 'canvas') {
+      this.setCanvasChart(cell, 'ct-canvas-range', {
+        kind: 'range', text, positions, color: params.current_color, rounded: barRounded
+      });
+      return;
+    }
 
     cell.className = 'range-chart-cell';
     cell.textContent = '';
 
-    // Check for out-of-range conditions
-    if (low_text && current < shortTermLow && current < longTermLow) {
-      cell.appendChild(this.createRangeChartText(low_text));
-      return;
-    }
-
-    if (high_text && current > shortTermHigh && current > longTermHigh) {
-      cell.appendChild(this.createRangeChartText(high_text));
+    if (text !== null) {
+      cell.appendChild(this.createRangeChartText(text));
       return;
     }
 
     // Create range chart
     const rangeChart = document.createElement('div');
-    this.setElementStyles(rangeChart, {
-      position: 'relative',
-      width: '100%',
-      display: 'flex',
-      justifyContent: 'space-between',
-      borderRadius: barRounded ? '9px' : '0px'
-    });
-    rangeChart.classList.add('range-line');
-
-    // Calculate positions
-    const longTermLowPos = this.getLeftPosition(longTermLow, longTermLow, longTermHigh);
-    const shortTermLowPos = this.getLeftPosition(shortTermLow, longTermLow, longTermHigh);
-    const currentPos = this.getLeftPosition(current, longTermLow, longTermHigh);
-    const shortTermHighPos = this.getLeftPosition(shortTermHigh, longTermLow, longTermHigh);
-    const longTermHighPos = this.getLeftPosition(longTermHigh, longTermLow, longTermHigh);
+    rangeChart.className = barRounded ? 'range-line ct-range-line' : 'range-line ct-range-line ct-square';
 
+    const [longTermLowPos, longTermHighPos, shortTermLowPos, shortTermHighPos, currentPos] = positions;
     // Add bands
-    rangeChart.appendChild(this.createRangeBand(longTermLowPos, longTermHighPos, '#6B7280', 0.15, 18, barRounded));
-    rangeChart.appendChild(this.createRangeBand(shortTermLowPos, shortTermHighPos, '#6B7280', 0.35, 18, barRounded));
+    rangeChart.appendChild(this.createRangeBand(longTermLowPos, longTermHighPos, 0.15));
+    rangeChart.appendChild(this.createRangeBand(shortTermLowPos, shortTermHighPos, 0.35));
 
     // Add current marker
-    rangeChart.appendChild(this.createCurrentMarker(currentPos, current_color, barRounded));
-
+    rangeChart.appendChild(this.createCurrentMarker(currentPos, params.current_color));
     cell.appendChild(rangeChart);
   }
 
@@ -561,39 +1174,17 @@ class ClickableTable extends StreamlitComponentBase<State> {
     ticks: number[]
   ): HTMLElement {
     const tickContainer = document.createElement('div');
-    this.setElementStyles(tickContainer, {
-      position: 'absolute',
-      bottom: '0px',
-      width: '100%',
-      height: '12px',
-      display: 'flex',
-      justifyContent: 'space-between',
-      padding: '0 2px'
-    });
+    tickContainer.className = 'ct-ticks';
 
     ticks.forEach((tickValue) => {
       const tickWrapper = document.createElement('div');
-      this.setElementStyles(tickWrapper, {
-        position: 'relative',
-        display: 'flex',
-        flexDirection: 'column',
-        alignItems: 'center'
-      });
+      tickWrapper.className = 'ct-tick';
 
       const tickLine = document.createElement('div');
-      this.setElementStyles(tickLine, {
-        width: '1px',
-        height: '4px',
-        backgroundColor: '#9CA3AF',
-        marginBottom: '2px'
-      });
+      tickLine.className = 'ct-tick-line';
 
       const tickLabel = document.createElement('div');
-      this.setElementStyles(tickLabel, {
-        fontSize: '9px',
-        color: '#6B7280',
-        textAlign: 'center'
-      });
+      tickLabel.className = 'ct-tick-label';
       tickLabel.textContent = tickValue.toFixed(1);
 
       tickWrapper.appendChild(tickLine);
@@ -604,57 +1195,78 @@ class ClickableTable extends StreamlitComponentBase<State> {
     return tickContainer;
   }
 
+  /**
+   * Returns the tick marks for a fixed min/max scale. The ticks only depend on
+   * the scale, so the subtree is built once per scale and cloned for each use.
+   */
+  private getTickMarks(min: number, max: number): HTMLElement {
+    const scaleKey = `${min}:${max}`;
+    let template = this.tickTemplates.get(scaleKey);
+    if (!template) {
+      const tickSpacing = (max - min) / 6;
+      const ticks: number[] = [];
+      for (let i = 0; i <= 6; i++) {
+        ticks.push(min + i * tickSpacing);
+      }
+      template = this.createTickMarks(ticks);
+      this.tickTemplates.set(scaleKey, template);
+    }
+    return template.cloneNode(true) as HTMLElement;
+  }
+
+  /**
+   * Renders the tick axis of fixed-scale charts configured with
+   * tick_axis: 'header' once, in the column's bottom header cell, instead of
+   * repeating it in every row.
+   */
+  private applyFixedScaleAxes(context: DecorationContext): void {
+    const { headers, indexOffset, fixedScaleRangeCharts } = context;
+
+    headers.forEach(th => {
+      th.querySelectorAll('.ct-fixed-scale-axis').forEach(axis => axis.remove());
+    });
+    if (!Array.isArray(fixedScaleRangeCharts)) return;
+
+    fixedScaleRangeCharts.forEach(config => {
+      if (config.tick_marks === false || config.tick_axis !== 'header') return;
+      const th = headers[config.col_idx + indexOffset];
+      if (!th) return;
+
+      const axis = document.createElement('div');
+      axis.className = 'ct-fixed-scale-axis';
+      axis.appendChild(this.getTickMarks(config.min, config.max));
+      th.appendChild(axis);
+    });
+  }
+
   private createHorizontalLine(
     lineHeight: number,
-    lineColor: string,
-    barRounded: boolean
+    lineColor: string
   ): HTMLElement {
     const line = document.createElement('div');
-    this.setElementStyles(line, {
-      position: 'absolute',
-      top: '15px',
-      left: '0',
-      width: '100%',
-      height: `${lineHeight}px`,
-      backgroundColor: lineColor,
-      borderRadius: barRounded ? `${lineHeight / 2}px` : '0px',
-      zIndex: '1'
+    line.className = 'ct-fixed-scale-line';
+    this.setCssVars(line, {
+      '--ct-height': `${lineHeight}px`,
+      '--ct-color': lineColor
     });
     return line;
   }
 
   private createMidpointLine(): HTMLElement {
     const midpointLine = document.createElement('div');
-    this.setElementStyles(midpointLine, {
-      position: 'absolute',
-      left: '50%',
-      top: '5px',
-      width: '1px',
-      height: '20px',
-      backgroundColor: '#9CA3AF',
-      transform: 'translateX(-50%)',
-      zIndex: '2'
-    });
+    midpointLine.className = 'ct-midpoint';
     return midpointLine;
   }
 
   private createDot(
     position: number,
-    color: string,
-    barRounded: boolean
+    color: string
   ): HTMLElement {
     const dot = document.createElement('div');
-    this.setElementStyles(dot, {
-      position: 'absolute',
-      left: `${position}%`,
-      top: '9px',
-      width: '10px',
-      height: '12px',
-      transform: 'translateX(-50%)',
-      backgroundColor: color,
-      opacity: '0.5',
-      borderRadius: barRounded ? '6px' : '0px',
-      zIndex: '3'
+    dot.className = 'ct-dot';
+    this.setCssVars(dot, {
+      '--ct-left': `${position}%`,
+      '--ct-color': color
     });
     return dot;
   }
@@ -664,7 +1276,9 @@ class ClickableTable extends StreamlitComponentBase<State> {
     params: FixedScaleChartParams,
     row: Element,
     indexOffset: number,
-    barRounded: boolean
+    barRounded: boolean,
+    geometry: FixedScaleGeometry | null,
+    rowPos: number
   ): void {
     const {
       min,
@@ -677,64 +1291,355 @@ class ClickableTable extends StreamlitComponentBase<State> {
       dot3_color = '#9CA3AF',
       line_color = '#D1D5DB',
       line_height = 2,
-      tick_marks = true
+      tick_marks = true,
+      tick_axis = 'row'
     } = params;
 
     const cellContent = cell.textContent?.trim() || '';
     if (cellContent && cellContent !== '') return;
 
+    // Dot positions
+    const dot1ActualIdx = dot1_idx + indexOffset;
+    const dot2ActualIdx = dot2_idx + indexOffset;
+    const dot3ActualIdx = dot3_idx + indexOffset;
+
+    const values = geometry && geometry.values;
+    const dot1Value = values ? this.geometryValue(values[0], rowPos) : this.readCellNumber(row, dot1ActualIdx, rowPos);
+    const dot2Value = values ? this.geometryValue(values[1], rowPos) : this.readCellNumber(row, dot2ActualIdx, rowPos);
+    const dot3Value = values ? this.geometryValue(values[2], rowPos) : this.readCellNumber(row, dot3ActualIdx, rowPos);
+
+    const dots: { position: number, color: string }[] = [];
+    [
+      { value: dot1Value, color: dot1_color },
+      { value: dot2Value, color: dot2_color },
+      { value: dot3Value, color: dot3_color }
+    ].forEach((dot, i) => {
+      const position = geometry
+        ? this.geometryValue(geometry.dots[i], rowPos)
+        : this.getPositionPercent(dot.value, min, max);
+      if (!isNaN(dot.value) && !isNaN(position)) {
+        dots.push({ position, color: dot.color });
+      }
+    });
+
+    if (params.renderer === 'canvas') {
+      this.setCanvasChart(cell, 'ct-canvas-fixed-scale', {
+        kind: 'fixed_scale', min, max, ticks: tick_marks && tick_axis !== 'header', dots,
+        lineColor: line_color, lineHeight: line_height, rounded: barRounded
+      });
+      return;
+    }
+
     cell.className = 'fixed-scale-range-chart-cell';
     cell.textContent = '';
 
     const chartContainer = document.createElement('div');
-    this.setElementStyles(chartContainer, {
-      position: 'relative',
-      width: '100%',
-      height: '30px',
-      padding: '5px 0'
-    });
-
-    const range = max - min;
+    chartContainer.className = barRounded ? 'ct-fixed-scale-chart' : 'ct-fixed-scale-chart ct-square';
 
-    // Create tick marks
-    if (tick_marks) {
-      const tickSpacing = range / 6;
-      const ticks: number[] = [];
-      for (let i = 0; i <= 6; i++) {
-        ticks.push(min + i * tickSpacing);
-      }
-      chartContainer.appendChild(this.createTickMarks(ticks));
+    // Create tick marks (drawn once in the header with tick_axis: 'header')
+    if (tick_marks && tick_axis !== 'header') {
+      chartContainer.appendChild(this.getTickMarks(min, max));
     }
 
     // Create horizontal line
-    chartContainer.appendChild(this.createHorizontalLine(line_height, line_color, barRounded));
+    chartContainer.appendChild(this.createHorizontalLine(line_height, line_color));
 
     // Create midpoint line
     chartContainer.appendChild(this.createMidpointLine());
 
     // Create dots
-    const dot1ActualIdx = dot1_idx + indexOffset;
-    const dot2ActualIdx = dot2_idx + indexOffset;
-    const dot3ActualIdx = dot3_idx + indexOffset;
+    dots.forEach(dot => chartContainer.appendChild(this.createDot(dot.position, dot.color)));
+
+    cell.appendChild(chartContainer);
+  }
 
-    const dot1Value = parseFloat(row.children[dot1ActualIdx]?.textContent || '0');
-    const dot2Value = parseFloat(row.children[dot2ActualIdx]?.textContent || '0');
-    const dot3Value = parseFloat(row.children[dot3ActualIdx]?.textContent || '0');
+  // ========================================
+  // Canvas Renderer Methods
+  // ========================================
 
-    const dots = [
-      { value: dot1Value, color: dot1_color },
-      { value: dot2Value, color: dot2_color },
-      { value: dot3Value, color: dot3_color }
-    ];
+  private hasCanvasCharts(): boolean {
+    const config = this.props.args.config;
+    if (!config) return false;
+    return [config.data_bar_chart_columns, config.david_hum_columns, config.range_chart, config.fixed_scale_range_chart]
+      .some(configs => Array.isArray(configs) && configs.some((params: any) => params.renderer === 'canvas'));
+  }
+
+  /**
+   * Registers a chart cell for the canvas overlay. The cell keeps its text
+   * (hidden by ct-canvas-cell) and gets no child nodes; clicks and tooltips
+   * still hit the cell itself, since the canvas ignores pointer events.
+   */
+  private setCanvasChart(cell: HTMLElement, className: string, chart: CanvasChart): void {
+    cell.classList.add('ct-canvas-cell', className);
+    this.canvasCharts.set(cell, chart);
+  }
+
+  private scheduleCanvasDraw = (): void => {
+    if (this.canvasFrame !== null || !this.canvasRef.current) return;
+    this.canvasFrame = window.requestAnimationFrame(this.drawCanvasCharts);
+  }
+
+  /**
+   * Redraws the canvas overlay: sizes it to the scroll viewport, finds the
+   * visible body rows by binary search and paints every canvas chart cell in
+   * them at its current position.
+   */
+  private drawCanvasCharts = (): void => {
+    this.canvasFrame = null;
+    const canvas = this.canvasRef.current;
+    const tableContainer = this.containerRef.current;
+    if (!canvas || !tableContainer) return;
+
+    const width = tableContainer.clientWidth;
+    const height = tableContainer.clientHeight;
+    const ratio = window.devicePixelRatio || 1;
+    if (canvas.width !== Math.round(width * ratio) || canvas.height !== Math.round(height * ratio)) {
+      canvas.width = Math.round(width * ratio);
+      canvas.height = Math.round(height * ratio);
+      canvas.style.width = `${width}px`;
+      canvas.style.height = `${height}px`;
+    }
+    const ctx = canvas.getContext('2d');
+    if (!ctx) return;
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    ctx.clearRect(0, 0, width, height);
+
+    const tbody = tableContainer.querySelector('tbody');
+    if (!tbody) return;
+    const rows = Array.from(tbody.rows);
+    const bounds = tableContainer.getBoundingClientRect();
+    const originX = bounds.left + tableContainer.clientLeft;
+    const originY = bounds.top + tableContainer.clientTop;
+    const first = this.firstRowBelow(rows, originY);
+    const end = this.firstRowBelow(rows, originY + height);
+
+    const rootStyle = getComputedStyle(document.documentElement);
+    const colors = {
+      positive: rootStyle.getPropertyValue('--pos-color').trim() || '#6b8cff',
+      negative: rootStyle.getPropertyValue('--neg-color').trim() || '#ff6b6b',
+      track: rootStyle.getPropertyValue('--track-color').trim() || '#eef2f6',
+      axis: rootStyle.getPropertyValue('--axis-color').trim() || '#d0d7de',
+      text: getComputedStyle(tbody).color
+    };
+    let cellStyle: CSSStyleDeclaration | null = null;
+
+    // With virtualize_columns, charts scrolled under the sticky columns are clipped at their edge
+    let stickyRight = -Infinity;
+    if (this.columnPinned > 0 && first < rows.length) {
+      const lastPinned = rows[first].children[this.columnPinned - 1];
+      if (lastPinned) stickyRight = lastPinned.getBoundingClientRect().right - originX;
+    }
 
-    dots.forEach((dot) => {
-      if (!isNaN(dot.value)) {
-        const position = this.getPositionPercent(dot.value, min, max);
-        chartContainer.appendChild(this.createDot(position, dot.color, barRounded));
+    for (let i = first; i <= end && i < rows.length; i++) {
+      const cells = rows[i].children;
+      for (let c = 0; c < cells.length; c++) {
+        const cell = cells[c] as HTMLElement;
+        const chart = this.canvasCharts.get(cell);
+        if (!chart) continue;
+        const rect = cell.getBoundingClientRect();
+        if (rect.width <= 0) continue;
+        if (!cellStyle) {
+          // Canvas chart cells share the td padding and font
+          cellStyle = getComputedStyle(cell);
+          ctx.font = cellStyle.font || `${cellStyle.fontSize} ${cellStyle.fontFamily}`;
+        }
+        const padLeft = parseFloat(cellStyle.paddingLeft) || 0;
+        const padRight = parseFloat(cellStyle.paddingRight) || 0;
+        const padTop = parseFloat(cellStyle.paddingTop) || 0;
+        const padBottom = parseFloat(cellStyle.paddingBottom) || 0;
+        const x = rect.left - originX + padLeft;
+        const y = rect.top - originY + padTop;
+        const w = rect.width - padLeft - padRight;
+        const h = rect.height - padTop - padBottom;
+
+        const cellLeft = rect.left - originX;
+        const clipLeft = c >= this.columnPinned ? Math.max(cellLeft, stickyRight) : cellLeft;
+        if (clipLeft >= cellLeft + rect.width) continue;
+        ctx.save();
+        ctx.beginPath();
+        ctx.rect(clipLeft, rect.top - originY, cellLeft + rect.width - clipLeft, rect.height);
+        ctx.clip();
+        switch (chart.kind) {
+          case 'data_bar': this.paintDataBar(ctx, chart, x, y, w, h, colors); break;
+          case 'david_hum': this.paintDavidHum(ctx, chart, x, y, w, h, colors); break;
+          case 'range': this.paintRangeChart(ctx, chart, x, y, w, h, colors); break;
+          case 'fixed_scale': this.paintFixedScaleChart(ctx, chart, x, y, w, h, colors); break;
+        }
+        ctx.restore();
       }
+    }
+  }
+
+  /** Index of the first row whose bottom edge is below y (viewport coordinates). */
+  private firstRowBelow(rows: HTMLTableRowElement[], y: number): number {
+    let lo = 0;
+    let hi = rows.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (rows[mid].getBoundingClientRect().bottom <= y) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  private fillRect(
+    ctx: CanvasRenderingContext2D, x: number, y: number, w: number, h: number, radius: number, color: string
+  ): void {
+    if (!(w > 0) || !(h > 0)) return;
+    ctx.fillStyle = color;
+    ctx.beginPath();
+    roundedRectPath(ctx, x, y, w, h, radius);
+    ctx.fill();
+  }
+
+  private paintText(
+    ctx: CanvasRenderingContext2D, text: string, x: number, y: number, align: CanvasTextAlign, color: string
+  ): void {
+    ctx.globalAlpha = 1;
+    ctx.fillStyle = color;
+    ctx.textAlign = align;
+    ctx.textBaseline = 'middle';
+    ctx.fillText(text, x, y);
+  }
+
+  private paintDataBar(
+    ctx: CanvasRenderingContext2D, chart: Extract<CanvasChart, { kind: 'data_bar' }>,
+    x: number, y: number, w: number, h: number, colors: { [name: string]: string }
+  ): void {
+    const top = y + (h - CHART_BAR_HEIGHT) / 2;
+    const center = x + w / 2;
+    const barWidth = (w * chart.width) / 100;
+    const radius = chart.rounded ? CHART_RADIUS : 0;
+    ctx.globalAlpha = 0.6;
+    this.fillRect(
+      ctx, chart.negative ? center - barWidth : center, top, barWidth, CHART_BAR_HEIGHT, radius,
+      chart.negative ? colors.negative : colors.positive
+    );
+    ctx.globalAlpha = 1;
+
+    const hasMarker = !isNaN(chart.marker);
+    if (hasMarker) {
+      const lineStart = Math.min(chart.marker, 50);
+      const lineEnd = Math.max(chart.marker, 50);
+      this.fillRect(ctx, x + (w * lineStart) / 100, top + 9, (w * (lineEnd - lineStart)) / 100, 2, 0, MARKER_COLOR);
+      this.fillRect(ctx, x + (w * chart.marker) / 100 - 1, top + 5, 2, 12, 0, MARKER_COLOR);
+    }
+
+    // Text placement follows .ct-data-bar-text (5px offset plus 5px padding)
+    const textY = top + CHART_BAR_HEIGHT / 2;
+    if (hasMarker) {
+      if (chart.marker <= 50) this.paintText(ctx, chart.text, x + w * 0.52 + 5, textY, 'left', colors.text);
+      else this.paintText(ctx, chart.text, x + w * 0.48 - 5, textY, 'right', colors.text);
+    } else if (chart.negative) {
+      this.paintText(ctx, chart.text, x + w - 10, textY, 'right', colors.text);
+    } else {
+      this.paintText(ctx, chart.text, x + 10, textY, 'left', colors.text);
+    }
+  }
+
+  private paintDavidHum(
+    ctx: CanvasRenderingContext2D, chart: Extract<CanvasChart, { kind: 'david_hum' }>,
+    x: number, y: number, w: number, h: number, colors: { [name: string]: string }
+  ): void {
+    const top = y + (h - DAVID_HUM_HEIGHT) / 2;
+    ctx.globalAlpha = 0.6;
+    this.fillRect(
+      ctx, x, top, (w * chart.width) / 100, DAVID_HUM_HEIGHT, chart.rounded ? CHART_RADIUS : 0, colors.positive
+    );
+    this.paintText(ctx, chart.text, x + w, top + DAVID_HUM_HEIGHT / 2, 'right', colors.text);
+  }
+
+  private paintRangeChart(
+    ctx: CanvasRenderingContext2D, chart: Extract<CanvasChart, { kind: 'range' }>,
+    x: number, y: number, w: number, h: number, colors: { [name: string]: string }
+  ): void {
+    if (chart.text !== null) {
+      this.paintText(ctx, chart.text, x + w / 2, y + h / 2, 'center', colors.text);
+      return;
+    }
+
+    // Track with a center axis, inset like .range-line (margin 6px 2px)
+    const trackX = x + 2;
+    const trackW = w - 4;
+    const top = y + (h - CHART_BAR_HEIGHT) / 2;
+    const radius = chart.rounded ? CHART_RADIUS : 0;
+    ctx.globalAlpha = 1;
+    this.fillRect(ctx, trackX, top, trackW, CHART_BAR_HEIGHT, radius, colors.track);
+    ctx.save();
+    ctx.beginPath();
+    roundedRectPath(ctx, trackX, top, trackW, CHART_BAR_HEIGHT, radius);
+    ctx.clip();
+    this.fillRect(ctx, trackX + trackW / 2 - 0.5, top + 2, 1, CHART_BAR_HEIGHT - 4, 0, colors.axis);
+
+    const [longLow, longHigh, shortLow, shortHigh, current] = chart.positions;
+    const band = (start: number, end: number, opacity: number): void => {
+      const left = Math.min(start, end);
+      const bandWidth = Math.max(Math.max(start, end) - left, 0.5);
+      ctx.globalAlpha = opacity;
+      this.fillRect(
+        ctx, trackX + (trackW * left) / 100, top, (trackW * bandWidth) / 100, CHART_BAR_HEIGHT, radius, BAND_COLOR
+      );
+    };
+    band(longLow, longHigh, 0.15);
+    band(shortLow, shortHigh, 0.35);
+    ctx.restore();
+
+    // Current marker with the white inset ring and faint outline of .ct-range-current
+    if (isNaN(current)) return;
+    const markerX = trackX + (trackW * current) / 100 - 5;
+    const markerRadius = chart.rounded ? 6 : 0;
+    ctx.globalAlpha = 1;
+    this.fillRect(ctx, markerX, top + 3, 10, 12, markerRadius, chart.color);
+    ctx.lineWidth = 2;
+    ctx.strokeStyle = '#fff';
+    ctx.beginPath();
+    roundedRectPath(ctx, markerX + 1, top + 4, 8, 10, markerRadius - 1);
+    ctx.stroke();
+    ctx.lineWidth = 1;
+    ctx.strokeStyle = 'rgba(0,0,0,.12)';
+    ctx.beginPath();
+    roundedRectPath(ctx, markerX - 0.5, top + 2.5, 11, 13, markerRadius);
+    ctx.stroke();
+  }
+
+  private paintFixedScaleChart(
+    ctx: CanvasRenderingContext2D, chart: Extract<CanvasChart, { kind: 'fixed_scale' }>,
+    x: number, y: number, w: number, h: number, colors: { [name: string]: string }
+  ): void {
+    // Offsets follow .ct-fixed-scale-chart (30px plus 5px padding above and below)
+    const top = y + (h - FIXED_SCALE_HEIGHT) / 2;
+    ctx.globalAlpha = 1;
+    this.fillRect(
+      ctx, x, top + 15, w, chart.lineHeight, chart.rounded ? chart.lineHeight / 2 : 0, chart.lineColor
+    );
+    this.fillRect(ctx, x + w / 2 - 0.5, top + 5, 1, 20, 0, MARKER_COLOR);
+
+    ctx.globalAlpha = 0.5;
+    chart.dots.forEach(dot => {
+      this.fillRect(ctx, x + (w * dot.position) / 100 - 5, top + 9, 10, 12, chart.rounded ? 6 : 0, dot.color);
     });
 
-    cell.appendChild(chartContainer);
+    if (!chart.ticks) return;
+    // Seven ticks spread like the flex row of .ct-ticks (space-between, 2px padding)
+    ctx.globalAlpha = 1;
+    const font = ctx.font;
+    ctx.font = `9px ${getComputedStyle(document.body).fontFamily}`;
+    const labels: string[] = [];
+    const spacing = (chart.max - chart.min) / 6;
+    for (let i = 0; i <= 6; i++) labels.push((chart.min + i * spacing).toFixed(1));
+    const firstHalf = ctx.measureText(labels[0]).width / 2;
+    const lastHalf = ctx.measureText(labels[6]).width / 2;
+    const start = x + 2 + firstHalf;
+    const step = (w - 4 - firstHalf - lastHalf) / 6;
+    labels.forEach((label, i) => {
+      const tickX = start + i * step;
+      this.fillRect(ctx, tickX - 0.5, top + 28, 1, 4, 0, MARKER_COLOR);
+      ctx.fillStyle = BAND_COLOR;
+      ctx.textAlign = 'center';
+      ctx.textBaseline = 'top';
+      ctx.fillText(label, tickX, top + 34);
+    });
+    ctx.font = font;
   }
 
   // ========================================
@@ -744,91 +1649,240 @@ class ClickableTable extends StreamlitComponentBase<State> {
   private applyDataBarCharts(
     row: Element,
     configs: DataBarParams[] | undefined,
+    signatures: string[],
     headers: NodeListOf<Element>,
-    barRounded: boolean
+    barRounded: boolean,
+    geometry: DataBarGeometry[] | null,
+    rowPos: number
   ): void {
     if (!Array.isArray(configs)) return;
 
-    configs.forEach((config) => {
+    configs.forEach((config, i) => {
       const cell = row.children[config.col_idx] as HTMLElement;
-      if (!cell) return;
+      if (!cell || !this.prepareCell(cell, signatures[i])) return;
 
       const cellContent = cell.textContent || '';
-      this.createDataBarChart(cell, config, cellContent, headers, row, barRounded);
+      this.createDataBarChart(
+        cell, config, cellContent, headers, row, barRounded, geometry ? geometry[i] : null, rowPos
+      );
     });
   }
 
   private applyDavidHumCharts(
     row: Element,
     configs: DavidHumParams[] | undefined,
-    barRounded: boolean
+    signatures: string[],
+    barRounded: boolean,
+    geometry: DavidHumGeometry[] | null,
+    rowPos: number
   ): void {
     if (!Array.isArray(configs)) return;
 
-    configs.forEach((config) => {
+    configs.forEach((config, i) => {
       const cell = row.children[config.col_idx] as HTMLElement;
-      if (!cell) return;
+      if (!cell || !this.prepareCell(cell, signatures[i])) return;
 
       const cellContent = cell.textContent || '';
-      this.createDavidHumChart(cell, config, cellContent, barRounded);
+      this.createDavidHumChart(cell, config, cellContent, row, barRounded, geometry ? geometry[i] : null, rowPos);
     });
   }
 
   private applyRangeCharts(
     row: Element,
     configs: RangeChartParams[] | undefined,
-    barRounded: boolean
+    signatures: string[],
+    barRounded: boolean,
+    geometry: RangeChartGeometry[] | null,
+    rowPos: number
   ): void {
     if (!Array.isArray(configs)) return;
 
-    configs.forEach((config) => {
+    configs.forEach((config, i) => {
       const cell = row.children[config.col_idx] as HTMLElement;
-      if (!cell) return;
+      if (!cell || !this.prepareCell(cell, signatures[i])) return;
 
-      this.createRangeChart(cell, config, row, barRounded);
+      this.createRangeChart(cell, config, row, barRounded, geometry ? geometry[i] : null, rowPos);
     });
   }
 
   private applyFixedScaleCharts(
     row: Element,
     configs: FixedScaleChartParams[] | undefined,
+    signatures: string[],
     indexOffset: number,
-    barRounded: boolean
+    barRounded: boolean,
+    geometry: FixedScaleGeometry[] | null,
+    rowPos: number
   ): void {
     if (!Array.isArray(configs)) return;
 
-    configs.forEach((config) => {
+    configs.forEach((config, i) => {
       const actualColIdx = config.col_idx + indexOffset;
       const cell = row.children[actualColIdx] as HTMLElement;
-      if (!cell) return;
+      if (!cell || !this.prepareCell(cell, signatures[i])) return;
 
-      this.createFixedScaleChart(cell, config, row, indexOffset, barRounded);
+      this.createFixedScaleChart(
+        cell, config, row, indexOffset, barRounded, geometry ? geometry[i] : null, rowPos
+      );
     });
   }
 
-  private applyStylesToPercentageCells(): void {
-    const tableContainer = document.querySelector('.clickabletable-container');
-    if (!tableContainer || !this.props.args.config) return;
+  // ========================================
+  // Incremental Decoration Methods
+  // ========================================
 
-    const dataBarChartColumns = this.props.args.config.data_bar_chart_columns;
-    const davidHumColumns = this.props.args.config.david_hum_columns;
-    const idxColName = this.props.args.config.idx_col_name;
-    const rangeChartColumns = this.props.args.config.range_chart;
-    const fixedScaleRangeCharts = this.props.args.config.fixed_scale_range_chart;
-    const barRounded = this.props.args.config.bar_rounded !== false;
+  /**
+   * Identifies a chart decoration: chart type, its config entry and bar_rounded.
+   * A cell decorated with the same signature is left untouched on later passes.
+   */
+  private decorationSignatures(type: string, configs: any[] | undefined, barRounded: boolean): string[] {
+    if (!Array.isArray(configs)) return [];
+    return configs.map(config => `${type}:${barRounded}:${JSON.stringify(config)}`);
+  }
 
-    // Get bottom-level headers (last row of <thead>) for column mapping
-    const { headers, theadRows } = this.getBottomHeaderRow(tableContainer);
-    const firstRow = tableContainer.querySelector('tbody tr');
-    const rowCellCount = firstRow ? firstRow.children.length : 0;
-    const headerCount = headers.length;
-    const indexIncluded = rowCellCount === headerCount;
+  /**
+   * Returns true if the cell must be (re)built for this signature.
+   * Cells decorated with a different signature are first restored to the
+   * content they had when pandas rendered them.
+   */
+  private prepareCell(cell: HTMLElement, signature: string): boolean {
+    const current = this.cellDecorations.get(cell);
+    if (current === signature) return false;
 
-    // Set idx_col_name on the first <th> of the first header row
-    if (theadRows && theadRows.length > 0) {
-      const firstTh = theadRows[0].querySelector('th');
-      if (firstTh) {
-        firstTh.textContent = idxColName;
+    if (current !== undefined) {
+      this.restoreCell(cell);
+    } else {
+      this.cellOriginals.set(cell, { text: cell.textContent || '', className: cell.className });
+    }
+    this.cellDecorations.set(cell, signature);
+    this.decoratedCells.add(cell);
+    this.cellsTouched++;
+    return true;
+  }
+
+  private restoreCell(cell: HTMLElement): void {
+    const original = this.cellOriginals.get(cell);
+    if (original) {
+      cell.textContent = original.text;
+      cell.className = original.className;
+    }
+    cell.style.backgroundColor = '';
+    this.cellDecorations.delete(cell);
+    this.tooltipData.delete(cell);
+    this.canvasCharts.delete(cell);
+  }
+
+  /**
+   * Restores cells whose decoration no longer matches any chart config,
+   * e.g. after a config entry was removed or moved to another column.
+   */
+  private restoreStaleCells(context: DecorationContext): void {
+    const active = new Set<string>([
+      ...context.dataBarSignatures,
+      ...context.davidHumSignatures,
+      ...context.rangeChartSignatures,
+      ...context.fixedScaleSignatures
+    ]);
+    this.decoratedCells.forEach(cell => {
+      const signature = this.cellDecorations.get(cell);
+      if (signature === undefined || !active.has(signature)) {
+        this.restoreCell(cell);
+        this.decoratedCells.delete(cell);
+        this.cellsTouched++;
+      }
+    });
+  }
+
+  private resetDecorationState(): void {
+    this.cellDecorations = new WeakMap();
+    this.cellOriginals = new WeakMap();
+    this.decoratedCells = new Set();
+    this.tooltipData = new WeakMap();
+    this.canvasCharts = new WeakMap();
+    this.hideTooltip();
+  }
+
+  /**
+   * Decorates the table only when the html or config args changed since the
+   * last pass. A new html string means React replaced the table markup, so all
+   * cells are fresh; a config-only change rebuilds just the cells whose chart
+   * config changed and restores cells whose chart config was removed.
+   */
+  private applyDecorations(html: string): void {
+    const config = this.props.args.config;
+    if (!config) return;
+
+    const configKey = JSON.stringify(config);
+    const htmlChanged = html !== this.decoratedHtml;
+    if (!htmlChanged && configKey === this.decoratedConfigKey) return;
+
+    // Chunks still pending belong to the previous table or config
+    this.cancelDecoration();
+    this.cellsTouched = 0;
+    if (htmlChanged) {
+      this.resetDecorationState();
+      const tableContainer = this.containerRef.current;
+      if (tableContainer) this.numberBodyRows(tableContainer);
+    } else {
+      this.clearHiddenColumnClasses(this.decoratedHiddenClass);
+    }
+
+    this.measureDecoration(done => this.applyStylesToPercentageCells(done, !htmlChanged));
+    this.metrics.column_width_ms = this.timed('column_width', this.applyColumnWidth);
+    this.metrics.hidden_columns_ms = this.timed('hidden_columns', this.applyHiddenColumnClasses);
+
+    this.decoratedHtml = html;
+    this.decoratedConfigKey = configKey;
+    this.decoratedHiddenClass = config.hidden_column_class;
+  }
+
+  private reportCellsTouched(): void {
+    const tableContainer = this.containerRef.current;
+    if (tableContainer) {
+      tableContainer.dataset.cellsTouched = String(this.cellsTouched);
+    }
+  }
+
+  /**
+   * Collects everything needed to decorate body rows: the chart configs,
+   * the bottom-level headers and whether the index column is part of each row.
+   */
+  private buildDecorationContext(tableContainer: Element, firstRow: Element | null): DecorationContext | null {
+    const config = this.props.args.config;
+    if (!config) return null;
+
+    // Get bottom-level headers (last row of <thead>) for column mapping
+    const { headers } = this.getBottomHeaderRow(tableContainer);
+    const rowCellCount = firstRow ? firstRow.children.length : 0;
+    const indexIncluded = rowCellCount === headers.length;
+
+    const barRounded = config.bar_rounded !== false;
+
+    return {
+      headers,
+      indexOffset: indexIncluded ? 1 : 0,
+      dataBarChartColumns: config.data_bar_chart_columns,
+      davidHumColumns: config.david_hum_columns,
+      rangeChartColumns: config.range_chart,
+      fixedScaleRangeCharts: config.fixed_scale_range_chart,
+      dataBarSignatures: this.decorationSignatures('data_bar', config.data_bar_chart_columns, barRounded),
+      davidHumSignatures: this.decorationSignatures('david_hum', config.david_hum_columns, barRounded),
+      rangeChartSignatures: this.decorationSignatures('range', config.range_chart, barRounded),
+      fixedScaleSignatures: this.decorationSignatures('fixed_scale', config.fixed_scale_range_chart, barRounded),
+      geometry: this.props.args.geometry || null,
+      barRounded
+    };
+  }
+
+  private applyIndexColumnName(tableContainer: Element): void {
+    const idxColName = this.props.args.config.idx_col_name;
+    const { headers, theadRows } = this.getBottomHeaderRow(tableContainer);
+
+    // Set idx_col_name on the first <th> of the first header row
+    if (theadRows && theadRows.length > 0) {
+      const firstTh = theadRows[0].querySelector('th');
+      if (firstTh) {
+        firstTh.textContent = idxColName;
       }
       // For multi-level headers, also set on subsequent header rows' index cell
       // to keep them consistent (they're typically empty spacers)
@@ -843,59 +1897,1043 @@ class ClickableTable extends StreamlitComponentBase<State> {
     } else if (headers && headers[0]) {
       headers[0].textContent = idxColName;
     }
+  }
 
-    const rows = tableContainer.querySelectorAll('tbody tr');
-    const indexOffset = indexIncluded ? 1 : 0;
+  /**
+   * Position of a body row in the rendered DataFrame slice, which indexes the
+   * precomputed geometry and the side channel. Read from data-row, since the
+   * rows may be in a different order in the DOM, e.g. after a client-side sort.
+   */
+  private rowPosition(row: HTMLElement, fallback: number): number {
+    return row.dataset.row !== undefined ? Number(row.dataset.row) : fallback;
+  }
 
-    rows.forEach(row => {
-      this.applyDataBarCharts(row, dataBarChartColumns, headers, barRounded);
-      this.applyDavidHumCharts(row, davidHumColumns, barRounded);
-      this.applyRangeCharts(row, rangeChartColumns, barRounded);
-      this.applyFixedScaleCharts(row, fixedScaleRangeCharts, indexOffset, barRounded);
+  /**
+   * Numbers freshly mounted body rows with data-row, while they are still in
+   * DataFrame order. Arrow rows already carry it.
+   */
+  private numberBodyRows(tableContainer: Element): void {
+    const tbody = tableContainer.querySelector('tbody');
+    if (!tbody) return;
+    Array.from((tbody as HTMLTableSectionElement).rows).forEach((row, i) => {
+      if (row.dataset.row === undefined) row.dataset.row = String(i);
     });
   }
 
-  private handleClick = (event: React.MouseEvent<HTMLDivElement, MouseEvent>): void => {
-    const target = event.target as HTMLElement;
+  /**
+   * Decorates one body row. rowPos is the row's DataFrame position (see
+   * rowPosition), used to look up precomputed geometry and side channel values.
+   */
+  private decorateRow(row: Element, context: DecorationContext, rowPos: number): void {
+    const { headers, indexOffset, barRounded, geometry } = context;
+    const timing = this.metricsEnabled;
+    const nodesBefore = timing ? row.getElementsByTagName('*').length : 0;
+    let since = timing ? performance.now() : 0;
+
+    this.applyDataBarCharts(
+      row, context.dataBarChartColumns, context.dataBarSignatures, headers, barRounded,
+      geometry ? geometry.data_bar_chart_columns : null, rowPos
+    );
+    if (timing) since = this.addChartTime('data_bar', since);
+    this.applyDavidHumCharts(
+      row, context.davidHumColumns, context.davidHumSignatures, barRounded,
+      geometry ? geometry.david_hum_columns : null, rowPos
+    );
+    if (timing) since = this.addChartTime('david_hum', since);
+    this.applyRangeCharts(
+      row, context.rangeChartColumns, context.rangeChartSignatures, barRounded,
+      geometry ? geometry.range_chart : null, rowPos
+    );
+    if (timing) since = this.addChartTime('range_chart', since);
+    this.applyFixedScaleCharts(
+      row, context.fixedScaleRangeCharts, context.fixedScaleSignatures, indexOffset, barRounded,
+      geometry ? geometry.fixed_scale_range_chart : null, rowPos
+    );
+    if (timing) {
+      this.addChartTime('fixed_scale', since);
+      this.metrics.nodes_created += row.getElementsByTagName('*').length - nodesBefore;
+    }
+  }
 
-    if (target.tagName === "TD" || target.tagName === "TH") {
-      const cell = target as HTMLTableCellElement;
-      const cellValue = cell.innerText;
-
-      // For multi-level headers, get the column name from the last (bottom-level) header row
-      const table = cell.closest("table");
-      const thead = table?.querySelector('thead');
-      const theadRows = thead ? thead.querySelectorAll('tr') : null;
-      const lastHeaderRow = theadRows && theadRows.length > 0
-        ? theadRows[theadRows.length - 1]
-        : null;
-      const headerElement = lastHeaderRow
-        ? lastHeaderRow.querySelector(`th:nth-child(${cell.cellIndex + 1})`)
-        : table?.querySelector(`th:nth-child(${cell.cellIndex + 1})`);
-
-      if (headerElement instanceof HTMLElement) {
-        const header = headerElement.innerText;
-        const rowElement = cell.parentElement;
-
-        if (rowElement && rowElement.tagName === "TR") {
-          const tableRow = rowElement as HTMLTableRowElement;
-          // For multi-level headers, subtract the number of header rows instead of just 1
-          const headerRowCount = theadRows ? theadRows.length : 1;
-          const rowIndex = tableRow.rowIndex - headerRowCount;
-          const key = this.props.args["key"];
-          this.setState({ key, cellValue, header, rowIndex }, () => {
-            Streamlit.setComponentValue({key, cellValue, header, rowIndex });
-          });
+  /**
+   * Decorates every body row, then calls done. With decoration_budget_ms the
+   * rows are decorated in place by the chunk scheduler; otherwise in one pass.
+   */
+  private applyStylesToPercentageCells(done: () => void, restoreStale: boolean = false): void {
+    const tableContainer = this.containerRef.current;
+    if (!tableContainer || !this.props.args.config) return done();
+
+    this.applyIndexColumnName(tableContainer);
+
+    const context = this.buildDecorationContext(tableContainer, tableContainer.querySelector('tbody tr'));
+    if (!context) return done();
+
+    this.applyFixedScaleAxes(context);
+
+    if (restoreStale) {
+      this.restoreStaleCells(context);
+    }
+
+    const tbody = tableContainer.querySelector('tbody');
+    if (!tbody || !tbody.parentNode) return done();
+
+    const rows = Array.from(tbody.rows);
+    if (this.props.args["geometry_worker"] && !context.geometry && rows.length > 0) {
+      this.requestGeometry(rows, context, geometry => {
+        this.decorateBodyRows(tableContainer, tbody, rows, geometry ? { ...context, geometry } : context, done);
+      });
+      return;
+    }
+    this.decorateBodyRows(tableContainer, tbody, rows, context, done);
+  }
+
+  private decorateBodyRows(
+    tableContainer: Element,
+    tbody: HTMLTableSectionElement,
+    rows: HTMLTableRowElement[],
+    context: DecorationContext,
+    done: () => void
+  ): void {
+    const budget = Number(this.props.args["decoration_budget_ms"]) || 0;
+    if (budget > 0) {
+      this.scheduleDecoration(tableContainer, rows, context, budget, done);
+      return;
+    }
+
+    // Decorate with <tbody> detached so the chart nodes of every row are built
+    // off-document and inserted in one batch, instead of restyling the live table
+    const parent = tbody.parentNode;
+    const nextSibling = tbody.nextSibling;
+    const scrollTop = tableContainer.scrollTop;
+    if (parent) parent.removeChild(tbody);
+
+    rows.forEach((row, i) => this.decorateRow(row, context, this.rowPosition(row, i)));
+
+    if (parent) parent.insertBefore(tbody, nextSibling);
+    tableContainer.scrollTop = scrollTop;
+    done();
+  }
+
+  // ========================================
+  // Decoration Scheduler Methods
+  // ========================================
+
+  /**
+   * The visible rows first (with some overscan), then the rows below them,
+   * then the rows above. Rows are located by binary search over their
+   * bounding boxes, which costs one layout of the undecorated table.
+   */
+  private decorationOrder(tableContainer: Element, rows: HTMLTableRowElement[]): number[] {
+    const order: number[] = [];
+    if (rows.length === 0) return order;
+
+    const bounds = tableContainer.getBoundingClientRect();
+    const viewTop = Math.max(bounds.top, 0);
+    const viewBottom = Math.min(bounds.bottom, window.innerHeight);
+    const firstBelow = (y: number): number => {
+      let lo = 0;
+      let hi = rows.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (rows[mid].getBoundingClientRect().bottom <= y) lo = mid + 1;
+        else hi = mid;
+      }
+      return lo;
+    };
+    const start = Math.max(0, firstBelow(viewTop) - VIRTUAL_OVERSCAN_ROWS);
+    const end = Math.min(rows.length, Math.max(firstBelow(viewBottom) + 1, start) + VIRTUAL_OVERSCAN_ROWS);
+
+    for (let i = start; i < end; i++) order.push(i);
+    for (let i = end; i < rows.length; i++) order.push(i);
+    for (let i = 0; i < start; i++) order.push(i);
+    return order;
+  }
+
+  /**
+   * Decorates the rows in chunks of at most budget milliseconds, one chunk
+   * per animation frame, so the browser can handle input and paint between
+   * chunks. The first chunk runs right away.
+   */
+  private scheduleDecoration(
+    tableContainer: Element,
+    rows: HTMLTableRowElement[],
+    context: DecorationContext,
+    budget: number,
+    done: () => void
+  ): void {
+    this.cancelDecoration();
+    this.decorationTask = {
+      rows,
+      order: this.decorationOrder(tableContainer, rows),
+      next: 0,
+      context,
+      budget,
+      done
+    };
+    this.runDecorationChunk();
+  }
+
+  private runDecorationChunk = (): void => {
+    this.decorationFrame = null;
+    const task = this.decorationTask;
+    if (!task) return;
+
+    const deadline = performance.now() + task.budget;
+    while (task.next < task.order.length) {
+      const i = task.order[task.next++];
+      const row = task.rows[i];
+      this.decorateRow(row, task.context, this.rowPosition(row, i));
+      if (performance.now() >= deadline) break;
+    }
+    this.scheduleCanvasDraw();
+
+    if (task.next < task.order.length) {
+      this.decorationFrame = window.requestAnimationFrame(this.runDecorationChunk);
+      return;
+    }
+    this.decorationTask = null;
+    task.done();
+  }
+
+  /** Drops pending chunks, e.g. because the table is about to be replaced. */
+  private cancelDecoration(): void {
+    this.pendingGeometry = null;
+    if (this.decorationFrame !== null) {
+      window.cancelAnimationFrame(this.decorationFrame);
+      this.decorationFrame = null;
+    }
+    this.decorationTask = null;
+  }
+
+  /** Decorates the remaining rows at once, e.g. before rows are patched in place. */
+  private finishDecoration(): void {
+    // A pass still waiting for the geometry worker decorates without it
+    const pending = this.pendingGeometry;
+    if (pending) {
+      this.pendingGeometry = null;
+      pending.callback(null);
+    }
+    const task = this.decorationTask;
+    if (!task) return;
+    if (this.decorationFrame !== null) {
+      window.cancelAnimationFrame(this.decorationFrame);
+    }
+    task.budget = Infinity;
+    this.runDecorationChunk();
+  }
+
+  // ========================================
+  // Geometry Worker Methods
+  // ========================================
+
+  /** Starts the geometry worker on first use; null if workers are unavailable. */
+  private getGeometryWorker(): Worker | null {
+    if (this.geometryWorker || this.geometryWorkerFailed) return this.geometryWorker;
+    try {
+      const worker = new Worker(new URL('./geometry.worker.ts', import.meta.url));
+      worker.onmessage = this.handleGeometryMessage;
+      worker.onerror = this.handleGeometryError;
+      this.geometryWorker = worker;
+    } catch (error) {
+      this.geometryWorkerFailed = true;
+    }
+    return this.geometryWorker;
+  }
+
+  /** Child indices of every cell the charts read, including the side channel. */
+  private geometryColumns(context: DecorationContext): number[] {
+    const columns = new Set<number>();
+    (context.dataBarChartColumns || []).forEach(params => {
+      columns.add(params.col_idx);
+      if (params.recommended_idx !== undefined) columns.add(params.recommended_idx);
+    });
+    (context.davidHumColumns || []).forEach(params => columns.add(params.col_idx));
+    (context.rangeChartColumns || []).forEach(params => {
+      columns.add(params.long_term_high_idx);
+      columns.add(params.long_term_low_idx);
+      columns.add(params.short_term_high_idx);
+      columns.add(params.short_term_low_idx);
+      columns.add(params.current_idx);
+    });
+    (context.fixedScaleRangeCharts || []).forEach(params => {
+      columns.add(params.dot1_idx + context.indexOffset);
+      columns.add(params.dot2_idx + context.indexOffset);
+      columns.add(params.dot3_idx + context.indexOffset);
+    });
+    return Array.from(columns);
+  }
+
+  /**
+   * The raw values of one column for the worker, from the same sources as
+   * readCellNumber: the side channel, the arrow typed arrays, or otherwise the
+   * cells' original (undecorated) text, which the worker parses.
+   */
+  private collectGeometryColumn(rows: HTMLTableRowElement[], childIdx: number, encoder: TextEncoder): GeometryColumn {
+    // Values are sent in DataFrame order, so the geometry is indexed like the server's
+    const positions = rows.map((row, i) => this.rowPosition(row, i));
+    const sideValues = this.sideColumn(childIdx);
+    if (sideValues) {
+      const numbers = new Float64Array(rows.length);
+      positions.forEach(rowPos => {
+        const value = sideValues[rowPos];
+        numbers[rowPos] = value === null || value === undefined ? NaN : value;
+      });
+      return { childIdx, numbers };
+    }
+
+    const arrowValues = this.columnValues ? this.columnValues[childIdx - this.headerColumnCount] : null;
+    if (arrowValues && rows.every(row => row.dataset.row !== undefined)) {
+      const numbers = new Float64Array(rows.length);
+      positions.forEach(rowPos => { numbers[rowPos] = arrowValues[rowPos]; });
+      return { childIdx, numbers };
+    }
+
+    const texts: string[] = new Array(rows.length);
+    rows.forEach((row, i) => {
+      const cell = row.children[childIdx] as HTMLElement | undefined;
+      const original = cell ? this.cellOriginals.get(cell) : undefined;
+      texts[positions[i]] = cell ? (original ? original.text : cell.textContent) || '' : '';
+    });
+    return { childIdx, text: encoder.encode(texts.join(GEOMETRY_CELL_SEPARATOR)) };
+  }
+
+  /**
+   * Sends the chart columns of rows to the geometry worker and calls back with
+   * the computed geometry, or with null if the worker is unavailable. Only the
+   * latest request is answered; cancelDecoration drops it.
+   */
+  private requestGeometry(
+    rows: HTMLTableRowElement[],
+    context: DecorationContext,
+    callback: (geometry: ChartGeometry | null) => void
+  ): void {
+    const worker = this.getGeometryWorker();
+    if (!worker) return callback(null);
+
+    const start = this.startMeasure('geometry');
+    const encoder = new TextEncoder();
+    const columns = this.geometryColumns(context).map(childIdx => this.collectGeometryColumn(rows, childIdx, encoder));
+    const id = ++this.geometryRequestId;
+    this.pendingGeometry = {
+      id,
+      callback: geometry => {
+        // Covers reading the cells, the worker and both transfers
+        if (geometry) this.endMeasure('geometry', start);
+        callback(geometry);
+      }
+    };
+    worker.postMessage({
+      id,
+      rowCount: rows.length,
+      indexOffset: context.indexOffset,
+      columns,
+      charts: {
+        data_bar_chart_columns: context.dataBarChartColumns,
+        david_hum_columns: context.davidHumColumns,
+        range_chart: context.rangeChartColumns,
+        fixed_scale_range_chart: context.fixedScaleRangeCharts
+      }
+    }, columns.map(column => (column.numbers || column.text as Uint8Array).buffer as ArrayBuffer));
+  }
+
+  private handleGeometryMessage = (event: MessageEvent): void => {
+    const pending = this.pendingGeometry;
+    if (!pending || event.data.id !== pending.id) return;
+    this.pendingGeometry = null;
+    pending.callback(event.data.geometry as ChartGeometry);
+  }
+
+  /** A failing worker is not retried: pending and later passes parse on the main thread. */
+  private handleGeometryError = (): void => {
+    this.geometryWorkerFailed = true;
+    if (this.geometryWorker) {
+      this.geometryWorker.terminate();
+      this.geometryWorker = null;
+    }
+    const pending = this.pendingGeometry;
+    this.pendingGeometry = null;
+    if (pending) pending.callback(null);
+  }
+
+  // ========================================
+  // Performance Metrics Methods
+  // ========================================
+
+  private startMeasure(name: string): number {
+    performance.mark(`clickable_table:${name}:start`);
+    return performance.now();
+  }
+
+  /**
+   * Records the clickable_table:<name> performance measure since the matching
+   * startMeasure call, replacing the previous one, and returns its duration.
+   */
+  private endMeasure(name: string, start: number): number {
+    const measureName = `clickable_table:${name}`;
+    performance.clearMeasures(measureName);
+    performance.measure(measureName, `${measureName}:start`);
+    performance.clearMarks(`${measureName}:start`);
+    return performance.now() - start;
+  }
+
+  private timed(name: string, fn: () => void): number {
+    const start = this.startMeasure(name);
+    fn();
+    return this.endMeasure(name, start);
+  }
+
+  private addChartTime(chart: keyof ChartTimings, since: number): number {
+    const now = performance.now();
+    this.metrics.chart_ms[chart] += now - since;
+    return now;
+  }
+
+  /**
+   * Runs one decoration pass as the clickable_table:decorate measure, which
+   * ends when the pass calls done (for a chunked pass, after its last chunk).
+   * With debug_metrics, the per-chart totals of the pass are recorded as
+   * clickable_table:decorate:<chart> measures as well.
+   */
+  private measureDecoration(decorate: (done: () => void) => void): void {
+    const { render_ms, column_width_ms, hidden_columns_ms } = this.metrics;
+    this.metrics = { ...emptyMetrics(), render_ms, column_width_ms, hidden_columns_ms };
+    const start = this.startMeasure('decorate');
+    decorate(() => {
+      this.metrics.decorate_ms = this.endMeasure('decorate', start);
+      this.metrics.cells_decorated = this.cellsTouched;
+      this.reportCellsTouched();
+      this.scheduleCanvasDraw();
+      if (!this.metricsEnabled) return;
+
+      let chartStart = start;
+      (Object.keys(this.metrics.chart_ms) as (keyof ChartTimings)[]).forEach(chart => {
+        const duration = this.metrics.chart_ms[chart];
+        const measureName = `clickable_table:decorate:${chart}`;
+        performance.clearMeasures(measureName);
+        // Per-row times are summed, so each chart gets one measure of the total
+        (performance as any).measure(measureName, { start: chartStart, duration });
+        chartStart += duration;
+      });
+    });
+  }
+
+  private snapshotMetrics(): DebugMetrics {
+    return { ...this.metrics, chart_ms: { ...this.metrics.chart_ms } };
+  }
+
+  // ========================================
+  // Virtualized Row Methods
+  // ========================================
+
+  /**
+   * Parses the table HTML off-document and keeps the body rows detached.
+   * Only the rows inside (or near) the scroll viewport are attached to the
+   * live <tbody>, between two spacer rows that preserve the scroll height.
+   * Rows are decorated the first time they are attached and reused afterwards.
+   */
+  private setupVirtualRows(html: string): void {
+    const host = this.tableHostRef.current;
+    const tableContainer = this.containerRef.current;
+    if (!host || !tableContainer) return;
+
+    const sourceKey = html + JSON.stringify(this.props.args.config);
+    if (sourceKey === this.virtualSourceKey && host.firstChild) {
+      this.renderVirtualWindow();
+      return;
+    }
+
+    const template = document.createElement('template');
+    template.innerHTML = html;
+    const table = template.content.querySelector('table');
+    const tbody = table ? table.querySelector('tbody') : null;
+    if (!table || !tbody) return;
+
+    this.virtualRows = Array.from(tbody.rows);
+    this.virtualRows.forEach((row, i) => {
+      if (row.dataset.row === undefined) row.dataset.row = String(i);
+    });
+    tbody.textContent = '';
+
+    const columnCount = this.virtualRows.length > 0 ? this.virtualRows[0].children.length : 1;
+    this.virtualTopSpacer = this.createSpacerRow(columnCount);
+    this.virtualBottomSpacer = this.createSpacerRow(columnCount);
+
+    host.textContent = '';
+    host.appendChild(table);
+
+    this.resetDecorationState();
+    this.virtualSourceKey = sourceKey;
+    this.virtualTbody = tbody;
+    this.virtualRowHeight = 0;
+    this.virtualRange = { start: -1, end: -1 };
+
+    this.applyIndexColumnName(tableContainer);
+    this.virtualContext = this.buildDecorationContext(tableContainer, this.virtualRows[0] || null);
+    if (this.virtualContext) this.applyFixedScaleAxes(this.virtualContext);
+    this.setupVirtualColumns();
+    this.renderVirtualWindow();
+
+    // The first window is decorated right away; later windows use the worker's geometry
+    const context = this.virtualContext;
+    if (context && this.props.args["geometry_worker"] && !context.geometry && this.virtualRows.length > 0) {
+      this.requestGeometry(this.virtualRows, context, geometry => {
+        if (geometry && this.virtualContext === context) context.geometry = geometry;
+      });
+    }
+  }
+
+  private createSpacerRow(columnCount: number): HTMLTableRowElement {
+    const spacer = document.createElement('tr');
+    spacer.className = 'virtual-spacer';
+    const cell = document.createElement('td');
+    cell.colSpan = columnCount;
+    spacer.appendChild(cell);
+    return spacer;
+  }
+
+  private renderVirtualWindow(): void {
+    const tableContainer = this.containerRef.current;
+    const tbody = this.virtualTbody;
+    if (!tableContainer || !tbody || !this.virtualTopSpacer || !this.virtualBottomSpacer) return;
+
+    const total = this.virtualRows.length;
+    const rowHeight = this.virtualRowHeight || VIRTUAL_DEFAULT_ROW_HEIGHT;
+    const thead = tbody.parentElement ? tbody.parentElement.querySelector('thead') : null;
+    const headerHeight = thead ? thead.offsetHeight : 0;
+    const scrollTop = Math.max(0, tableContainer.scrollTop - headerHeight);
+    const viewportRows = Math.ceil((tableContainer.clientHeight || 800) / rowHeight);
+
+    const start = Math.max(0, Math.floor(scrollTop / rowHeight) - VIRTUAL_OVERSCAN_ROWS);
+    const end = Math.min(total, start + viewportRows + 2 * VIRTUAL_OVERSCAN_ROWS);
+    if (start === this.virtualRange.start && end === this.virtualRange.end) return;
+
+    this.cellsTouched = 0;
+    const fragment = document.createDocumentFragment();
+    fragment.appendChild(this.virtualTopSpacer);
+    this.measureDecoration(done => {
+      for (let i = start; i < end; i++) {
+        const row = this.virtualRows[i];
+        if (row.dataset.decorated === undefined) {
+          // Rows may be reordered by a client-side sort; geometry is indexed by DataFrame position
+          const rowPos = row.dataset.row !== undefined ? Number(row.dataset.row) : i;
+          if (this.virtualContext) this.decorateRow(row, this.virtualContext, rowPos);
+          this.applyHiddenClassesToRow(row);
+          row.dataset.decorated = '1';
+        }
+        fragment.appendChild(row);
+      }
+      done();
+    });
+    fragment.appendChild(this.virtualBottomSpacer);
+
+    tbody.textContent = '';
+    tbody.appendChild(fragment);
+    this.virtualRange = { start, end };
+
+    // Measure the real row height once rows are laid out, then keep the
+    // spacers sized so the scrollbar reflects the full table
+    if (!this.virtualRowHeight && end > start) {
+      const measured = (tbody.children[1] as HTMLElement).offsetHeight;
+      if (measured > 0) this.virtualRowHeight = measured;
+    }
+    const finalRowHeight = this.virtualRowHeight || VIRTUAL_DEFAULT_ROW_HEIGHT;
+    (this.virtualTopSpacer.firstChild as HTMLElement).style.height = `${start * finalRowHeight}px`;
+    (this.virtualBottomSpacer.firstChild as HTMLElement).style.height = `${(total - end) * finalRowHeight}px`;
+  }
+
+  // ========================================
+  // Virtualized Column Methods
+  // ========================================
+
+  /**
+   * Sets up column virtualization for the rendered table. The leading index
+   * cells and pinned_columns data columns are sticky; the other columns are
+   * displayed only while they overlap the horizontal viewport. This is a
+   * limited form of virtualization: every cell stays in the DOM, so only
+   * layout and paint are saved, not DOM size or memory. Column widths start
+   * from column_width (or a default) and are replaced by the laid-out widths
+   * once a column has been shown.
+   */
+  private setupVirtualColumns(): void {
+    const config = this.props.args.config;
+    const tableContainer = this.containerRef.current;
+    const table = tableContainer ? tableContainer.querySelector('table') : null;
+    if (!config || !config.virtualize_columns || !table) {
+      this.teardownVirtualColumns();
+      return;
+    }
+
+    const configKey = JSON.stringify([config.hidden_columns, config.column_width, config.pinned_columns]);
+    if (table === this.columnTable && configKey === this.columnConfigKey) {
+      this.renderColumnWindow();
+      return;
+    }
+    this.teardownVirtualColumns();
+
+    const { headers } = this.getBottomHeaderRow(table);
+    const firstRow: Element | null = this.virtualTbody ? this.virtualRows[0] || null : table.querySelector('tbody tr');
+    const rowCells = firstRow ? firstRow.children : null;
+    const count = Math.max(headers.length, rowCells ? rowCells.length : 0);
+    let indexCells = 0;
+    while (rowCells && indexCells < rowCells.length && rowCells[indexCells].tagName === 'TH') indexCells++;
+
+    const hidden = new Set<number>(config.hidden_columns || []);
+    const configWidths: string[] = config.column_width || [];
+    this.columnWidths = [];
+    this.columnMeasured = [];
+    for (let i = 0; i < count; i++) {
+      const configured = typeof configWidths[i] === 'string' && /px\s*$/.test(configWidths[i])
+        ? parseFloat(configWidths[i])
+        : VIRTUAL_DEFAULT_COLUMN_WIDTH;
+      this.columnWidths.push(hidden.has(i) ? 0 : configured);
+      this.columnMeasured.push(false);
+    }
+    this.columnPinned = Math.min(count, indexCells + (config.pinned_columns || 0));
+    this.columnTable = table;
+    this.columnHost = table.parentElement;
+    this.columnConfigKey = configKey;
+    this.renderColumnWindow(true);
+  }
+
+  private teardownVirtualColumns(): void {
+    if (this.columnScrollFrame !== null) {
+      window.cancelAnimationFrame(this.columnScrollFrame);
+      this.columnScrollFrame = null;
+    }
+    if (this.columnStyle) this.columnStyle.textContent = '';
+    if (this.columnHost) this.columnHost.style.width = '';
+    const table = this.columnTable;
+    if (table) {
+      table.style.marginLeft = '';
+      table.querySelectorAll('thead th[data-colspan]').forEach(element => {
+        const cell = element as HTMLTableCellElement;
+        cell.colSpan = Number(cell.dataset.colspan);
+        delete cell.dataset.colspan;
+        cell.classList.remove('ct-column-off');
+        this.setElementStyles(cell, { position: '', left: '', zIndex: '' });
+      });
+    }
+    this.columnTable = null;
+    this.columnHost = null;
+    this.columnConfigKey = "";
+    this.columnWidths = [];
+    this.columnMeasured = [];
+    this.columnPinned = 0;
+    this.columnWindow = { start: -1, end: -1 };
+  }
+
+  private scheduleColumnWindow(): void {
+    if (this.columnScrollFrame !== null || !this.columnTable) return;
+    this.columnScrollFrame = window.requestAnimationFrame(() => {
+      this.columnScrollFrame = null;
+      this.renderColumnWindow();
+    });
+  }
+
+  /** Index of the first scrollable column whose right edge is past x (offsets from the pinned columns). */
+  private firstColumnEndingAfter(offsets: Float64Array, x: number): number {
+    let lo = this.columnPinned;
+    let hi = offsets.length - 1;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (offsets[mid + 1] <= x) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  /**
+   * Displays the columns overlapping the horizontal viewport, plus
+   * overscan. The table is shifted right by the width of the scrollable
+   * columns left of the window, and its host keeps the width of the full
+   * table, so the scrollbar and scroll positions match the full table.
+   * A new table gets the window for scrollLeft 0 without reading its layout,
+   * so it is never laid out with all columns shown.
+   */
+  private renderColumnWindow(initial: boolean = false): void {
+    const table = this.columnTable;
+    const tableContainer = this.containerRef.current;
+    if (!table || !table.isConnected || !tableContainer) return;
+
+    const widths = this.columnWidths;
+    const count = widths.length;
+    const pinned = this.columnPinned;
+    // offsets[i]: left edge of column i, from the right edge of the pinned columns
+    const offsets = new Float64Array(count + 1);
+    let pinnedWidth = 0;
+    for (let i = 0; i < count; i++) {
+      if (i < pinned) pinnedWidth += widths[i];
+      offsets[i + 1] = offsets[i] + (i < pinned ? 0 : widths[i]);
+    }
+
+    const scrollLeft = initial ? 0 : tableContainer.scrollLeft;
+    const viewport = Math.max(0, (initial ? window.innerWidth : tableContainer.clientWidth) - pinnedWidth);
+    const first = this.firstColumnEndingAfter(offsets, scrollLeft);
+    const last = this.firstColumnEndingAfter(offsets, scrollLeft + viewport);
+    const start = Math.max(pinned, first - VIRTUAL_OVERSCAN_COLUMNS);
+    const end = Math.min(count, last + 1 + VIRTUAL_OVERSCAN_COLUMNS);
+    if (start === this.columnWindow.start && end === this.columnWindow.end) return;
+
+    this.columnWindow = { start, end };
+    this.writeColumnStyle(start, end);
+    this.applyColumnSpans(table, start, end);
+    table.style.marginLeft = `${offsets[start]}px`;
+    if (this.columnHost) this.columnHost.style.width = `${pinnedWidth + offsets[count]}px`;
+
+    // The first window is measured in the next frame, after column_width and
+    // the decorations are applied; estimates that were off trigger another pass
+    if (initial || this.measureColumns(table, start, end)) {
+      this.columnWindow = { start: -1, end: -1 };
+      this.scheduleColumnWindow();
+    }
+    this.scheduleCanvasDraw();
+  }
+
+  /**
+   * Hides the columns outside [start, end) in the bottom header row and in
+   * every body row (present or attached later) with one stylesheet, and
+   * makes the pinned columns sticky at their offsets. Hidden cells keep
+   * their nodes, so the DOM size does not depend on the window.
+   */
+  private writeColumnStyle(start: number, end: number): void {
+    if (!this.columnStyle) {
+      this.columnStyle = document.createElement('style');
+      document.head.appendChild(this.columnStyle);
+    }
+    const pinned = this.columnPinned;
+    const count = this.columnWidths.length;
+    const scope = `.${this.instanceClass}.ct-virtual-columns`;
+    const select = (cells: string): string => [
+      `${scope} thead tr:last-child > ${cells}`,
+      `${scope} tbody tr:not(.virtual-spacer) > ${cells}`
+    ].join(', ');
+
+    const rules: string[] = [];
+    if (start > pinned) {
+      rules.push(`${select(`:nth-child(n+${pinned + 1}):nth-child(-n+${start})`)} { display: none; }`);
+    }
+    if (end < count) {
+      rules.push(`${select(`:nth-child(n+${end + 1})`)} { display: none; }`);
+    }
+    let left = 0;
+    for (let i = 0; i < pinned; i++) {
+      rules.push(`${select(`:nth-child(${i + 1})`)} { position: sticky; left: ${left}px; z-index: 2; }`);
+      left += this.columnWidths[i];
+    }
+    if (pinned > 0) {
+      rules.push(
+        `${scope} tbody tr:not(.virtual-spacer) > td:nth-child(-n+${pinned}) ` +
+        '{ background-color: var(--ct-background-color); }'
+      );
+    }
+    this.columnStyle.textContent = rules.join('\n');
+  }
+
+  /**
+   * Upper MultiIndex header rows: each group cell spans only its
+   * displayed columns and is hidden when it has none, so the groups stay
+   * aligned with the bottom row. The rendered colspan is kept in
+   * data-colspan (see headerColSpan). Groups over pinned columns only are sticky.
+   */
+  private applyColumnSpans(table: HTMLTableElement, start: number, end: number): void {
+    const thead = table.tHead;
+    if (!thead || thead.rows.length < 2) return;
+    const pinned = this.columnPinned;
+
+    for (let r = 0; r < thead.rows.length - 1; r++) {
+      let col = 0;
+      Array.from(thead.rows[r].cells).forEach(cell => {
+        const span = this.headerColSpan(cell);
+        if (cell.dataset.colspan === undefined) cell.dataset.colspan = String(span);
+        let displayed = 0;
+        let pinnedOnly = true;
+        for (let c = col; c < col + span; c++) {
+          if (c < pinned) {
+            displayed++;
+          } else if (c >= start && c < end) {
+            displayed++;
+            pinnedOnly = false;
+          }
+        }
+        cell.classList.toggle('ct-column-off', displayed === 0);
+        if (displayed > 0) cell.colSpan = displayed;
+
+        const sticky = displayed > 0 && pinnedOnly;
+        let left = 0;
+        for (let c = 0; sticky && c < col; c++) left += this.columnWidths[c];
+        this.setElementStyles(cell, {
+          position: sticky ? 'sticky' : '',
+          left: sticky ? `${left}px` : '',
+          zIndex: sticky ? '2' : ''
+        });
+        col += span;
+      });
+    }
+  }
+
+  /**
+   * Reads the laid-out width of the pinned and window columns that have not
+   * been measured yet. Returns true if a measured width differs from its estimate.
+   */
+  private measureColumns(table: HTMLTableElement, start: number, end: number): boolean {
+    const { headers } = this.getBottomHeaderRow(table);
+    let changed = false;
+    const measure = (i: number): void => {
+      if (this.columnMeasured[i] || !headers[i]) return;
+      this.columnMeasured[i] = true;
+      const width = headers[i].getBoundingClientRect().width;
+      if (Math.abs(width - this.columnWidths[i]) >= 1) {
+        this.columnWidths[i] = width;
+        changed = true;
+      }
+    };
+    for (let i = 0; i < this.columnPinned; i++) measure(i);
+    for (let i = start; i < end; i++) measure(i);
+    return changed;
+  }
+
+  // ========================================
+  // Compressed Payload Methods
+  // ========================================
+
+  /**
+   * Inflates a gzip/deflate compressed html arg with the browser's
+   * DecompressionStream and re-renders once the text is available. Without
+   * DecompressionStream, or when the payload fails to inflate, Python is asked
+   * to send the table uncompressed; the previous table stays until then.
+   */
+  private decompressHtml(bytes: Uint8Array, format: string): void {
+    this.compressedSource = bytes;
+    this.decompressedHtml = null;
+
+    const DecompressionStreamImpl = (window as any).DecompressionStream;
+    if (typeof DecompressionStreamImpl !== 'function') {
+      this.requestUncompressed();
+      return;
+    }
+    let inflated: Promise<string>;
+    try {
+      const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStreamImpl(format));
+      inflated = new Response(stream).text();
+    } catch (error) {
+      this.requestUncompressed();
+      return;
+    }
+    inflated.then(text => {
+      // Ignore the result if a newer payload arrived in the meantime
+      if (this.compressedSource !== bytes) return;
+      this.decompressedHtml = text;
+      this.forceUpdate();
+    }).catch(() => {
+      if (this.compressedSource !== bytes) return;
+      this.requestUncompressed();
+    });
+  }
+
+  /** Asks Python to send this table uncompressed from now on. */
+  private requestUncompressed(): void {
+    const key = this.props.args["key"];
+    this.sendValue({ key, event: 'resync', reason: 'decompress', nonce: Date.now() });
+  }
+
+  // ========================================
+  // Diff Update Methods
+  // ========================================
+
+  private parseRow(rowHtml: string): HTMLTableRowElement | null {
+    const template = document.createElement('template');
+    template.innerHTML = `<table><tbody>${rowHtml}</tbody></table>`;
+    return template.content.querySelector('tr');
+  }
+
+  /** Drops decoration bookkeeping for cells that are about to leave the table. */
+  private forgetCells(cells: Element[]): void {
+    cells.forEach(cell => {
+      this.decoratedCells.delete(cell as HTMLElement);
+      if (this.tooltipCell === cell) this.hideTooltip();
+    });
+  }
+
+  /**
+   * Applies a diff-mode patch to the rendered rows and re-decorates only the
+   * rows it touched. Returns false when the rows on screen are not the version
+   * the patch was computed against.
+   */
+  private applyPatch(diff: DiffInfo): boolean {
+    const patch = diff.patch;
+    const tableContainer = this.containerRef.current;
+    const virtual = this.virtualTbody !== null;
+    const tbody = virtual ? this.virtualTbody : (tableContainer ? tableContainer.querySelector('tbody') : null);
+    if (!patch || !tableContainer || !tbody || diff.base !== this.diffVersion) return false;
+
+    const rows: HTMLTableRowElement[] = virtual ? this.virtualRows : Array.from(tbody.rows);
+    const touched = new Set<HTMLTableRowElement>();
+
+    // Removed rows, last first so the remaining old positions stay valid
+    [...patch.removed].sort((a, b) => b - a).forEach(pos => {
+      const row = rows[pos];
+      if (!row) return;
+      this.forgetCells(Array.from(row.children));
+      rows.splice(pos, 1);
+      if (row.parentNode) row.parentNode.removeChild(row);
+    });
+
+    // Added rows, in ascending new positions
+    patch.added.forEach(([pos, rowHtml]) => {
+      const row = this.parseRow(rowHtml);
+      if (!row) return;
+      if (!virtual) tbody.insertBefore(row, rows[pos] || null);
+      rows.splice(pos, 0, row);
+      touched.add(row);
+    });
+
+    patch.rows.forEach(([pos, rowHtml]) => {
+      const oldRow = rows[pos];
+      const row = this.parseRow(rowHtml);
+      if (!oldRow || !row) return;
+      this.forgetCells(Array.from(oldRow.children));
+      if (oldRow.parentNode) oldRow.parentNode.replaceChild(row, oldRow);
+      rows[pos] = row;
+      touched.add(row);
+    });
+
+    patch.cells.forEach(([pos, cells]) => {
+      const row = rows[pos];
+      const parsed = this.parseRow(`<tr>${cells.map(([, cellHtml]) => cellHtml).join('')}</tr>`);
+      if (!row || !parsed) return;
+      const newCells = Array.from(parsed.children);
+      cells.forEach(([cellIdx], i) => {
+        const oldCell = row.children[cellIdx];
+        if (!oldCell || !newCells[i]) return;
+        this.forgetCells([oldCell]);
+        row.replaceChild(newCells[i], oldCell);
+      });
+      // Charts read values from other cells of the row, so rebuild them all
+      Array.from(row.children).forEach(cell => {
+        if (this.cellDecorations.has(cell as HTMLElement)) {
+          this.restoreCell(cell as HTMLElement);
+          this.decoratedCells.delete(cell as HTMLElement);
         }
+      });
+      touched.add(row);
+    });
+
+    if (patch.style !== null) {
+      const table = tableContainer.querySelector('table');
+      tableContainer.querySelectorAll('style').forEach(style => style.remove());
+      if (table && table.parentNode) {
+        const template = document.createElement('template');
+        template.innerHTML = patch.style;
+        table.parentNode.insertBefore(template.content, table);
       }
     }
+
+    // Added and removed rows shift the positions of the rows after them
+    rows.forEach((row, i) => { row.dataset.row = String(i); });
+
+    this.cellsTouched = 0;
+    if (virtual) {
+      // Geometry of the previous rows no longer lines up with the patched rows
+      if (this.virtualContext) this.virtualContext.geometry = this.props.args.geometry || null;
+      // Touched rows are decorated when they are next attached
+      touched.forEach(row => { delete row.dataset.decorated; });
+      this.virtualRange = { start: -1, end: -1 };
+      this.renderVirtualWindow();
+    } else {
+      const context = this.buildDecorationContext(tableContainer, rows[0] || null);
+      this.measureDecoration(done => {
+        rows.forEach((row, i) => {
+          if (!touched.has(row)) return;
+          if (context) this.decorateRow(row, context, this.rowPosition(row, i));
+          this.applyHiddenClassesToRow(row);
+        });
+        done();
+      });
+    }
+
+    this.diffVersion = diff.version;
+    this.diffPatched = true;
+    return true;
+  }
+
+  /** Asks Python to drop its diff state and send the full table. */
+  private requestResync(version: number): void {
+    if (this.resyncVersion === version) return;
+    this.resyncVersion = version;
+    const key = this.props.args["key"];
+    this.sendValue({ key, event: 'resync', nonce: Date.now() });
+  }
+
+  private handleScroll = (): void => {
+    const config = this.props.args.config;
+    if (config && config.virtualize_rows && this.virtualScrollFrame === null) {
+      this.virtualScrollFrame = window.requestAnimationFrame(() => {
+        this.virtualScrollFrame = null;
+        this.renderVirtualWindow();
+      });
+    }
+    if (config && config.virtualize_columns) this.scheduleColumnWindow();
+    // Queued after the window renders, so the canvas sees the new rows and columns
+    this.scheduleCanvasDraw();
+  }
+
+  private handleResize = (): void => {
+    this.scheduleColumnWindow();
+    this.scheduleCanvasDraw();
+  }
+
+  /**
+   * One delegated handler for the whole table. Clicks on chart elements
+   * resolve to their cell, and the header comes from the cached header map.
+   */
+  private handleClick = (event: React.MouseEvent<HTMLDivElement, MouseEvent>): void => {
+    const target = event.target as HTMLElement;
+    const cell = target.closest ? target.closest('td, th') as HTMLTableCellElement | null : null;
+    if (!cell || !event.currentTarget.contains(cell)) return;
+    const rowElement = cell.parentElement;
+    if (!rowElement || rowElement.tagName !== "TR" || rowElement.classList.contains('virtual-spacer')) return;
+    const tableRow = rowElement as HTMLTableRowElement;
+    const inHeader = !!tableRow.parentElement && tableRow.parentElement.tagName === "THEAD";
+
+    if (inHeader && this.props.args.config?.sortable) {
+      this.handleHeaderSort(cell);
+      return;
+    }
+
+    // For multi-level headers, the column name is the bottom-level header label
+    const headerMap = this.getHeaderMap(cell);
+    const column = headerMap ? headerMap.columns[cell.cellIndex] : undefined;
+    if (!headerMap || !column) return;
+
+    // The text from before decoration: no layout read, and chart cells report their value
+    const cellValue = this.originalCellText(tableRow, cell.cellIndex).trim();
+    const header = column.label;
+    const headerPath = column.path;
+    // Rows built from the arrow payload or detached by virtualization
+    // carry their DataFrame position, independent of their DOM position
+    const localRowIndex = tableRow.dataset.row !== undefined
+      ? Number(tableRow.dataset.row)
+      : tableRow.rowIndex - headerMap.rowCount;
+    // With server-side pagination or sorting, report the position in the full DataFrame
+    const page: PageInfo | null = this.props.args["page"];
+    const rowPositions: number[] | null = this.props.args["row_positions"] || null;
+    const rowIndex = rowPositions && !inHeader
+      ? rowPositions[localRowIndex]
+      : localRowIndex + (page ? page.start : 0);
+    const key = this.props.args["key"];
+    const metrics = this.metricsEnabled ? this.snapshotMetrics() : undefined;
+    this.setState({ key, cellValue, header, rowIndex }, () => {
+      this.sendValue(metrics
+        ? { key, cellValue, header, headerPath, rowIndex, metrics }
+        : { key, cellValue, header, headerPath, rowIndex });
+    });
   }
 
   private applyColumnWidth = (): void => {
     if (!this.props.args.config.column_width) return;
     if (this.props.args.config.column_width.length <= 0) return;
 
-    const tableContainer = document.querySelector('.clickabletable-container');
+    const tableContainer = this.containerRef.current;
     if (!tableContainer) return;
 
     // Apply widths to the bottom-level header row (1:1 mapping with data columns)
@@ -907,12 +2945,51 @@ class ClickableTable extends StreamlitComponentBase<State> {
     }
   }
 
+  /**
+   * For multi-level headers, use zero-width hiding to keep cells in the table
+   * grid so that colspan alignment in upper header rows works correctly.
+   * For single-level headers, use display:none (the original behavior).
+   */
+  private getHideClass(theadRows: NodeListOf<Element> | null): string {
+    const isMultiLevel = theadRows && theadRows.length > 1;
+    return isMultiLevel ? 'hide-column-zero-width' : this.props.args.config.hidden_column_class;
+  }
+
+  private applyHiddenClassesToRow(row: Element): void {
+    const hiddenColumns: number[] = this.props.args.config.hidden_columns;
+    const hiddenClass: string = this.props.args.config.hidden_column_class;
+    if (!hiddenColumns || !hiddenClass || hiddenColumns.length <= 0) return;
+
+    const table = this.virtualTbody
+      ? this.virtualTbody.parentElement
+      : this.queryContainer('table');
+    const theadRows = table ? table.querySelectorAll('thead tr') : null;
+    const hideClass = this.getHideClass(theadRows);
+
+    hiddenColumns.forEach((colIdx: number) => {
+      const cell = row.children[colIdx];
+      if (cell) {
+        cell.classList.add(hideClass);
+      }
+    });
+  }
+
+  private clearHiddenColumnClasses(hiddenClass: string): void {
+    const tableContainer = this.containerRef.current;
+    if (!tableContainer) return;
+
+    const classes = ['hide-column-zero-width', hiddenClass].filter(Boolean);
+    classes.forEach(cls => {
+      tableContainer.querySelectorAll(`.${cls}`).forEach(cell => cell.classList.remove(cls));
+    });
+  }
+
   private applyHiddenColumnClasses = (): void => {
     const hiddenColumns: number[] = this.props.args.config.hidden_columns;
     const hiddenClass: string = this.props.args.config.hidden_column_class;
     if (!hiddenColumns || !hiddenClass || hiddenColumns.length <= 0) return;
 
-    const tableContainer = document.querySelector('.clickabletable-container');
+    const tableContainer = this.containerRef.current;
     if (!tableContainer) return;
 
     const table = tableContainer.querySelector('table');
@@ -922,24 +2999,20 @@ class ClickableTable extends StreamlitComponentBase<State> {
     const tbody = table.querySelector('tbody');
     const theadRows = thead ? thead.querySelectorAll('tr') : null;
     const isMultiLevel = theadRows && theadRows.length > 1;
+    const hideClass = this.getHideClass(theadRows);
 
-    // For multi-level headers, use zero-width hiding to keep cells in the table
-    // grid so that colspan alignment in upper header rows works correctly.
-    // For single-level headers, use display:none (the original behavior).
-    const hideClass = isMultiLevel ? 'hide-column-zero-width' : hiddenClass;
-
-    // Handle body rows
-    if (tbody) {
-      const bodyRows = tbody.querySelectorAll('tr');
-      bodyRows.forEach(row => {
+    // Handle body rows (virtualized rows are handled as they are attached)
+    if (tbody && !this.props.args.config.virtualize_rows) {
+      const bodyRows = tbody.rows;
+      for (let r = 0; r < bodyRows.length; r++) {
+        const cells = bodyRows[r].children;
         hiddenColumns.forEach((colIdx: number) => {
-          const cssColIdx = colIdx + 1;
-          const cell = row.querySelector(`th:nth-child(${cssColIdx}), td:nth-child(${cssColIdx})`);
+          const cell = cells[colIdx];
           if (cell) {
             cell.classList.add(hideClass);
           }
         });
-      });
+      }
     }
 
     // Handle header rows
@@ -964,7 +3037,7 @@ class ClickableTable extends StreamlitComponentBase<State> {
           const cells = row.querySelectorAll('th');
           let visualCol = 0;
           cells.forEach(cell => {
-            const colspan = parseInt(cell.getAttribute('colspan') || '1', 10);
+            const colspan = this.headerColSpan(cell as HTMLTableCellElement);
             const spannedCols: number[] = [];
             for (let i = 0; i < colspan; i++) {
               spannedCols.push(visualCol + i);
@@ -986,8 +3059,360 @@ class ClickableTable extends StreamlitComponentBase<State> {
     }
   }
 
+  // ========================================
+  // Sort and Filter Methods
+  // ========================================
+
+  /**
+   * Header clicks on the bottom header row cycle the column through
+   * ascending, descending and unsorted. Sorting itself runs in Python.
+   */
+  private handleHeaderSort(cell: HTMLTableCellElement): void {
+    const view: ViewInfo | null = this.props.args["view"] || null;
+    if (!view) return;
+    const headerMap = this.getHeaderMap(cell);
+    if (!headerMap || cell.parentElement !== headerMap.thead.rows[headerMap.rowCount - 1]) return;
+    const entry = view.columns.find(([cellIdx]) => cellIdx === cell.cellIndex);
+    if (!entry) return;
+
+    if (this.isClientView()) {
+      const cellIdx = entry[0];
+      const sort = this.clientSort;
+      this.clientSort = sort && sort.column === cellIdx
+        ? (sort.ascending ? { column: cellIdx, ascending: false } : null)
+        : { column: cellIdx, ascending: true };
+      this.applyClientView();
+      this.applySortIndicator();
+      return;
+    }
+
+    const column = entry[1];
+    const current = view.sort;
+    const key = this.props.args["key"];
+    if (current && current.column === column) {
+      this.sendValue(current.ascending
+        ? { key, event: 'sort', column, ascending: false }
+        : { key, event: 'sort', column: null });
+    } else {
+      this.sendValue({ key, event: 'sort', column, ascending: true });
+    }
+  }
+
+  /** Marks sortable headers and the sorted column in the bottom header row. */
+  private applySortIndicator(): void {
+    const view: ViewInfo | null = this.props.args["view"] || null;
+    const tableContainer = this.containerRef.current;
+    if (!view || !tableContainer || !this.props.args.config.sortable) return;
+
+    const client = this.isClientView();
+    const sort = client ? this.clientSort : view.sort;
+    const { headers } = this.getBottomHeaderRow(tableContainer);
+    headers.forEach(header => header.classList.remove('ct-sorted-asc', 'ct-sorted-desc'));
+    view.columns.forEach(([cellIdx, column]) => {
+      const header = headers[cellIdx];
+      if (!header) return;
+      header.classList.add('ct-sortable');
+      if (sort && sort.column === (client ? cellIdx : column)) {
+        header.classList.add(sort.ascending ? 'ct-sorted-asc' : 'ct-sorted-desc');
+      }
+    });
+  }
+
+  private isClientView(): boolean {
+    return !!this.props.args.config && this.props.args.config.sort_mode === 'client';
+  }
+
+  /**
+   * The rows of the current table in their original order. Static rows get
+   * data-row, so clicks still report their DataFrame position after sorting.
+   */
+  private getClientRows(): HTMLTableRowElement[] {
+    if (!this.clientRows) {
+      if (this.virtualTbody) {
+        this.clientRows = [...this.virtualRows];
+      } else {
+        const tbody = this.queryContainer('tbody') as HTMLTableSectionElement | null;
+        this.clientRows = tbody ? Array.from(tbody.rows) : [];
+        this.clientRows.forEach((row, i) => {
+          if (row.dataset.row === undefined) row.dataset.row = String(i);
+        });
+      }
+      this.clientNumbers.clear();
+      this.clientTexts.clear();
+    }
+    return this.clientRows;
+  }
+
+  /** The text a cell had before a chart replaced it. */
+  private originalCellText(row: HTMLTableRowElement, cellIdx: number): string {
+    const cell = row.children[cellIdx] as HTMLElement | undefined;
+    if (!cell) return '';
+    const original = this.cellOriginals.get(cell);
+    return original ? original.text : (cell.textContent || '');
+  }
+
+  /**
+   * Numeric values of one column in original row order, parsed once into a
+   * typed array (NaN for text). Arrow payloads reuse the typed column arrays.
+   */
+  private getClientNumbers(cellIdx: number): Float64Array {
+    let values = this.clientNumbers.get(cellIdx);
+    if (!values) {
+      const rows = this.getClientRows();
+      const arrowValues = this.columnValues ? this.columnValues[cellIdx - this.headerColumnCount] : null;
+      const parsed = new Float64Array(rows.length);
+      rows.forEach((row, i) => {
+        parsed[i] = arrowValues
+          ? arrowValues[Number(row.dataset.row)]
+          : this.parseNumericValue(this.originalCellText(row, cellIdx));
+      });
+      this.clientNumbers.set(cellIdx, parsed);
+      values = parsed;
+    }
+    return values;
+  }
+
+  private getClientTexts(cellIdx: number): string[] {
+    let texts = this.clientTexts.get(cellIdx);
+    if (!texts) {
+      texts = this.getClientRows().map(row => this.originalCellText(row, cellIdx).trim().toLowerCase());
+      this.clientTexts.set(cellIdx, texts);
+    }
+    return texts;
+  }
+
+  /**
+   * Filters and sorts the rows through an index permutation over the typed
+   * column values, then reattaches the existing row nodes in that order, so
+   * chart decorations are kept. Numbers sort before text, in both directions.
+   */
+  private applyClientView(): void {
+    const rows = this.getClientRows();
+    let order: number[] = [];
+    for (let i = 0; i < rows.length; i++) order.push(i);
+
+    Object.keys(this.clientFilters).forEach(cell => {
+      const text = this.clientFilters[cell];
+      const match = NUMERIC_FILTER_RE.exec(text);
+      if (match) {
+        const values = this.getClientNumbers(Number(cell));
+        const target = parseFloat(match[2]);
+        order = order.filter(i => compareNumber(values[i], match[1], target));
+      } else {
+        const texts = this.getClientTexts(Number(cell));
+        const needle = text.trim().toLowerCase();
+        order = order.filter(i => texts[i].includes(needle));
+      }
+    });
+
+    const sort = this.clientSort;
+    if (sort) {
+      const direction = sort.ascending ? 1 : -1;
+      const values = this.getClientNumbers(sort.column);
+      let texts: string[] | null = null;
+      order.sort((a, b) => {
+        const aNumber = !isNaN(values[a]);
+        const bNumber = !isNaN(values[b]);
+        if (aNumber && bNumber) return direction * (values[a] - values[b]);
+        if (aNumber !== bNumber) return aNumber ? -1 : 1;
+        const sortTexts = texts || (texts = this.getClientTexts(sort.column));
+        return direction * sortTexts[a].localeCompare(sortTexts[b]);
+      });
+    }
+
+    this.clientVisibleRows = order.length;
+    const ordered = order.map(i => rows[i]);
+    const tableContainer = this.containerRef.current;
+    if (tableContainer) tableContainer.scrollTop = 0;
+    if (this.virtualTbody) {
+      this.virtualRows = ordered;
+      this.virtualRange = { start: -1, end: -1 };
+      this.renderVirtualWindow();
+      return;
+    }
+    const tbody = tableContainer ? tableContainer.querySelector('tbody') : null;
+    if (!tbody) return;
+    const fragment = document.createDocumentFragment();
+    ordered.forEach(row => fragment.appendChild(row));
+    tbody.textContent = '';
+    tbody.appendChild(fragment);
+    this.scheduleCanvasDraw();
+  }
+
+  /** Puts the rows back in their original order, e.g. before applying a diff patch. */
+  private restoreClientOrder(): void {
+    const rows = this.clientRows;
+    if (!rows) return;
+    this.clientRows = null;
+    if (this.virtualTbody) {
+      this.virtualRows = [...rows];
+      return;
+    }
+    const tbody = this.queryContainer('tbody');
+    if (!tbody) return;
+    const fragment = document.createDocumentFragment();
+    rows.forEach(row => fragment.appendChild(row));
+    tbody.textContent = '';
+    tbody.appendChild(fragment);
+  }
+
+  private hasClientView(): boolean {
+    return this.clientSort !== null || Object.keys(this.clientFilters).length > 0;
+  }
+
+  /** Re-applies the client-side sort and filters to a newly rendered table. */
+  private syncClientView(html: string): void {
+    if (!this.isClientView()) return;
+    const sourceKey = html + JSON.stringify(this.props.args.config);
+    if (sourceKey === this.clientSourceKey) return;
+    this.clientSourceKey = sourceKey;
+    this.clientRows = null;
+    if (this.hasClientView()) this.applyClientView();
+  }
+
+  private currentFilters(view: ViewInfo): { [column: string]: string } {
+    return this.isClientView() ? this.clientFilters : view.filters;
+  }
+
+  private requestFilters(filters: { [column: string]: string }): void {
+    if (this.isClientView()) {
+      this.clientFilters = filters;
+      this.applyClientView();
+      this.forceUpdate();
+      return;
+    }
+    const tableContainer = this.containerRef.current;
+    if (tableContainer) tableContainer.scrollTop = 0;
+    const key = this.props.args["key"];
+    this.sendValue({ key, event: 'filter', filters });
+  }
+
+  private addFilter = (): void => {
+    const view: ViewInfo | null = this.props.args["view"] || null;
+    const select = this.filterColumnRef.current;
+    const input = this.filterTextRef.current;
+    if (!view || !select || !input || !input.value.trim()) return;
+    this.requestFilters({ ...this.currentFilters(view), [select.value]: input.value.trim() });
+    input.value = '';
+  }
+
+  private removeFilter(column: string): void {
+    const view: ViewInfo | null = this.props.args["view"] || null;
+    if (!view) return;
+    const filters = { ...this.currentFilters(view) };
+    delete filters[column];
+    this.requestFilters(filters);
+  }
+
+  private renderFilterBar(view: ViewInfo): ReactNode {
+    // Filters are keyed by DataFrame column, or by cell index in client mode
+    const client = this.isClientView();
+    const filters = this.currentFilters(view);
+    const labels: { [column: string]: string } = {};
+    view.columns.forEach(([cellIdx, column, label]) => { labels[String(client ? cellIdx : column)] = label; });
+    const active = Object.keys(filters);
+    const rows = client ? this.clientVisibleRows : view.rows;
+    const totalRows = client ? (this.clientRows ? this.clientRows.length : rows) : view.total_rows;
+
+    return (
+      <div className="clickabletable-filters">
+        <select ref={this.filterColumnRef}>
+          {view.columns.map(([cellIdx, column, label]) => (
+            <option key={column} value={client ? cellIdx : column}>{label}</option>
+          ))}
+        </select>
+        <input
+          ref={this.filterTextRef}
+          type="text"
+          placeholder="e.g. > 5 or text"
+          onKeyDown={(event) => { if (event.key === 'Enter') this.addFilter(); }}
+        />
+        <button onClick={this.addFilter}>Filter</button>
+        {active.map(column => (
+          <span key={column} className="clickabletable-filter-chip">
+            {labels[column] || `Column ${column}`}: {filters[column]}
+            <button onClick={() => this.removeFilter(column)}>×</button>
+          </span>
+        ))}
+        {active.length > 0 && rows !== totalRows && (
+          <span className="clickabletable-filter-count">{rows} of {totalRows} rows</span>
+        )}
+      </div>
+    )
+  }
+
+  // ========================================
+  // Pagination Methods
+  // ========================================
+
+  private requestPage = (page: number): void => {
+    const tableContainer = this.containerRef.current;
+    if (tableContainer) tableContainer.scrollTop = 0;
+    const key = this.props.args["key"];
+    this.sendValue({ key, event: 'page', page });
+  }
+
+  private renderPagination(page: PageInfo): ReactNode {
+    const isFirst = page.page <= 0;
+    const isLast = page.page >= page.page_count - 1;
+    const firstRow = page.total_rows > 0 ? page.start + 1 : 0;
+
+    return (
+      <div className="clickabletable-pagination">
+        <button disabled={isFirst} onClick={() => this.requestPage(0)}>«</button>
+        <button disabled={isFirst} onClick={() => this.requestPage(page.page - 1)}>‹</button>
+        <span>
+          Page {page.page + 1} of {page.page_count} (rows {firstRow}–{page.end} of {page.total_rows})
+        </span>
+        <button disabled={isLast} onClick={() => this.requestPage(page.page + 1)}>›</button>
+        <button disabled={isLast} onClick={() => this.requestPage(page.page_count - 1)}>»</button>
+      </div>
+    )
+  }
+
   public render = (): ReactNode => {
-    const html = this.props.args["html"];
+    this.metricsEnabled = !!this.props.args["debug_metrics"];
+    const payload = this.props.args["payload"];
+    const diff: DiffInfo | null = this.props.args["diff"] || null;
+    const compressed: Uint8Array | null = this.props.args["html_compressed"] || null;
+    let html: string;
+    let inflating = false;
+    if (payload === "arrow" && this.props.args["data"]) {
+      html = this.getArrowHtml(this.props.args["data"]);
+    } else if (compressed) {
+      if (compressed !== this.compressedSource) {
+        this.decompressHtml(compressed, this.props.args["compression"]);
+      }
+      inflating = this.decompressedHtml === null;
+      html = inflating ? this.renderedHtml : this.decompressedHtml as string;
+      this.arrowSource = null;
+      this.columnValues = null;
+    } else {
+      html = this.props.args["html"];
+      this.arrowSource = null;
+      this.columnValues = null;
+    }
+    if (!compressed) {
+      this.compressedSource = null;
+      this.decompressedHtml = null;
+    }
+
+    // A patch comes without html: keep rendering the last full table, which
+    // React leaves untouched, and patch its rows in place
+    if (inflating) {
+      // Keep the previous table until the new payload is inflated
+    } else if (diff && diff.patch) {
+      html = this.diffBaseHtml !== null ? this.diffBaseHtml : '';
+    } else {
+      this.diffBaseHtml = diff ? html : null;
+      if (this.diffPatched) {
+        // The DOM holds patched rows: remount even if the html string is unchanged
+        this.diffPatched = false;
+        this.tableGeneration++;
+        this.decoratedHtml = null;
+        this.virtualSourceKey = "";
+      }
+    }
     const max_height = this.props.args["max_height"];
 
     const { theme } = this.props
@@ -995,7 +3420,7 @@ class ClickableTable extends StreamlitComponentBase<State> {
 
     if (theme && theme.primaryColor) {
       document.documentElement.style.setProperty('--header-bg-color', theme.secondaryBackgroundColor);
-      document.documentElement.style.setProperty('--max-height', max_height);
+      document.documentElement.style.setProperty('--ct-background-color', theme.backgroundColor);
       document.documentElement.style.setProperty('--hover-color', theme.primaryColor);
       document.documentElement.style.setProperty('--border-color', adjustColor(theme.secondaryBackgroundColor, -5));
       const borderStyling = `1px solid`
@@ -1003,22 +3428,104 @@ class ClickableTable extends StreamlitComponentBase<State> {
       style.outline = borderStyling
     }
 
+    const virtualize = !!(this.props.args.config && this.props.args.config.virtualize_rows);
+    const containerClass = this.props.args.config && this.props.args.config.virtualize_columns
+      ? `clickabletable-container ${this.instanceClass} ct-virtual-columns`
+      : `clickabletable-container ${this.instanceClass}`;
+    // Each table has its own max_height, so it is set on its container
+    const containerStyle = { '--max-height': max_height } as React.CSSProperties;
+    const page: PageInfo | null = this.props.args["page"];
+    const view: ViewInfo | null = this.props.args["view"] || null;
+    const filterBar = view && this.props.args.config.filterable ? this.renderFilterBar(view) : null;
+    // Overlay for 'renderer': 'canvas' charts, pinned to the top left of the viewport
+    const canvasLayer = this.hasCanvasCharts()
+      ? <div className="ct-canvas-layer"><canvas ref={this.canvasRef}></canvas></div>
+      : null;
+
+    // Renders that leave the table unchanged (e.g. after a click) are not measured
+    const renderStart = html !== this.renderedHtml ? this.startMeasure('render') : null;
+    this.renderedHtml = html;
+
     setTimeout(() => {
-      this.applyStylesToPercentageCells();
-      this.applyColumnWidth();
-      this.applyHiddenColumnClasses();
+      if (inflating) return;
+      if (renderStart !== null) {
+        // Covers the React commit and the browser parsing the table HTML
+        this.metrics.render_ms = this.endMeasure('render', renderStart);
+      }
+      if (diff && diff.patch) {
+        if (diff.version !== this.diffVersion) {
+          // Patch positions refer to the original row order
+          this.finishDecoration();
+          this.restoreClientOrder();
+          if (!this.applyPatch(diff)) {
+            this.requestResync(diff.version);
+          } else if (this.isClientView() && this.hasClientView()) {
+            this.applyClientView();
+          }
+        }
+        return;
+      }
+      if (virtualize) {
+        this.cancelDecoration();
+        this.setupVirtualRows(html);
+        this.metrics.column_width_ms = this.timed('column_width', this.applyColumnWidth);
+        this.metrics.hidden_columns_ms = this.timed('hidden_columns', this.applyHiddenColumnClasses);
+      } else {
+        this.setupVirtualColumns();
+        this.applyDecorations(html);
+      }
+      this.syncClientView(html);
+      this.applySortIndicator();
+      this.buildHeaderMap(this.queryContainer('table'));
+      this.diffVersion = diff ? diff.version : 0;
     }, 0);
 
+    if (virtualize) {
+      // The table is inserted and windowed by setupVirtualRows
+      return (
+        <div>
+          {filterBar}
+          <div className={containerClass} style={containerStyle} ref={this.containerRef} onScroll={this.handleScroll}>
+            {canvasLayer}
+            <div
+              key="virtual"
+              ref={this.tableHostRef}
+              onClick={this.handleClick}
+              onMouseOver={this.handleTooltipOver}
+              onMouseOut={this.handleTooltipOut}
+              style={{ cursor: 'pointer' }}
+            ></div>
+          </div>
+          {page && this.renderPagination(page)}
+        </div>
+      )
+    }
+
+    if (this.virtualTbody) {
+      // Leaving virtual mode remounts the table markup
+      this.virtualSourceKey = "";
+      this.virtualTbody = null;
+      this.decoratedHtml = null;
+    }
+
     return (
-      <div className="clickabletable-container">
-        <div
-          dangerouslySetInnerHTML={{ __html: html }}
-          onClick={this.handleClick}
-          style={{ cursor: 'pointer' }}
-        ></div>
+      <div>
+        {filterBar}
+        <div className={containerClass} style={containerStyle} ref={this.containerRef} onScroll={this.handleScroll}>
+          {canvasLayer}
+          <div
+            key={`static-${this.tableGeneration}`}
+            dangerouslySetInnerHTML={{ __html: html }}
+            onClick={this.handleClick}
+            onMouseOver={this.handleTooltipOver}
+            onMouseOut={this.handleTooltipOut}
+            style={{ cursor: 'pointer' }}
+          ></div>
+        </div>
+        {page && this.renderPagination(page)}
       </div>
     )
   }
 }
 
-export default withStreamlitConnection(ClickableTable)
+export default ClickableTable
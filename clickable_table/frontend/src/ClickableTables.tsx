@@ -0,0 +1,40 @@
+import {
+  StreamlitComponentBase,
+  withStreamlitConnection,
+} from "streamlit-component-lib"
+import React, { ReactNode } from "react"
+import ClickableTable from "./ClickableTable"
+
+/**
+ * Root component of the iframe. A clickable_table() call sends the args of
+ * one table, rendered by a single ClickableTable. A clickable_tables() call
+ * sends one args object per table in args.tables; each is rendered by its
+ * own ClickableTable, so all tables share one iframe, one bundle and one
+ * Streamlit connection. Their values carry the table name (see sendValue).
+ */
+class ClickableTables extends StreamlitComponentBase {
+  public render = (): ReactNode => {
+    const tables: any[] | undefined = this.props.args["tables"];
+    if (!tables) {
+      return <ClickableTable {...this.props} />
+    }
+
+    const key = this.props.args["key"];
+    return (
+      <div>
+        {tables.map(args => (
+          <div className="clickabletables-item" key={args.table}>
+            <ClickableTable
+              args={{ ...args, key }}
+              width={this.props.width}
+              disabled={this.props.disabled}
+              theme={this.props.theme}
+            />
+          </div>
+        ))}
+      </div>
+    )
+  }
+}
+
+export default withStreamlitConnection(ClickableTables)
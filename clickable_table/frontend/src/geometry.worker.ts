@@ -0,0 +1,175 @@
+/**
+ * Chart geometry worker (geometry_worker=True).
+ *
+ * Receives the raw values of every column a chart reads, keyed by child index:
+ * either numbers (Float64Array) or cell texts (UTF-8, separated by
+ * CELL_SEPARATOR). Parses the texts like parseNumericValue in ClickableTable
+ * and computes the same geometry as precompute_geometry does in Python, as
+ * typed arrays indexed by body row position (NaN for missing values). All
+ * buffers are transferred, in both directions.
+ */
+
+const CELL_SEPARATOR = '\u001f';
+
+interface ColumnMessage {
+  childIdx: number
+  numbers?: Float64Array
+  text?: Uint8Array
+}
+
+interface GeometryRequest {
+  id: number
+  rowCount: number
+  indexOffset: number
+  columns: ColumnMessage[]
+  charts: {
+    data_bar_chart_columns?: any[]
+    david_hum_columns?: any[]
+    range_chart?: any[]
+    fixed_scale_range_chart?: any[]
+  }
+}
+
+// eslint-disable-next-line no-restricted-globals
+const ctx: any = self;
+
+function parseNumericValue(cellContent: string): number {
+  if (cellContent.includes('%')) {
+    return parseFloat(cellContent.replace('%', ''));
+  }
+  return parseFloat(cellContent);
+}
+
+function decodeColumns(request: GeometryRequest): Map<number, Float64Array> {
+  const decoder = new TextDecoder();
+  const columns = new Map<number, Float64Array>();
+  request.columns.forEach(column => {
+    if (column.numbers) {
+      columns.set(column.childIdx, column.numbers);
+      return;
+    }
+    const texts = decoder.decode(column.text).split(CELL_SEPARATOR);
+    const values = new Float64Array(request.rowCount);
+    for (let i = 0; i < values.length; i++) {
+      // Empty cells stay NaN, as in _numeric_column on the Python side
+      values[i] = parseNumericValue(texts[i] || '');
+    }
+    columns.set(column.childIdx, values);
+  });
+  return columns;
+}
+
+function leftPositions(values: Float64Array, low: Float64Array, high: Float64Array): Float64Array {
+  const positions = new Float64Array(values.length);
+  for (let i = 0; i < values.length; i++) {
+    positions[i] = ((values[i] - low[i]) / (high[i] - low[i])) * 98;
+  }
+  return positions;
+}
+
+function computeGeometry(request: GeometryRequest): { geometry: any, buffers: ArrayBuffer[] } {
+  const columns = decodeColumns(request);
+  const rowCount = request.rowCount;
+  const empty = new Float64Array(rowCount).fill(NaN);
+  const column = (childIdx: number): Float64Array => columns.get(childIdx) || empty;
+  // A column read by several charts is transferred once
+  const buffers = new Set<ArrayBuffer>();
+  const keep = <T extends Float64Array | Int8Array>(values: T): T => {
+    buffers.add(values.buffer as ArrayBuffer);
+    return values;
+  };
+  const charts = request.charts;
+
+  const dataBars = (charts.data_bar_chart_columns || []).map(params => {
+    const values = column(params.col_idx);
+    const scaleLeft = 50 / Math.abs(params.min);
+    const scaleRight = 50 / params.max;
+    const width = new Float64Array(rowCount);
+    const negative = new Int8Array(rowCount);
+    for (let i = 0; i < rowCount; i++) {
+      negative[i] = values[i] < 0 ? 1 : 0;
+      width[i] = negative[i] ? Math.abs(values[i]) * scaleLeft : values[i] * scaleRight;
+    }
+    const geometry: any = { width: keep(width), negative: keep(negative), value: keep(values) };
+    if (params.recommended_idx !== undefined) {
+      const recommended = column(params.recommended_idx);
+      const marker = new Float64Array(rowCount);
+      for (let i = 0; i < rowCount; i++) {
+        marker[i] = recommended[i] < 0
+          ? 50 - Math.abs(recommended[i]) * scaleLeft
+          : 50 + recommended[i] * scaleRight;
+      }
+      geometry.marker = keep(marker);
+      geometry.recommended = keep(recommended);
+    }
+    return geometry;
+  });
+
+  const davidHums = (charts.david_hum_columns || []).map(params => {
+    const values = column(params.col_idx);
+    const scale = 65 / params.max;
+    const width = new Float64Array(rowCount);
+    for (let i = 0; i < rowCount; i++) {
+      width[i] = values[i] * scale;
+    }
+    return { width: keep(width), value: keep(values) };
+  });
+
+  const rangeCharts = (charts.range_chart || []).map(params => {
+    const longHigh = column(params.long_term_high_idx);
+    const longLow = column(params.long_term_low_idx);
+    const shortHigh = column(params.short_term_high_idx);
+    const shortLow = column(params.short_term_low_idx);
+    const current = column(params.current_idx);
+    // -1 shows low_text, 1 shows high_text, 0 draws the chart
+    const state = new Int8Array(rowCount);
+    for (let i = 0; i < rowCount; i++) {
+      if (params.low_text && current[i] < shortLow[i] && current[i] < longLow[i]) {
+        state[i] = -1;
+      } else if (params.high_text && current[i] > shortHigh[i] && current[i] > longHigh[i]) {
+        state[i] = 1;
+      }
+    }
+    return {
+      long_low: keep(leftPositions(longLow, longLow, longHigh)),
+      long_high: keep(leftPositions(longHigh, longLow, longHigh)),
+      short_low: keep(leftPositions(shortLow, longLow, longHigh)),
+      short_high: keep(leftPositions(shortHigh, longLow, longHigh)),
+      current: keep(leftPositions(current, longLow, longHigh)),
+      state: keep(state)
+    };
+  });
+
+  const fixedScales = (charts.fixed_scale_range_chart || []).map(params => {
+    const { min, max } = params;
+    const values = [params.dot1_idx, params.dot2_idx, params.dot3_idx]
+      .map(idx => column(idx + request.indexOffset));
+    const dots = values.map(dotValues => {
+      const positions = new Float64Array(rowCount);
+      for (let i = 0; i < rowCount; i++) {
+        const value = dotValues[i];
+        positions[i] = value < min ? 0 : value > max ? 100 : ((value - min) / (max - min)) * 100;
+      }
+      return keep(positions);
+    });
+    return { dots, values: values.map(keep) };
+  });
+
+  return {
+    geometry: {
+      data_bar_chart_columns: dataBars,
+      david_hum_columns: davidHums,
+      range_chart: rangeCharts,
+      fixed_scale_range_chart: fixedScales
+    },
+    buffers: Array.from(buffers)
+  };
+}
+
+ctx.onmessage = (event: MessageEvent): void => {
+  const request = event.data as GeometryRequest;
+  const { geometry, buffers } = computeGeometry(request);
+  ctx.postMessage({ id: request.id, geometry }, buffers);
+};
+
+export {};
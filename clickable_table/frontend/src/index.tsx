@@ -1,10 +1,10 @@
 import React from "react"
 import ReactDOM from "react-dom"
-import ClickableTable from "./ClickableTable"
+import ClickableTables from "./ClickableTables"
 
 ReactDOM.render(
   <React.StrictMode>
-    <ClickableTable />
+    <ClickableTables />
   </React.StrictMode>,
   document.getElementById("root")
 )
@@ -0,0 +1,123 @@
+"""
+Tests for the HTML cache and its fingerprints (cache=True)
+"""
+import functools
+
+import numpy as np
+import pandas as pd
+
+from clickable_table._cache import HtmlCache, config_fingerprint, dataframe_fingerprint, function_fingerprint
+
+threshold = 500
+
+
+def style_above_threshold(df):
+    return df.style.map(lambda value: 'color: red' if value > threshold else '')
+
+
+def _frame():
+    return pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': ['x', 'y', 'z']}, index=['r1', 'r2', 'r3'])
+
+
+def _closure(value):
+    def style(df):
+        return value
+    return style
+
+
+def test_dataframe_fingerprint_tracks_content():
+    df = _frame()
+    assert dataframe_fingerprint(df) == dataframe_fingerprint(_frame())
+
+    changed = _frame()
+    changed.iloc[1, 0] = 2.5
+    renamed = _frame().rename(columns={'a': 'c'})
+    reindexed = _frame().set_axis(['r1', 'r2', 'r4'])
+    retyped = _frame().astype({'a': 'float32'})
+    fingerprints = {dataframe_fingerprint(frame) for frame in (df, changed, renamed, reindexed, retyped)}
+    assert len(fingerprints) == 5
+
+
+def test_dataframe_fingerprint_of_unhashable_values():
+    assert dataframe_fingerprint(pd.DataFrame({'a': [[1], [2]]})) is None
+
+
+def test_function_fingerprint_survives_reruns():
+    # Streamlit reruns define the function again: same code, new object
+    namespace = {}
+    source = "def style(df):\n    return df.style\n"
+    exec(source, namespace)
+    first = function_fingerprint(namespace['style'])
+    exec(source, namespace)
+    assert function_fingerprint(namespace['style']) == first
+
+
+def test_function_fingerprint_tracks_globals():
+    global threshold
+    before = function_fingerprint(style_above_threshold)
+    threshold = 0
+    try:
+        assert function_fingerprint(style_above_threshold) != before
+    finally:
+        threshold = 500
+    assert function_fingerprint(style_above_threshold) == before
+
+
+def test_function_fingerprint_hashes_arrays_by_content():
+    big = np.zeros(10000)
+    other = big.copy()
+    other[5000] = 1
+    assert function_fingerprint(_closure(big)) == function_fingerprint(_closure(np.zeros(10000)))
+    assert function_fingerprint(_closure(big)) != function_fingerprint(_closure(other))
+
+    frame = pd.DataFrame({'v': range(1000)})
+    changed = frame.copy()
+    changed.iloc[500, 0] = -1
+    assert function_fingerprint(_closure(frame)) != function_fingerprint(_closure(changed))
+
+
+def test_function_fingerprint_defaults_and_sets():
+    def style(df, limit=1):
+        return limit
+
+    def other(df, limit=2):
+        return limit
+
+    other.__qualname__ = style.__qualname__
+    assert function_fingerprint(style) != function_fingerprint(other)
+    assert function_fingerprint(_closure({1, 'a'})) == function_fingerprint(_closure({'a', 1}))
+
+
+def test_function_fingerprint_without_content_is_none():
+    class Settings:
+        pass
+
+    assert function_fingerprint(None) is None
+    assert function_fingerprint(_closure(Settings())) is None
+    assert function_fingerprint(functools.partial(style_above_threshold)) is None
+
+
+def test_config_fingerprint():
+    assert config_fingerprint({'a': 1, 'b': [1, 2]}) == config_fingerprint({'b': [1, 2], 'a': 1})
+    assert config_fingerprint({'a': 1}) != config_fingerprint({'a': 2})
+
+
+def test_html_cache_evicts_least_recently_used():
+    cache = HtmlCache(max_bytes=10)
+    cache.put('a', '1234')
+    cache.put('b', '1234')
+    assert cache.get('a') == '1234'
+    cache.put('c', '1234')
+    assert cache.get('b') is None
+    assert cache.get('a') == '1234'
+    assert cache.size_bytes == 8
+    assert cache.stats()['hits'] == 2
+
+
+def test_html_cache_skips_entries_larger_than_the_budget():
+    cache = HtmlCache(max_bytes=4)
+    cache.put('a', b'12345')
+    assert len(cache) == 0
+    cache.put('b', b'1234')
+    cache.clear()
+    assert len(cache) == 0 and cache.size_bytes == 0 and cache.misses == 0
@@ -0,0 +1,87 @@
+"""
+Tests for compressed HTML payloads (compression="gzip" / "deflate")
+"""
+import gzip
+import types
+import zlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import clickable_table as package
+from clickable_table import _compression, clickable_table
+from clickable_table._compression import (compress_html, compression_disabled, disable_compression,
+                                          is_decompress_failure, payload_metrics, record_payload)
+
+
+@pytest.fixture
+def streamlit(monkeypatch):
+    streamlit = types.SimpleNamespace(session_state={}, error=pytest.fail, warning=pytest.fail)
+    monkeypatch.setattr(package, 'st', streamlit)
+    monkeypatch.setattr(_compression, 'st', streamlit)
+    monkeypatch.setattr(package, '_bundle_protocol', package._FRONTEND_PROTOCOL)
+    return streamlit
+
+
+def _frame():
+    return pd.DataFrame({'a': np.arange(200), 'b': np.arange(200) * 0.5})
+
+
+def test_compress_html_round_trips():
+    html = '<table><tr><td>ü</td></tr></table>' * 50
+    assert gzip.decompress(compress_html(html, "gzip")).decode('utf-8') == html
+    assert zlib.decompress(compress_html(html, "deflate")).decode('utf-8') == html
+
+
+def test_gzip_output_is_stable():
+    assert compress_html('<table></table>', "gzip") == compress_html('<table></table>', "gzip")
+
+
+def test_record_payload(streamlit):
+    assert payload_metrics('k') is None
+    html = 'x' * 1000
+    metrics = record_payload('k', html, compress_html(html, "gzip"), "gzip")
+    assert payload_metrics('k') == metrics
+    assert metrics['raw_bytes'] == 1000 and metrics['compressed_bytes'] < 100
+    assert metrics['ratio'] == metrics['compressed_bytes'] / 1000
+
+    uncompressed = record_payload(None, html, None, None)
+    assert uncompressed['compressed_bytes'] == 1000 and uncompressed['ratio'] == 1.0
+    assert payload_metrics() == uncompressed
+
+
+def test_decompress_failure_disables_compression(streamlit):
+    failure = {'event': 'resync', 'reason': 'decompress'}
+    assert is_decompress_failure(failure)
+    assert not is_decompress_failure({'event': 'resync', 'reason': 'diff'})
+    assert not is_decompress_failure({'cellValue': '1'})
+
+    assert not compression_disabled('k')
+    streamlit.session_state['k'] = failure
+    assert compression_disabled('k')
+    # Only the first failure switches compression off
+    assert not disable_compression('k')
+    assert disable_compression('other') and compression_disabled('other')
+
+
+def test_clickable_table_sends_compressed_html(monkeypatch, streamlit):
+    sent = []
+    monkeypatch.setattr(package, '_component_func', lambda **args: sent.append(args))
+    clickable_table(_frame(), compression="deflate", key='k')
+    args = sent[0]
+    assert args['html'] is None and args['compression'] == "deflate"
+    html = zlib.decompress(args['html_compressed']).decode('utf-8')
+    assert html.startswith('<table') and payload_metrics('k')['raw_bytes'] == len(html.encode('utf-8'))
+
+    # After a failed inflate in the browser the table is sent uncompressed
+    streamlit.session_state['k'] = {'event': 'resync', 'reason': 'decompress'}
+    clickable_table(_frame(), compression="deflate", key='k')
+    assert sent[1]['html'] == html and sent[1]['html_compressed'] is None
+
+
+def test_unknown_compression_is_reported(monkeypatch, streamlit):
+    errors = []
+    monkeypatch.setattr(streamlit, 'error', errors.append)
+    assert clickable_table(_frame(), compression="brotli") is None
+    assert errors == ["Unknown compression 'brotli'. Expected 'gzip' or 'deflate'."]
@@ -0,0 +1,227 @@
+"""
+Tests for diff updates (diff_updates=True)
+"""
+import re
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import clickable_table as package
+from clickable_table import _diff
+from clickable_table._diff import _align_rows, current_update, prepare_update
+from clickable_table._html import render_cells_html, styler_cells, table_cells
+
+_CELL_RE = re.compile(r'<(t[dh])\b.*?</\1>', re.S)
+
+
+@pytest.fixture
+def session_state(monkeypatch):
+    state = {}
+    monkeypatch.setattr(_diff, 'st', types.SimpleNamespace(session_state=state))
+    return state
+
+
+def _frame(values, index=None):
+    index = index if index is not None else [f'r{i}' for i in range(len(values))]
+    return pd.DataFrame({'v': values, 'w': [f'w{value}' for value in values]}, index=index)
+
+
+def _cells(df):
+    return table_cells(df, table_id='T_test')
+
+
+def _rows(html):
+    body = html[html.index('<tbody>'):]
+    return [line for line in body.split('\n') if line.startswith('<tr>')]
+
+
+def _apply(rows, patch):
+    """Apply a patch to row strings the way the frontend does to the DOM."""
+    rows = list(rows)
+    for position in sorted(patch['removed'], reverse=True):
+        del rows[position]
+    for position, row in patch['added']:
+        rows.insert(position, row)
+    for position, row in patch['rows']:
+        rows[position] = row
+    for position, changes in patch['cells']:
+        cells = [match.group(0) for match in _CELL_RE.finditer(rows[position])]
+        for cell_idx, cell_html in changes:
+            cells[cell_idx] = cell_html
+        rows[position] = '<tr>' + ''.join(cells) + '</tr>'
+    return rows
+
+
+def _assert_patch_matches_full_render(previous, df_cells, patch):
+    assert _apply(_rows(previous), patch) == _rows(render_cells_html(df_cells))
+
+
+def test_align_same_index():
+    removed, added = _align_rows(pd.Index(['a', 'b']), pd.Index(['a', 'b']))
+    assert removed.tolist() == [] and added.tolist() == []
+
+
+def test_align_added_and_removed_rows():
+    removed, added = _align_rows(pd.Index(['a', 'b', 'c']), pd.Index(['a', 'c', 'd']))
+    assert removed.tolist() == [1]
+    assert added.tolist() == [2]
+
+
+def test_align_reordered_or_duplicate_rows():
+    assert _align_rows(pd.Index(['a', 'b']), pd.Index(['b', 'a'])) is None
+    assert _align_rows(pd.Index(['a', 'a']), pd.Index(['a', 'b'])) is None
+
+
+def test_first_render_is_full(session_state):
+    cells = _cells(_frame(np.arange(10)))
+    html, diff = prepare_update('k', cells, 'config')
+    assert diff == {'version': 1}
+    assert html == render_cells_html(cells)
+
+
+def test_changed_cell_is_rendered_alone(session_state):
+    values = np.arange(10)
+    first, _ = prepare_update('k', _cells(_frame(values)), 'config')
+
+    changed = _frame(values)
+    changed.iloc[3, 0] = 99
+    html, diff = prepare_update('k', _cells(changed), 'config')
+    assert html is None
+    assert diff['version'] == 2 and diff['base'] == 1
+    # Cell positions count the index cells
+    assert diff['patch']['cells'] == [[3, [[1, '<td>99</td>']]]]
+    assert diff['patch']['rows'] == [] and diff['patch']['added'] == [] and diff['patch']['removed'] == []
+    assert diff['patch']['style'] is None
+    _assert_patch_matches_full_render(first, _cells(changed), diff['patch'])
+
+
+def test_unchanged_table_sends_an_empty_patch(session_state):
+    df = _frame(np.arange(10))
+    prepare_update('k', _cells(df), 'config')
+    html, diff = prepare_update('k', _cells(df.copy()), 'config')
+    assert html is None
+    assert diff['version'] == diff['base'] == 1
+    assert diff['patch'] == {'removed': [], 'added': [], 'rows': [], 'cells': [], 'style': None}
+
+
+def test_row_with_every_cell_changed_is_sent_whole(session_state):
+    values = np.arange(10)
+    first, _ = prepare_update('k', _cells(_frame(values)), 'config')
+    changed = _frame(values)
+    changed.iloc[4] = [40, 'w40']
+    _, diff = prepare_update('k', _cells(changed), 'config')
+    assert diff['patch']['rows'] == [[4, '<tr><th class="row_heading level0">r4</th><td>40</td><td>w40</td></tr>']]
+    assert diff['patch']['cells'] == []
+    _assert_patch_matches_full_render(first, _cells(changed), diff['patch'])
+
+
+def test_added_and_removed_rows_in_the_middle(session_state):
+    df = _frame(np.arange(10))
+    first, _ = prepare_update('k', _cells(df), 'config')
+    changed = pd.concat([df.drop(index='r2'), _frame([77], index=['new'])])
+    _, diff = prepare_update('k', _cells(changed), 'config')
+    assert diff['patch']['removed'] == [2]
+    assert [position for position, _ in diff['patch']['added']] == [9]
+    # Rows after the removed one are unchanged, so nothing else is sent
+    assert diff['patch']['cells'] == [] and diff['patch']['rows'] == []
+    _assert_patch_matches_full_render(first, _cells(changed), diff['patch'])
+
+
+def test_reordered_rows_force_a_full_render(session_state):
+    df = _frame(np.arange(10))
+    prepare_update('k', _cells(df), 'config')
+    html, diff = prepare_update('k', _cells(df.iloc[::-1]), 'config')
+    assert html is not None and diff == {'version': 2}
+
+
+def test_large_changes_and_new_columns_force_a_full_render(session_state):
+    prepare_update('k', _cells(_frame(np.arange(10))), 'config')
+    html, diff = prepare_update('k', _cells(_frame(np.arange(10) + 1)), 'config')
+    assert html is not None and diff == {'version': 2}
+
+    wider = _frame(np.arange(10) + 1).assign(x=1)
+    html, diff = prepare_update('k', _cells(wider), 'config')
+    assert html is not None and diff == {'version': 3}
+
+    html, diff = prepare_update('k', _cells(wider), 'other config')
+    assert html is not None and diff == {'version': 4}
+
+
+def _style(df):
+    return df.style.map(lambda value: 'color: red' if value > 5 else '', subset=['v'])
+
+
+def test_styles_are_compared_with_the_values(session_state):
+    df = _frame(np.arange(10))
+    first, _ = prepare_update('k', styler_cells(_style(df), 'u'), 'config')
+
+    changed = _frame(np.arange(10))
+    changed.iloc[[2, 8], 0] = [9, 1]
+    _, diff = prepare_update('k', styler_cells(_style(changed), 'u'), 'config')
+    assert diff['patch']['cells'] == [
+        [2, [[1, '<td style="color: red;">9</td>']]],
+        [8, [[1, '<td>1</td>']]],
+    ]
+    _assert_patch_matches_full_render(first, styler_cells(_style(changed), 'u'), diff['patch'])
+
+
+def test_style_sheet_changes_are_patched(session_state):
+    df = _frame(np.arange(10))
+    prepare_update('k', styler_cells(df.style, 'u'), 'config')
+    styler = df.style.set_table_styles([{'selector': 'td', 'props': 'color: blue;'}])
+    _, diff = prepare_update('k', styler_cells(styler, 'u'), 'config')
+    assert diff['patch']['style'] == '<style type="text/css">\n#T_u td { color: blue; }\n</style>'
+    assert diff['patch']['cells'] == []
+
+
+def test_custom_formats_are_compared_by_text(session_state):
+    df = _frame(np.arange(10, dtype=float))
+    prepare_update('k', styler_cells(df.style.format('{:.1f}', subset=['v']), 'u'), 'config')
+    styler = df.style.format(lambda value: '{:.2f}'.format(value) if value == 3 else '{:.1f}'.format(value),
+                             subset=['v'])
+    _, diff = prepare_update('k', styler_cells(styler, 'u'), 'config')
+    assert diff['patch']['cells'] == [[3, [[1, '<td>3.00</td>']]]]
+
+
+def test_content_key_skips_the_comparison(session_state):
+    assert current_update('k', 'content', 'config') is None
+    prepare_update('k', _cells(_frame(np.arange(3))), 'config', content_key='content')
+    assert current_update('k', 'content', 'config') == {
+        'version': 1, 'base': 1, 'patch': {'removed': [], 'added': [], 'rows': [], 'cells': [], 'style': None},
+    }
+    assert current_update('k', 'other', 'config') is None
+    assert current_update('k', 'content', 'other config') is None
+    assert current_update('k', None, 'config') is None
+
+
+def test_state_keeps_digests_not_html(session_state):
+    prepare_update('k', _cells(_frame(np.arange(5))), 'config')
+    state = session_state[f"{_diff._DIFF_STATE_PREFIX}k"]
+    assert state['cells'].dtype == np.uint64 and state['cells'].shape == (5, 2)
+    assert len(state['index']) == 5
+    assert all(isinstance(state[name], bytes) for name in ('frame', 'style'))
+
+
+def test_clickable_table_sends_patches(monkeypatch):
+    state = {}
+    streamlit = types.SimpleNamespace(session_state=state, warning=pytest.fail, error=pytest.fail)
+    monkeypatch.setattr(package, 'st', streamlit)
+    monkeypatch.setattr(_diff, 'st', streamlit)
+    monkeypatch.setattr(package, '_bundle_protocol', package._FRONTEND_PROTOCOL)
+    sent = []
+    monkeypatch.setattr(package, '_component_func', lambda **args: sent.append(args))
+
+    df = _frame(np.arange(20))
+    package.clickable_table(df, styling_function=_style, diff_updates=True, key='k')
+    changed = df.copy()
+    changed.iloc[7, 0] = 0
+    package.clickable_table(changed, styling_function=_style, diff_updates=True, key='k')
+    package.clickable_table(changed.copy(), styling_function=_style, diff_updates=True, key='k')
+
+    assert sent[0]['diff'] == {'version': 1} and sent[0]['html'].startswith('<table id="T_ct_')
+    assert sent[1]['html'] is None
+    assert sent[1]['diff']['patch']['cells'] == [[7, [[1, '<td>0</td>']]]]
+    # Unchanged content is recognized before the styling function runs
+    assert sent[2]['html'] is None and sent[2]['diff']['base'] == 2
@@ -0,0 +1,124 @@
+"""
+Tests for the chart geometry precomputed in Python (precompute_geometry=True)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from clickable_table._geometry import (compute_geometry, data_bar_geometry, david_hum_geometry, fixed_scale_geometry,
+                                       range_chart_geometry)
+from clickable_table._numeric import numeric_column
+
+
+def test_numeric_column_parses_percentages_and_text():
+    df = pd.DataFrame({'a': ['45.0%', ' 12 ', 'Good', '']})
+    values = numeric_column(df, 0)
+    assert values[:2].tolist() == [45.0, 12.0]
+    assert np.isnan(values[2:]).all()
+
+
+def test_numeric_column_out_of_range():
+    df = pd.DataFrame({'a': [1]})
+    assert numeric_column(df, 1) is None
+    assert numeric_column(df, -1) is None
+
+
+def test_data_bar_negative_positive_and_nan():
+    df = pd.DataFrame({'v': [-50.0, 100.0, np.nan, 0.0]})
+    geometry = data_bar_geometry(df, {'col_idx': 1, 'min': -100, 'max': 200}, index_cells=1)
+    # Negative values scale against |min|, positive values against max
+    assert geometry['width'] == [25.0, 25.0, None, 0.0]
+    assert geometry['negative'] == [1, 0, 0, 0]
+    assert 'marker' not in geometry
+
+
+def test_data_bar_recommended_marker():
+    df = pd.DataFrame({'v': [-50.0, 100.0, 10.0], 'rec': [-100.0, 200.0, np.nan]})
+    geometry = data_bar_geometry(df, {'col_idx': 1, 'min': -100, 'max': 200, 'recommended_idx': 2}, index_cells=1)
+    assert geometry['marker'] == [0.0, 100.0, None]
+    assert geometry['value'] == [-50.0, 100.0, 10.0]
+    assert geometry['recommended'] == [-100.0, 200.0, None]
+
+
+def test_david_hum_widths():
+    df = pd.DataFrame({'v': ['50', '100', 'Below Average', '-20']})
+    geometry = david_hum_geometry(df, {'col_idx': 1, 'min': 0, 'max': 100}, index_cells=1)
+    assert geometry['width'] == [32.5, 65.0, None, -13.0]
+
+
+def _range_frame(current):
+    return pd.DataFrame({
+        'long_high': [2.0] * len(current),
+        'long_low': [0.0] * len(current),
+        'short_high': [1.5] * len(current),
+        'short_low': [0.5] * len(current),
+        'current': current,
+    })
+
+
+RANGE_CONFIG = {
+    'col_idx': 6,
+    'long_term_high_idx': 1,
+    'long_term_low_idx': 2,
+    'short_term_high_idx': 3,
+    'short_term_low_idx': 4,
+    'current_idx': 5,
+}
+
+
+def test_range_chart_positions():
+    geometry = range_chart_geometry(_range_frame([1.0]), RANGE_CONFIG, index_cells=1)
+    assert geometry['long_low'] == [0.0]
+    assert geometry['long_high'] == [98.0]
+    assert geometry['short_low'] == [24.5]
+    assert geometry['short_high'] == [73.5]
+    assert geometry['current'] == [49.0]
+    assert geometry['state'] == [0]
+
+
+def test_range_chart_state_needs_the_texts():
+    df = _range_frame([-1.0, 3.0, np.nan])
+    plain = range_chart_geometry(df, RANGE_CONFIG, index_cells=1)
+    assert plain['state'] == [0, 0, 0]
+
+    texts = range_chart_geometry(df, {**RANGE_CONFIG, 'low_text': 'low', 'high_text': 'high'}, index_cells=1)
+    assert texts['state'] == [-1, 1, 0]
+    assert texts['current'][2] is None
+
+
+def test_range_chart_zero_width_range_is_none():
+    df = _range_frame([1.0])
+    df['long_low'] = 2.0
+    geometry = range_chart_geometry(df, RANGE_CONFIG, index_cells=1)
+    assert geometry['current'] == [None]
+
+
+def test_fixed_scale_clamps_and_keeps_nan():
+    df = pd.DataFrame({
+        'd1': [-3.0, 0.0, np.nan],
+        'd2': [1.5, 0.75, 3.0],
+        'd3': [-1.5, '', 1.0],
+    })
+    # Fixed-scale indices are shifted by one for the index column in the frontend
+    config = {'col_idx': 3, 'min': -1.5, 'max': 1.5, 'dot1_idx': 0, 'dot2_idx': 1, 'dot3_idx': 2}
+    geometry = fixed_scale_geometry(df, config, index_cells=1)
+    assert geometry['dots'][0] == [0.0, 50.0, None]
+    assert geometry['dots'][1] == [100.0, 75.0, 100.0]
+    assert geometry['dots'][2][0] == 0.0
+    assert geometry['dots'][2][1] is None
+    assert geometry['dots'][2][2] == pytest.approx(83.333)
+
+
+def test_compute_geometry_counts_index_levels():
+    index = pd.MultiIndex.from_tuples([('a', 1), ('a', 2)])
+    df = pd.DataFrame({'v': [10.0, -10.0]}, index=index)
+    config = {
+        'data_bar_chart_columns': [{'col_idx': 2, 'min': -10, 'max': 10}],
+        'david_hum_columns': [],
+        'range_chart': [],
+        'fixed_scale_range_chart': [],
+    }
+    geometry = compute_geometry(df, config)
+    assert geometry['data_bar_chart_columns'][0]['width'] == [50.0, 50.0]
+    assert geometry['data_bar_chart_columns'][0]['negative'] == [0, 1]
+    assert geometry['david_hum_columns'] == []
@@ -0,0 +1,102 @@
+"""
+Tests for the vectorized HTML writer (html_writer="fast") against Styler.to_html()
+"""
+import html
+import re
+
+import numpy as np
+import pandas as pd
+
+from clickable_table._html import render_styler_html, render_table_html
+
+_ROW_RE = re.compile(r'<tr\b.*?</tr>', re.S)
+_CELL_RE = re.compile(r'<(t[dh])\b([^>]*)>(.*?)</\1>', re.S)
+_COLSPAN_RE = re.compile(r'colspan="(\d+)"')
+_STYLE_RE = re.compile(r'style="([^"]*)"')
+
+
+def _grid(table_html):
+    """(tag, colspan, text) per cell and row, ignoring ids, classes and whitespace."""
+    grid = []
+    for row in _ROW_RE.findall(table_html):
+        cells = []
+        for tag, attributes, text in _CELL_RE.findall(row):
+            colspan = _COLSPAN_RE.search(attributes)
+            text = html.unescape(text).replace('\xa0', '').strip()
+            cells.append((tag, int(colspan.group(1)) if colspan else 1, text))
+        grid.append(cells)
+    return grid
+
+
+def test_simple_frame_matches_styler():
+    df = pd.DataFrame({
+        'a': [1.5, -2.25, np.nan],
+        'b': ['x<y', 'z & w', ''],
+        'c': [1, 2, 3],
+        'd': [True, False, True],
+    }, index=['r1', 'r2', 'r3'])
+    assert _grid(render_table_html(df)) == _grid(df.style.to_html())
+
+
+def test_text_is_escaped():
+    df = pd.DataFrame({'a': ['<b>bold</b>']})
+    assert '&lt;b&gt;bold&lt;/b&gt;' in render_table_html(df)
+
+
+def test_multiindex_columns_match_styler():
+    columns = pd.MultiIndex.from_tuples([('A', 'x'), ('A', 'y'), ('B', 'z'), ('A', 'w')])
+    df = pd.DataFrame(np.arange(8, dtype=float).reshape(2, 4), columns=columns)
+    fast = _grid(render_table_html(df))
+    assert fast == _grid(df.style.to_html())
+    # Only adjacent columns are merged
+    assert [cell[:2] for cell in fast[0]] == [('th', 1), ('th', 2), ('th', 1), ('th', 1)]
+
+
+def test_multiindex_rows_match_unsparsified_styler():
+    index = pd.MultiIndex.from_tuples([('a', 1), ('a', 2), ('b', 1)])
+    df = pd.DataFrame({'v': [1.0, 2.0, 3.0]}, index=index)
+    assert _grid(render_table_html(df)) == _grid(df.style.to_html(sparse_index=False))
+
+
+def test_index_names_get_their_own_header_row_like_styler():
+    df = pd.DataFrame({'v': [1], 'w': [2]}, index=pd.Index(['a'], name='epoch'))
+    assert _grid(render_table_html(df)) == _grid(df.style.to_html())
+    assert _grid(render_table_html(df))[1] == [('th', 1, 'epoch'), ('th', 1, ''), ('th', 1, '')]
+
+    index = pd.MultiIndex.from_tuples([('a', 1), ('b', 2)], names=['k', None])
+    columns = pd.Index(['v'], name='cols')
+    df = pd.DataFrame({'v': [1.0, 2.0]}, index=index).set_axis(columns, axis=1)
+    assert _grid(render_table_html(df)) == _grid(df.style.to_html(sparse_index=False))
+
+
+def test_table_id_classes_and_css():
+    df = pd.DataFrame({'v': [1, 2]})
+    classes = np.array([['hot'], ['']], dtype=object)
+    table = render_table_html(df, classes=classes, css='#T_x .hot { color: red; }', table_id='T_x')
+    assert '<style type="text/css">\n#T_x .hot { color: red; }\n</style>' in table
+    assert '<table id="T_x"' in table
+    assert '<td class="hot">1</td>' in table
+    assert '<td>2</td>' in table
+
+
+def test_styler_cell_styles_are_written_inline():
+    df = pd.DataFrame({'v': [100.0, 600.0], 'w': [700.0, 1.0]})
+    styler = df.style.map(lambda value: 'background-color: pink' if value > 500 else '')
+    fast = render_styler_html(styler, uuid='u')
+    reference = df.style.map(lambda value: 'background-color: pink' if value > 500 else '').to_html()
+    assert _grid(fast) == _grid(reference)
+    styles = [_STYLE_RE.findall(row) for row in _ROW_RE.findall(fast)[1:]]
+    assert styles == [['background-color: pink;'], ['background-color: pink;']]
+
+
+def test_styler_custom_format_is_used():
+    df = pd.DataFrame({'v': [0.1234, 2.5]})
+    styler = df.style.format('{:.1%}')
+    assert _grid(render_styler_html(styler)) == _grid(df.style.format('{:.1%}').to_html())
+
+
+def test_unsupported_styler_features_fall_back():
+    df = pd.DataFrame({'v': [1, 2]})
+    assert render_styler_html(df.style.hide(axis='index')) is None
+    assert render_styler_html(df.style.hide([0])) is None
+    assert render_styler_html(df.style.set_tooltips(pd.DataFrame({'v': ['tip', '']}))) is None
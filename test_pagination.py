@@ -0,0 +1,92 @@
+"""
+Tests for server-side pagination (page_size)
+"""
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import clickable_table as package
+from clickable_table import _pagination, clickable_table
+from clickable_table._pagination import current_page, is_page_event, page_bounds, set_page
+
+
+@pytest.fixture
+def streamlit(monkeypatch):
+    errors = []
+    streamlit = types.SimpleNamespace(session_state={}, error=errors.append, warning=pytest.fail)
+    monkeypatch.setattr(package, 'st', streamlit)
+    monkeypatch.setattr(_pagination, 'st', streamlit)
+    monkeypatch.setattr(package, '_bundle_protocol', package._FRONTEND_PROTOCOL)
+    streamlit.errors = errors
+    return streamlit
+
+
+def _frame(rows=25):
+    return pd.DataFrame({'a': np.arange(rows), 'b': np.arange(rows) * 0.5}, index=[f'r{i}' for i in range(rows)])
+
+
+def test_page_bounds():
+    assert page_bounds(1, 10, 25) == {
+        'page': 1, 'page_size': 10, 'page_count': 3, 'total_rows': 25, 'start': 10, 'end': 20,
+    }
+    last = page_bounds(2, 10, 25)
+    assert (last['start'], last['end']) == (20, 25)
+
+
+def test_page_bounds_clamps_the_page():
+    assert page_bounds(7, 10, 25)['page'] == 2
+    assert page_bounds(-1, 10, 25)['page'] == 0
+    # An empty table still has one (empty) page
+    empty = page_bounds(3, 10, 0)
+    assert (empty['page'], empty['page_count'], empty['start'], empty['end']) == (0, 1, 0, 0)
+
+
+def test_page_requests_are_read_from_the_component_value(streamlit):
+    assert current_page('k') == 0
+    set_page('k', 2)
+    assert current_page('k') == 2
+    streamlit.session_state['k'] = {'event': 'page', 'page': 1}
+    assert current_page('k') == 1
+    # A cell click keeps the current page
+    streamlit.session_state['k'] = {'cellValue': '3', 'rowIndex': 0}
+    assert current_page('k') == 1
+    assert current_page(None) == 0
+
+
+def test_is_page_event():
+    assert is_page_event({'event': 'page', 'page': 1})
+    assert not is_page_event({'cellValue': '1'})
+    assert not is_page_event(None)
+
+
+@pytest.mark.parametrize('page_size', [0, -5, 2.5, True, '10'])
+def test_invalid_page_size_is_reported(streamlit, page_size):
+    assert clickable_table(_frame(), page_size=page_size, key='k') is None
+    assert streamlit.errors == ["page_size must be a positive integer"]
+
+
+def test_only_the_current_page_is_sent(monkeypatch, streamlit):
+    sent = []
+    monkeypatch.setattr(package, '_component_func', lambda **args: sent.append(args))
+    streamlit.session_state['k'] = {'event': 'page', 'page': 2}
+    clickable_table(_frame(), page_size=10, key='k')
+
+    args = sent[0]
+    assert args['page'] == page_bounds(2, 10, 25)
+    body = args['html'][args['html'].index('<tbody>'):]
+    assert [f'>r{i}<' in body for i in range(25)] == [False] * 20 + [True] * 5
+
+
+def test_page_request_without_a_key_reruns(monkeypatch, streamlit):
+    reruns = []
+    monkeypatch.setattr(package, 'rerun', lambda: reruns.append(True))
+    monkeypatch.setattr(package, '_component_func', lambda **args: {'event': 'page', 'page': 1})
+    assert clickable_table(_frame(), page_size=10) is None
+    assert reruns == [True] and current_page(None) == 1
+
+    # Requesting the page already shown does not rerun again
+    monkeypatch.setattr(package, '_component_func', lambda **args: {'event': 'page', 'page': 1})
+    clickable_table(_frame(), page_size=10)
+    assert reruns == [True]
@@ -0,0 +1,78 @@
+"""
+Tests for rendering with a frontend bundle older than the frontend sources
+"""
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import clickable_table as package
+from clickable_table import clickable_table, clickable_tables
+
+
+@pytest.fixture
+def old_bundle(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(package, 'st', types.SimpleNamespace(session_state={}, error=pytest.fail,
+                                                              warning=warnings.append))
+    monkeypatch.setattr(package, '_bundle_protocol', 1)
+    return warnings
+
+
+def _frame():
+    return pd.DataFrame({'a': np.arange(30), 'b': np.arange(30) * 2.0})
+
+
+def test_bundle_without_protocol_file_is_version_1(tmp_path):
+    assert package._read_bundle_protocol(str(tmp_path)) == 1
+    (tmp_path / 'protocol.json').write_text('{"version": 2}')
+    assert package._read_bundle_protocol(str(tmp_path)) == 2
+
+
+def test_newer_options_are_held_back(monkeypatch, old_bundle):
+    sent = []
+    monkeypatch.setattr(package, '_component_func', lambda **args: sent.append(args))
+    charts = [{'col_idx': 1, 'min': 0, 'max': 60, 'renderer': 'canvas', 'tick_axis': 'header'}]
+    clickable_table(_frame(), data_bar_columns=charts, payload="arrow", virtualize_rows=True, page_size=10,
+                    diff_updates=True, compression="gzip", sortable=True, key='k')
+
+    assert len(old_bundle) == 1 and 'payload="arrow"' in old_bundle[0] and 'page_size' in old_bundle[0]
+    args = sent[0]
+    # The whole table is sent as plain HTML, as protocol version 1 bundles expect
+    assert args['html'].count('<td>') == 60
+    assert args['config']['data_bar_chart_columns'] == [{'col_idx': 1, 'min': 0, 'max': 60}]
+    assert not args['config']['virtualize_rows']
+    assert args['diff'] is None and args['html_compressed'] is None and args['page'] is None
+    # The caller's chart configs are left alone
+    assert charts[0]['renderer'] == 'canvas'
+
+
+def test_plain_tables_render_without_a_warning(monkeypatch, old_bundle):
+    sent = []
+    monkeypatch.setattr(package, '_component_func', lambda **args: sent.append(args))
+    clickable_table(_frame(), key='k')
+    assert old_bundle == [] and len(sent) == 1
+
+
+def test_clickable_tables_fall_back_to_one_component_per_table(monkeypatch, old_bundle):
+    clicks = {'::a': None, '::b': None}
+    calls = []
+
+    def component(**args):
+        calls.append(args['key'])
+        return clicks[args['key']]
+
+    monkeypatch.setattr(package, '_component_func', component)
+    tables = [{'name': 'a', 'df': _frame()}, {'name': 'b', 'df': _frame()}]
+
+    assert clickable_tables(tables) is None
+    assert calls == ['::a', '::b'] and 'one component per table' in old_bundle[0]
+
+    clicks['::b'] = {'cellValue': '4', 'rowIndex': 2}
+    assert clickable_tables(tables) == {'cellValue': '4', 'rowIndex': 2, 'table': 'b'}
+    # Components keep returning their last click, which is not a new one
+    assert clickable_tables(tables) is None
+
+    clicks['::a'] = {'cellValue': '1', 'rowIndex': 0}
+    assert clickable_tables(tables)['table'] == 'a'
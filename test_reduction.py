@@ -0,0 +1,100 @@
+"""
+Tests for dropping hidden columns before rendering (drop_hidden_columns)
+"""
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import clickable_table as package
+from clickable_table import clickable_table
+from clickable_table._reduction import kept_columns, reduce_hidden_columns
+
+
+def _frame():
+    return pd.DataFrame({
+        'a': [1.0, 2.0],
+        'high': [5.0, np.nan],
+        'b': ['x', 'y'],
+        'low': [0.5, 0.25],
+        'current': [3.0, 4.0],
+        'chart': ['', ''],
+    }, index=['r0', 'r1'])
+
+
+def _config(**overrides):
+    config = {
+        'data_bar_chart_columns': [],
+        'david_hum_columns': [],
+        'range_chart': [],
+        'fixed_scale_range_chart': [],
+        'hidden_columns': [],
+        'column_width': [],
+    }
+    config.update(overrides)
+    return config
+
+
+def test_kept_columns_uses_row_cell_indices():
+    df = _frame()
+    # Cell 0 is the index, so cells 2 and 4 are the data columns 'high' and 'low'
+    assert kept_columns(df, [0, 2, 4, 99]) == [0, 2, 4, 5]
+    # With two index levels cell 2 is the first data column
+    assert kept_columns(df.set_index('b', append=True), [2]) == [1, 2, 3, 4]
+
+
+def test_nothing_hidden_leaves_the_table_alone():
+    df = _frame()
+    config = _config(hidden_columns=[0])
+    assert reduce_hidden_columns(df, config) == (df, config, None)
+
+
+def test_hidden_chart_inputs_move_to_the_side_channel():
+    df = _frame()
+    config = _config(
+        hidden_columns=[0, 2, 4],
+        column_width=['10px', '20px', '30px', '40px', '50px', '60px', '70px'],
+        range_chart=[{'col_idx': 6, 'long_term_high_idx': 2, 'long_term_low_idx': 4, 'current_idx': 5}],
+        data_bar_chart_columns=[{'col_idx': 1, 'recommended_idx': 4}],
+    )
+    reduced_df, reduced_config, side_columns = reduce_hidden_columns(df, config)
+
+    assert list(reduced_df.columns) == ['a', 'b', 'current', 'chart']
+    # Rendered cells: index, a, b, current, chart; side channel cells follow from cell 5
+    # in the order the charts read them
+    assert reduced_config['data_bar_chart_columns'] == [{'col_idx': 1, 'recommended_idx': 5}]
+    assert reduced_config['range_chart'] == [
+        {'col_idx': 4, 'long_term_high_idx': 6, 'long_term_low_idx': 5, 'current_idx': 3},
+    ]
+    assert side_columns == {'start': 5, 'names': ['low', 'high'], 'values': [[0.5, 0.25], [5.0, None]]}
+    # Only the index stays hidden in the browser
+    assert reduced_config['hidden_columns'] == [0]
+    assert reduced_config['column_width'] == ['10px', '20px', '40px', '60px', '70px']
+    # The caller's config is not modified
+    assert config['range_chart'][0]['col_idx'] == 6
+
+
+def test_fixed_scale_indices_keep_their_offset():
+    df = _frame()
+    config = _config(hidden_columns=[2], fixed_scale_range_chart=[{'col_idx': 5, 'dot1_idx': 1, 'dot2_idx': 3}])
+    _, reduced_config, side_columns = reduce_hidden_columns(df, config)
+    # Fixed-scale indices are one less than the row cell: dot2 (cell 4) is now cell 3,
+    # dot1 (cell 2, hidden) is the first side channel cell
+    assert reduced_config['fixed_scale_range_chart'] == [{'col_idx': 4, 'dot1_idx': 5, 'dot2_idx': 2}]
+    assert side_columns['start'] == 6 and side_columns['names'] == ['high']
+
+
+def test_clickable_table_renders_the_narrower_table(monkeypatch):
+    monkeypatch.setattr(package, 'st', types.SimpleNamespace(session_state={}, error=pytest.fail,
+                                                              warning=pytest.fail))
+    monkeypatch.setattr(package, '_bundle_protocol', package._FRONTEND_PROTOCOL)
+    sent = []
+    monkeypatch.setattr(package, '_component_func', lambda **args: sent.append(args))
+    clickable_table(_frame(), hidden_columns=[2], drop_hidden_columns=True,
+                    data_bar_columns=[{'col_idx': 1, 'recommended_idx': 2}])
+
+    args = sent[0]
+    assert '>high<' not in args['html']
+    assert args['side_columns'] == {'start': 6, 'names': ['high'], 'values': [[5.0, None]]}
+    assert args['config']['data_bar_chart_columns'] == [{'col_idx': 1, 'recommended_idx': 6}]
@@ -0,0 +1,154 @@
+"""
+Tests for declarative style_rules
+"""
+import types
+
+import numpy as np
+import pandas as pd
+
+import clickable_table as package
+from clickable_table import clickable_table
+from clickable_table._rules import evaluate_style_rules, style_sheet, validate_style_rules
+
+
+def _frame():
+    return pd.DataFrame({
+        'a': [1.0, 600.0, np.nan, -700.0],
+        'b': ['Good', 'Bad', 'Good', 'x'],
+        'c': ['10%', '90%', '', '50%'],
+    })
+
+
+def test_threshold_applies_to_numeric_columns_by_default():
+    classes, css = evaluate_style_rules(_frame(), [{'type': 'threshold', 'op': '>', 'value': 500,
+                                                    'style': 'color: red;'}])
+    assert classes[:, 0].tolist() == ['', 'ct-rule0', '', '']
+    # Text columns are skipped without 'columns', even when they parse as numbers
+    assert (classes[:, 1:] == '').all()
+    assert css == [('.ct-rule0', 'color: red;')]
+
+
+def test_in_set_and_columns():
+    classes, _ = evaluate_style_rules(_frame(), [{'type': 'in_set', 'columns': ['b'], 'values': ['Good'],
+                                                  'style': 'color: green;'}])
+    assert classes[:, 1].tolist() == ['ct-rule0', '', 'ct-rule0', '']
+    assert (classes[:, [0, 2]] == '').all()
+
+
+def test_color_scale_buckets_skip_nan():
+    rule = {'type': 'color_scale', 'columns': ['c'], 'min': 0, 'max': 100, 'steps': 3,
+            'colors': ['#000000', '#FFFFFF']}
+    classes, css = evaluate_style_rules(_frame(), [rule])
+    assert classes[:, 2].tolist() == ['ct-rule0-0', 'ct-rule0-2', '', 'ct-rule0-1']
+    assert css == [
+        ('.ct-rule0-0', 'background-color: #000000;'),
+        ('.ct-rule0-1', 'background-color: #808080;'),
+        ('.ct-rule0-2', 'background-color: #FFFFFF;'),
+    ]
+
+
+def test_color_scale_defaults_to_the_data_range():
+    df = pd.DataFrame({'v': [10.0, 20.0, 30.0]})
+    classes, _ = evaluate_style_rules(df, [{'type': 'color_scale', 'steps': 3}])
+    assert classes[:, 0].tolist() == ['ct-rule0-0', 'ct-rule0-1', 'ct-rule0-2']
+
+
+def test_later_rules_come_later_in_the_class_list():
+    rules = [
+        {'type': 'threshold', 'op': '<', 'value': 0, 'style': 'color: blue;'},
+        {'type': 'threshold', 'op': '<', 'value': -500, 'style': 'color: red;'},
+    ]
+    classes, css = evaluate_style_rules(_frame(), rules)
+    assert classes[3, 0] == 'ct-rule0 ct-rule1'
+    assert [selector for selector, _ in css] == ['.ct-rule0', '.ct-rule1']
+
+
+def test_multiindex_top_level_label_selects_all_columns_below():
+    columns = pd.MultiIndex.from_tuples([('A', 'x'), ('A', 'y'), ('B', 'z')])
+    df = pd.DataFrame([[1, 2, 3]], columns=columns)
+    classes, _ = evaluate_style_rules(df, [{'type': 'threshold', 'op': '>=', 'value': 1, 'style': 'color: red;',
+                                            'columns': ['A']}])
+    assert classes[0].tolist() == ['ct-rule0', 'ct-rule0', '']
+
+
+def test_validate_rules():
+    columns = _frame().columns
+    assert validate_style_rules([{'type': 'threshold', 'op': '>', 'value': 1, 'style': ''}], columns) is None
+    assert 'unknown rule type' in validate_style_rules([{'type': 'gradient'}], columns)
+    assert 'unknown op' in validate_style_rules([{'type': 'threshold', 'op': '=>', 'value': 1, 'style': ''}],
+                                                columns)
+    assert "need 'values'" in validate_style_rules([{'type': 'in_set', 'style': ''}], columns)
+    assert 'at least 2 colors' in validate_style_rules([{'type': 'color_scale', 'colors': ['#000000']}], columns)
+    assert validate_style_rules({'type': 'in_set'}, columns) == "style_rules must be a list of rule dicts"
+
+
+def test_validate_rules_checks_column_labels():
+    rule = {'type': 'in_set', 'values': ['Good'], 'style': ''}
+    columns = _frame().columns
+    assert validate_style_rules([{**rule, 'columns': ['b']}], columns) is None
+    assert validate_style_rules([{**rule, 'columns': ['zz']}], columns) == \
+        "style_rules[0]: column 'zz' is not in the rendered table"
+    assert 'must be a list' in validate_style_rules([{**rule, 'columns': 'b'}], columns)
+    # A column dropped from the rendered table is reported as well
+    assert validate_style_rules([{**rule, 'columns': ['b']}], columns.drop('b')) is not None
+
+
+def test_validate_rules_checks_value_types():
+    columns = _frame().columns
+
+    def error(**rule):
+        return validate_style_rules([rule], columns)
+
+    assert "'value' must be a number" in error(type='threshold', op='>', value='5', style='')
+    assert "'value' must be a number" in error(type='threshold', op='>', value=True, style='')
+    assert "'style' must be a string" in error(type='threshold', op='>', value=5, style=None)
+    assert "'values' must be a list" in error(type='in_set', values=5, style='')
+    assert "'values' must be a list" in error(type='in_set', values='Good', style='')
+    assert error(type='in_set', values={'Good'}, style='') is None
+
+
+def test_validate_rules_checks_color_scales():
+    columns = _frame().columns
+
+    def error(**rule):
+        return validate_style_rules([{'type': 'color_scale', **rule}], columns)
+
+    assert 'is not a hex color' in error(colors=['red', 'green'])
+    assert 'is not a hex color' in error(colors=['#FFFFFFFF', '#000000'])
+    assert error(colors=['#FFF', '#000000']) is None
+    assert 'steps must be an integer' in error(steps='abc')
+    assert 'steps must be an integer' in error(steps=2.5)
+    assert 'steps must be an integer' in error(steps=1)
+    assert "'min' must be a number" in error(min='0')
+
+
+def test_color_scale_accepts_short_hex_colors():
+    rule = {'type': 'color_scale', 'columns': ['c'], 'min': 0, 'max': 100, 'steps': 3, 'colors': ['#000', '#FFF']}
+    _, css = evaluate_style_rules(_frame(), [rule])
+    assert css[-1] == ('.ct-rule0-2', 'background-color: #FFFFFF;')
+
+
+def test_color_scale_range_ignores_infinite_values():
+    df = pd.DataFrame({'v': [10.0, 20.0, 30.0, np.inf, -np.inf]})
+    classes, _ = evaluate_style_rules(df, [{'type': 'color_scale', 'steps': 3}])
+    assert classes[:, 0].tolist() == ['ct-rule0-0', 'ct-rule0-1', 'ct-rule0-2', '', '']
+
+
+def test_style_sheet_is_scoped_to_the_table():
+    css = [('.ct-rule0', 'color: red;')]
+    assert style_sheet(css) == '.ct-rule0 { color: red; }'
+    assert style_sheet(css, 'T_x') == '#T_x .ct-rule0 { color: red; }'
+
+
+def test_invalid_rules_are_reported_with_st_error(monkeypatch):
+    messages = []
+    monkeypatch.setattr(package, 'st', types.SimpleNamespace(error=messages.append))
+    rules = [{'type': 'color_scale', 'colors': ['#000000', '#FFFFFF']}, {'type': 'color_scale', 'steps': 'abc'}]
+    assert clickable_table(_frame(), style_rules=rules) is None
+    assert messages == ["style_rules[1]: color_scale steps must be an integer of at least 2, got 'abc'"]
+
+    # Rules name the columns of the rendered table, without dropped hidden columns
+    messages.clear()
+    rules = [{'type': 'in_set', 'columns': ['b'], 'values': ['Good'], 'style': ''}]
+    assert clickable_table(_frame(), style_rules=rules, hidden_columns=[2], drop_hidden_columns=True) is None
+    assert messages == ["style_rules[0]: column 'b' is not in the rendered table"]
@@ -0,0 +1,97 @@
+"""
+Tests for Python-side sorting and filtering (sortable / filterable)
+"""
+import numpy as np
+import pandas as pd
+
+from clickable_table._sorting import PermutationCache, filter_mask, sort_permutation, view_columns, view_positions
+
+
+def _frame():
+    return pd.DataFrame({
+        'n': [3.0, np.nan, 1.0, 2.0],
+        's': ['b', None, 'a', 'c'],
+        'p': ['10%', '55%', 'x', '-5%'],
+    }, index=['w', 'x', 'y', 'z'])
+
+
+def test_sort_numeric_nan_last_in_both_directions():
+    df = _frame()
+    assert sort_permutation(df, 0, True).tolist() == [2, 3, 0, 1]
+    assert sort_permutation(df, 0, False).tolist() == [0, 3, 2, 1]
+
+
+def test_sort_text_missing_last():
+    df = _frame()
+    assert sort_permutation(df, 1, True).tolist() == [2, 0, 3, 1]
+    assert sort_permutation(df, 1, False).tolist() == [3, 0, 2, 1]
+
+
+def test_sort_is_stable():
+    df = pd.DataFrame({'k': [1, 0, 1, 0]})
+    assert sort_permutation(df, 0, True).tolist() == [1, 3, 0, 2]
+    assert sort_permutation(df, 0, False).tolist() == [0, 2, 1, 3]
+
+
+def test_numeric_filters():
+    df = _frame()
+    assert filter_mask(df, {'0': '> 1.5'}).tolist() == [True, False, False, True]
+    assert filter_mask(df, {'0': '<=1'}).tolist() == [False, False, True, False]
+    # A missing value equals nothing, as in the browser's client mode
+    assert filter_mask(df, {'0': '!= 3'}).tolist() == [False, True, True, True]
+    # Percent cells are parsed like the charts; text never matches a comparison
+    assert filter_mask(df, {'2': '>= 10%'}).tolist() == [True, True, False, False]
+    assert filter_mask(df, {'2': '< 0'}).tolist() == [False, False, False, True]
+
+
+def test_substring_filter_is_case_insensitive():
+    df = pd.DataFrame({'s': ['Good', 'bad', 'GOODS', None]})
+    assert filter_mask(df, {'0': 'good'}).tolist() == [True, False, True, False]
+    # Text that is not a comparison is matched literally
+    assert filter_mask(pd.DataFrame({'s': ['a.b', 'ab']}), {'0': '.'}).tolist() == [True, False]
+
+
+def test_filters_combine_and_ignore_unknown_columns():
+    df = _frame()
+    assert filter_mask(df, {'0': '> 1', '1': 'c', '9': 'x'}).tolist() == [False, False, False, True]
+
+
+def test_view_positions_sort_then_filter():
+    df = _frame()
+    cache = PermutationCache()
+    view = {'sort': {'column': 0, 'ascending': False}, 'filters': {'0': '> 1.5'}}
+    assert view_positions(df, view, 'fp', cache).tolist() == [0, 3]
+
+
+def test_view_positions_unchanged_view_is_none():
+    df = _frame()
+    assert view_positions(df, {'sort': None, 'filters': {}}, None, PermutationCache()) is None
+    # Sorting by a column that no longer exists is ignored
+    assert view_positions(df, {'sort': {'column': 7, 'ascending': True}, 'filters': {}}, None,
+                          PermutationCache()) is None
+
+
+def test_permutations_are_cached_per_fingerprint():
+    df = _frame()
+    cache = PermutationCache()
+    view = {'sort': {'column': 0, 'ascending': True}, 'filters': {}}
+    first = view_positions(df, view, 'fp', cache)
+    second = view_positions(df, view, 'fp', cache)
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    view_positions(df, view, 'other', cache)
+    assert cache.misses == 2
+
+
+def test_permutation_cache_is_bounded():
+    cache = PermutationCache(max_entries=2)
+    for key in 'abc':
+        cache.put(key, np.arange(3))
+    assert len(cache) == 2
+    assert cache.get('a') is None
+    assert cache.get('c') is not None
+
+
+def test_view_columns_skip_dropped_columns():
+    df = pd.DataFrame([[1, 2, 3]], columns=pd.MultiIndex.from_tuples([('A', 'x'), ('A', 'y'), ('B', 'z')]))
+    assert view_columns(df, [0, 2]) == [[1, 0, 'A / x'], [2, 2, 'B / z']]
@@ -0,0 +1,76 @@
+"""
+Tests for rendering several tables in one component (clickable_tables)
+"""
+import re
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import clickable_table as package
+from clickable_table import _pagination, clickable_tables
+
+
+@pytest.fixture
+def streamlit(monkeypatch):
+    errors = []
+    streamlit = types.SimpleNamespace(session_state={}, error=errors.append, warning=pytest.fail, errors=errors)
+    monkeypatch.setattr(package, 'st', streamlit)
+    monkeypatch.setattr(_pagination, 'st', streamlit)
+    monkeypatch.setattr(package, '_bundle_protocol', package._FRONTEND_PROTOCOL)
+    return streamlit
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    sent = []
+    monkeypatch.setattr(package, '_component_func', lambda **args: sent.append(args))
+    return sent
+
+
+def _frame(rows=5):
+    return pd.DataFrame({'a': np.arange(rows), 'b': np.arange(rows) * 0.5})
+
+
+def test_unknown_options_are_reported(streamlit, sent):
+    assert clickable_tables([{'df': _frame(), 'colour': 'red'}]) is None
+    assert clickable_tables([{'df': _frame(), 'key': 'k'}]) is None
+    assert streamlit.errors == ["Unknown option(s) for table '0': colour", "Unknown option(s) for table '0': key"]
+    assert sent == []
+
+
+def test_duplicate_names_are_reported(streamlit, sent):
+    assert clickable_tables([{'name': 'x', 'df': _frame()}, {'name': 'x', 'df': _frame()}]) is None
+    assert streamlit.errors == ["Duplicate table name 'x'"] and sent == []
+
+
+def test_tables_are_sent_in_one_component(streamlit, sent):
+    styled = lambda df: df.style.highlight_max()
+    clickable_tables([{'name': 'rates', 'df': _frame(), 'styling_function': styled},
+                      {'df': _frame(3), 'styling_function': styled, 'max_height': '300px'}], key='k')
+    call, = sent
+    assert call['key'] == 'k'
+    assert [table['table'] for table in call['tables']] == ['rates', '1']
+    assert call['tables'][1]['max_height'] == '300px'
+    # Each table gets its own id, so their styles do not clash in the shared document
+    ids = [re.search(r'<table id="(T_\w+)"', table['html']).group(1) for table in call['tables']]
+    assert ids[0] != ids[1]
+    assert all(f'#{table_id}' in table['html'] for table_id, table in zip(ids, call['tables']))
+
+
+def test_click_is_returned_with_its_table(monkeypatch, streamlit):
+    click = {'table': 'b', 'cellValue': '2', 'rowIndex': 2}
+    monkeypatch.setattr(package, '_component_func', lambda **args: click)
+    tables = [{'name': 'a', 'df': _frame()}, {'name': 'b', 'df': _frame()}]
+    assert clickable_tables(tables, key='k') == click
+
+    monkeypatch.setattr(package, '_component_func', lambda **args: {**click, 'table': 'missing'})
+    assert clickable_tables(tables, key='k') is None
+
+
+def test_page_request_is_routed_to_its_table(streamlit, sent):
+    streamlit.session_state['k'] = {'event': 'page', 'page': 1, 'table': 'b'}
+    tables = [{'name': 'a', 'df': _frame(20), 'page_size': 5}, {'name': 'b', 'df': _frame(20), 'page_size': 5}]
+    clickable_tables(tables, key='k')
+    assert [table['page']['page'] for table in sent[0]['tables']] == [0, 1]
@@ -0,0 +1,92 @@
+"""
+Tests for server-side timing hooks (timing_hooks)
+"""
+import json
+import logging
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import clickable_table as package
+from clickable_table import _compression, _timing, clickable_table
+from clickable_table._timing import NULL_TIMER, TimingHooks, payload_size
+
+
+@pytest.fixture
+def streamlit(monkeypatch):
+    errors = []
+    streamlit = types.SimpleNamespace(session_state={}, error=errors.append, warning=pytest.fail)
+    monkeypatch.setattr(package, 'st', streamlit)
+    monkeypatch.setattr(_compression, 'st', streamlit)
+    monkeypatch.setattr(package, '_bundle_protocol', package._FRONTEND_PROTOCOL)
+    monkeypatch.setattr(package, '_component_func', lambda **args: None)
+    return errors
+
+
+@pytest.fixture
+def records(monkeypatch):
+    records = []
+    monkeypatch.setattr(package, 'timing_hooks', TimingHooks(callback=records.append))
+    return records
+
+
+def _frame():
+    return pd.DataFrame({'a': np.arange(10), 'b': np.arange(10) * 0.5})
+
+
+def test_untimed_calls_get_the_null_timer():
+    assert not logging.getLogger("clickable_table").isEnabledFor(logging.DEBUG)
+    assert TimingHooks().start('k') is NULL_TIMER
+    assert NULL_TIMER.finish() is None
+
+
+def test_sample_rate(monkeypatch):
+    hooks = TimingHooks(callback=lambda record: None, sample_rate=0.25)
+    monkeypatch.setattr(_timing.random, 'random', lambda: 0.5)
+    assert hooks.start('k') is NULL_TIMER
+    monkeypatch.setattr(_timing.random, 'random', lambda: 0.1)
+    assert hooks.start('k').enabled
+
+
+def test_stages_add_up_and_are_reported():
+    records = []
+    timer = TimingHooks(callback=records.append).start('k')
+    for _ in range(2):
+        with timer.stage('html'):
+            pass
+    timer.info['rows'] = 3
+    record = timer.finish()
+    assert records == [record]
+    assert record['key'] == 'k' and record['rows'] == 3
+    assert list(record['stages_ms']) == ['html'] and record['total_ms'] >= record['stages_ms']['html'] >= 0
+
+
+def test_failing_callback_does_not_break_the_table():
+    def callback(record):
+        raise RuntimeError("broken")
+
+    assert TimingHooks(callback=callback).start('k').finish()['key'] == 'k'
+
+
+def test_payload_size():
+    assert payload_size('<table>ü</table>', None, None) == len('<table>ü</table>'.encode('utf-8'))
+    assert payload_size(None, b'12345', None) == 5
+    patch = {'removed': [1], 'added': [], 'rows': [], 'cells': [], 'style': None}
+    assert payload_size(None, None, {'version': 2, 'base': 1, 'patch': patch}) == len(json.dumps(patch))
+    assert payload_size('', None, {'version': 1}) == 0
+
+
+def test_clickable_table_reports_its_stages(streamlit, records):
+    clickable_table(_frame(), styling_function=lambda df: df.style, compression="gzip", key='k')
+    record, = records
+    assert record['key'] == 'k'
+    assert {'config', 'html', 'styling_function', 'compression', 'component'} <= set(record['stages_ms'])
+    assert (record['rows'], record['columns'], record['payload'], record['cache_hit']) == (10, 2, "html", False)
+    assert record['payload_bytes'] > 0
+
+
+def test_invalid_calls_are_not_timed(streamlit, records):
+    assert clickable_table(_frame(), payload="json") is None
+    assert streamlit and records == []